@@ -2,6 +2,7 @@ from .utils import *
 from .geometry import *
 from .calc import *
 from .render import *
+from .index import *
 __version__ = '0.2.4'
 __all__ = (
     "ConvexPolyhedron",
@@ -17,16 +18,33 @@ __all__ = (
     "Line",
     "Plane",
     "Point",
+    "PointArray",
     "HalfLine",
+    "HalfEdgeMesh",
     "Vector",
+    "VectorArray",
+    "AABB",
     "angle",
     "distance",
+    "closest_points",
+    "penetration",
     "intersection",
+    "narrow_phase_intersection",
+    "register_intersection",
+    "intersects",
+    "separating_axis",
     "orthogonal",
     "parallel",
     "solve",
+    "solve_batch",
     "volume",
+    "mass_properties",
+    "mass_properties_many",
+    "MassProperties",
     "Renderer",
+    "BVH",
+    "overlapping_pairs",
+    "intersect_all",
     "origin",
     "x_axis",
     "y_axis",
@@ -42,6 +60,7 @@ __all__ = (
     "get_sig_figures",
     "set_sig_figures",
     "get_main_logger",
+    "get_logger",
     "set_log_level",
     "get_projection_length",
     "get_relative_projection_length",
@@ -1,16 +1,29 @@
 from .distance import distance
-from .intersection import intersection
+from .gjk import closest_points,penetration
+from .intersection import intersection,narrow_phase_intersection,register_intersection
+from .intersects import intersects
+from .sat import separating_axis
 from .angle import angle,parallel,orthogonal
 from .volume import volume
+from .mass import mass_properties,mass_properties_many,MassProperties
 from .aux_calc import get_projection_length,get_relative_projection_length,get_segment_from_point_list,get_segment_convexpolyhedron_intersection_point_set,get_segment_convexpolygon_intersection_point_set,points_in_a_line,get_halfline_convexpolyhedron_intersection_point_set
 
 __all__=(
     "distance",
+    "closest_points",
+    "penetration",
     "intersection",
+    "narrow_phase_intersection",
+    "register_intersection",
+    "intersects",
+    "separating_axis",
     "parallel",
     "angle",
     "orthogonal",
     "volume",
+    "mass_properties",
+    "mass_properties_many",
+    "MassProperties",
     "get_projection_length",
     "get_relative_projection_length",
     "get_segment_from_point_list",
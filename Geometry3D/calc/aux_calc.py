@@ -15,12 +15,12 @@ from ..geometry.polyhedron import ConvexPolyhedron
 from ..geometry.halfline import HalfLine
 
 from ..utils.vector import Vector,x_unit_vector,y_unit_vector
-from ..utils.logger import get_main_logger
+from ..utils.logger import get_logger
 from ..utils.constant import SMALL_ANGLE
 
 from ..calc.angle import angle
 
-import copy
+logger = get_logger(__name__)
 
 # import numpy as np
 def get_segment_from_point_list(point_list):
@@ -45,9 +45,9 @@ def get_segment_from_point_list(point_list):
         if not vi.parallel(v0):
             raise ValueError('The points are not on a line')
         relative_length_list.append(get_relative_projection_length(vi,v0))
-    get_main_logger().debug('relative length list:{}'.format(relative_length_list))
-    p_start = copy.deepcopy(p0).move(v0 * min(relative_length_list))
-    p_end = copy.deepcopy(p0).move(v0 * max(relative_length_list))
+    logger.debug('relative length list:%s', relative_length_list)
+    p_start = p0.translated(v0 * min(relative_length_list))
+    p_end = p0.translated(v0 * max(relative_length_list))
     return Segment(p_start,p_end)
 
 def get_projection_length(v1,v2):
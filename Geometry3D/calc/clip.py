@@ -0,0 +1,310 @@
+# -*- coding: utf-8 -*-
+"""
+Clip Module
+
+Clipping against convex bodies given as intersections of half spaces,
+Lines, Segments and HalfLines are clipped by Cyrus-Beck and ConvexPolygons
+by Sutherland-Hodgman.
+"""
+from ..geometry.line import Line
+from ..geometry.point import Point
+from ..geometry.segment import Segment
+from ..geometry.halfline import HalfLine
+from ..geometry.polygon import ConvexPolygon
+from ..utils.constant import get_eps
+from ..utils.aabb import INF
+
+def _dot(u, v):
+    return u[0] * v[0] + u[1] * v[1] + u[2] * v[2]
+
+def _cross(u, v):
+    return (u[1] * v[2] - u[2] * v[1], u[2] * v[0] - u[0] * v[2], u[0] * v[1] - u[1] * v[0])
+
+def _sub(u, v):
+    return (u[0] - v[0], u[1] - v[1], u[2] - v[2])
+
+def linear_parameters(body):
+    """
+    **Input:**
+
+    - body: a Line, HalfLine or Segment
+
+    **Output:**
+
+    (p, d, t_min, t_max) so that body is p + t d for t in [t_min, t_max]
+    """
+    if isinstance(body, HalfLine):
+        return (tuple(body.point), tuple(body.vector), 0.0, INF)
+    elif isinstance(body, Segment):
+        p = tuple(body.start_point)
+        q = tuple(body.end_point)
+        return (p, (q[0] - p[0], q[1] - p[1], q[2] - p[2]), 0.0, 1.0)
+    elif isinstance(body, Line):
+        return (tuple(body.sv), tuple(body.dv), -INF, INF)
+    else:
+        raise TypeError("%s is not a Line, HalfLine or Segment" % (type(body),))
+
+def clip_interval(p, d, t_min, t_max, halfspaces):
+    """
+    **Input:**
+
+    - p, d, t_min, t_max: the linear body p + t d for t in [t_min, t_max]
+
+    - halfspaces: an iterable of (n, offset) with unit normals n, each one is the half space n * x <= offset
+
+    **Output:**
+
+    (t_min, t_max) of the part of the body inside all the half spaces, None if it is empty
+
+    The body is parallel to a half space's plane if the sine of the angle between them is
+    within eps, it is then inside if it is within eps of the half space. An interval
+    shorter than -eps is empty and one between -eps and 0 is a touching point.
+    """
+    eps = get_eps()
+    d_length = (d[0] * d[0] + d[1] * d[1] + d[2] * d[2]) ** 0.5
+    for n, offset in halfspaces:
+        num = offset - (n[0] * p[0] + n[1] * p[1] + n[2] * p[2])
+        den = n[0] * d[0] + n[1] * d[1] + n[2] * d[2]
+        if den > eps * d_length:
+            t = num / den
+            if t < t_max:
+                t_max = t
+        elif den < -eps * d_length:
+            t = num / den
+            if t > t_min:
+                t_min = t
+        elif num < -eps:
+            return None
+    if t_min > t_max:
+        if (t_min - t_max) * d_length > eps:
+            return None
+        t_min = t_max = (t_min + t_max) / 2
+    return (t_min, t_max)
+
+def clip_interval_aabb(p, d, t_min, t_max, min_corner, max_corner):
+    """
+    **Input:**
+
+    - p, d, t_min, t_max: the linear body p + t d for t in [t_min, t_max]
+
+    - min_corner, max_corner: the corners of an axis aligned box
+
+    **Output:**
+
+    (t_min, t_max) of the part of the body in the box grown by eps, None if it misses the box
+
+    This is clip_interval for the six half spaces of the box, done axis by axis by the slab test.
+    """
+    eps = get_eps()
+    for i in range(3):
+        lower = min_corner[i] - eps
+        upper = max_corner[i] + eps
+        if abs(d[i]) < eps:
+            if p[i] < lower or p[i] > upper:
+                return None
+            continue
+        inv = 1.0 / d[i]
+        t0 = (lower - p[i]) * inv
+        t1 = (upper - p[i]) * inv
+        if t0 > t1:
+            t0, t1 = t1, t0
+        if t0 > t_min:
+            t_min = t0
+        if t1 < t_max:
+            t_max = t1
+        if t_min > t_max:
+            return None
+    return (t_min, t_max)
+
+def linear_from_interval(p, d, t_min, t_max):
+    """
+    **Input:**
+
+    - p, d, t_min, t_max: a finite part p + t d for t in [t_min, t_max] of a linear body
+
+    **Output:**
+
+    The Point or Segment between p + t_min d and p + t_max d
+    """
+    start = Point.from_floats(p[0] + t_min * d[0], p[1] + t_min * d[1], p[2] + t_min * d[2])
+    end = Point.from_floats(p[0] + t_max * d[0], p[1] + t_max * d[1], p[2] + t_max * d[2])
+    if start == end:
+        return start
+    return Segment(start, end)
+
+def clip_linear_convexpolyhedron(linear, cph):
+    """
+    **Input:**
+
+    - linear: a Line, HalfLine or Segment
+
+    - cph: a ConvexPolyhedron
+
+    **Output:**
+
+    The part of linear inside cph, a Point, a Segment or None
+
+    This is the Cyrus-Beck algorithm, the parameter interval of linear is clipped
+    with the half space of every face in O(F).
+    """
+    p, d, t_min, t_max = linear_parameters(linear)
+    interval = clip_interval(p, d, t_min, t_max, cph.halfspaces())
+    if interval is None:
+        return None
+    return linear_from_interval(p, d, interval[0], interval[1])
+
+def polygon_halfspaces(cpg):
+    """
+    **Input:**
+
+    - cpg: a ConvexPolygon
+
+    **Output:**
+
+    A list of (n, offset) like ConvexPolyhedron.halfspaces() whose intersection is cpg,
+    the plane of cpg counts as two opposite half spaces and every edge gives one
+    half space orthogonal to the plane.
+    """
+    n = tuple(cpg.plane.n)
+    offset = _dot(n, tuple(cpg.plane.p))
+    halfspaces = [(n, offset), ((-n[0], -n[1], -n[2]), -offset)]
+    points = [tuple(point) for point in cpg.points]
+    eps = get_eps()
+    for i in range(len(points)):
+        # the points are sorted counterclockwise around n, so edge x n points outside
+        m = _cross(_sub(points[(i + 1) % len(points)], points[i]), n)
+        length = _dot(m, m) ** 0.5
+        if length > eps:
+            m = (m[0] / length, m[1] / length, m[2] / length)
+            halfspaces.append((m, _dot(m, points[i])))
+    return halfspaces
+
+def clip_points(points, halfspaces, eps=None):
+    """
+    **Input:**
+
+    - points: the vertices of a convex polygon in order as tuples
+
+    - halfspaces: an iterable of (n, offset) with unit normals n
+
+    - eps: the tolerance, get_eps() by default
+
+    **Output:**
+
+    The vertices of the part of the polygon inside all the half spaces in the same
+    order, a vertex within eps of a half space is kept as it is.
+
+    This is the Sutherland-Hodgman algorithm.
+    """
+    if eps is None:
+        eps = get_eps()
+    for n, offset in halfspaces:
+        if len(points) == 0:
+            break
+        distances = [n[0] * p[0] + n[1] * p[1] + n[2] * p[2] - offset for p in points]
+        if max(distances) <= eps:
+            continue
+        clipped = []
+        for i in range(len(points)):
+            j = (i + 1) % len(points)
+            current, following = points[i], points[j]
+            d_current, d_following = distances[i], distances[j]
+            if d_current <= eps:
+                clipped.append(current)
+            if (d_current <= eps) != (d_following <= eps):
+                # the edge crosses the plane of the half space
+                t = d_current / (d_current - d_following)
+                if 0 < t < 1:
+                    clipped.append((
+                        current[0] + t * (following[0] - current[0]),
+                        current[1] + t * (following[1] - current[1]),
+                        current[2] + t * (following[2] - current[2])
+                    ))
+        points = clipped
+    return points
+
+def convex_from_points(points):
+    """
+    **Input:**
+
+    - points: the vertices of a convex polygon in order as tuples, maybe degenerated
+
+    **Output:**
+
+    None, a Point, a Segment or a ConvexPolygon
+    """
+    eps = get_eps()
+    unique = []
+    for p in points:
+        if len(unique) == 0 or _dot(_sub(p, unique[-1]), _sub(p, unique[-1])) > eps * eps:
+            unique.append(p)
+    while len(unique) > 1 and _dot(_sub(unique[0], unique[-1]), _sub(unique[0], unique[-1])) <= eps * eps:
+        unique.pop()
+    if len(unique) == 0:
+        return None
+    elif len(unique) == 1:
+        return Point.from_floats(*unique[0])
+    # the vertex with the largest triangle around it starts the list, so that the
+    # plane of the ConvexPolygon comes from three vertices far from a line
+    best_area, best_index = 0.0, 0
+    for i in range(len(unique)):
+        a, b, c = unique[i], unique[(i + 1) % len(unique)], unique[(i + 2) % len(unique)]
+        cross = _cross(_sub(b, a), _sub(c, a))
+        area = _dot(cross, cross) ** 0.5
+        if area > best_area:
+            best_area, best_index = area, i
+    if len(unique) == 2 or best_area <= eps * _max_distance(unique):
+        # all the points are on a line, keep the two farthest ones
+        start = max(unique, key=lambda p: _dot(_sub(p, unique[0]), _sub(p, unique[0])))
+        end = max(unique, key=lambda p: _dot(_sub(p, start), _sub(p, start)))
+        return Segment(Point.from_floats(*start), Point.from_floats(*end))
+    unique = unique[best_index:] + unique[:best_index]
+    return ConvexPolygon(tuple(Point.from_floats(*p) for p in unique))
+
+def _max_distance(points):
+    """return the largest distance from the first point to the others"""
+    return max(_dot(_sub(p, points[0]), _sub(p, points[0])) for p in points) ** 0.5
+
+def clip_convexpolygon_halfspaces(cpg, halfspaces):
+    """
+    **Input:**
+
+    - cpg: a ConvexPolygon
+
+    - halfspaces: an iterable of (n, offset) with unit normals n
+
+    **Output:**
+
+    The part of cpg inside all the half spaces, None, a Point, a Segment or a ConvexPolygon
+    """
+    return convex_from_points(clip_points([tuple(point) for point in cpg.points], halfspaces))
+
+def clip_convexpolygon_convexpolygon(a, b):
+    """
+    **Input:**
+
+    - a: a ConvexPolygon
+
+    - b: a ConvexPolygon
+
+    **Output:**
+
+    The intersection of a and b, the vertices of a are clipped with the half spaces of b
+    """
+    return clip_convexpolygon_halfspaces(a, polygon_halfspaces(b))
+
+def clip_convexpolygon_convexpolyhedron(cpg, cph):
+    """
+    **Input:**
+
+    - cpg: a ConvexPolygon
+
+    - cph: a ConvexPolyhedron
+
+    **Output:**
+
+    The intersection of cpg and cph, the vertices of cpg are clipped with the face half spaces of cph
+    """
+    return clip_convexpolygon_halfspaces(cpg, cph.halfspaces())
+
+__all__ = ('clip_linear_convexpolyhedron', 'clip_convexpolygon_convexpolygon', 'clip_convexpolygon_convexpolyhedron')
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""
+Dispatch Module, An Auxilary Module
+
+Calls the function registered for the pair of types of two objects.
+"""
+
+class TypePairDispatcher(object):
+    """
+    **Input:**
+
+    - name: the name of the dispatched operation, used in error messages
+      such as "not implement intersecting A with B"
+
+    A registry of functions keyed on (type(a), type(b)).
+
+    Registering a function for (A, B) also serves (B, A) by swapping the
+    arguments, unless a function is registered for (B, A) explicitly.
+    Subclasses are served by the function of their closest registered base
+    class, and the result of every lookup is cached.
+    """
+    def __init__(self, name):
+        self.name = name
+        self._registry = dict() # dict[(type_a, type_b)] = (function, swapped)
+        self._explicit = set()
+        self._cache = dict()
+
+    def register(self, type_a, type_b, func):
+        """
+        **Input:**
+
+        - type_a: a type
+
+        - type_b: a type
+
+        - func: a function taking an instance of type_a and an instance of type_b
+
+        **Output:**
+
+        No output but func is called for these pairs of types from now on
+        """
+        self._registry[(type_a, type_b)] = (func, False)
+        self._explicit.add((type_a, type_b))
+        if (type_b, type_a) not in self._explicit:
+            self._registry[(type_b, type_a)] = (func, True)
+        self._cache.clear()
+
+    def lookup(self, type_a, type_b):
+        """
+        **Input:**
+
+        - type_a: a type
+
+        - type_b: a type
+
+        **Output:**
+
+        A tuple (func, swapped) or None if nothing is registered for the types.
+        If swapped is True, func has to be called with the arguments swapped.
+        """
+        key = (type_a, type_b)
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+        entry = None
+        for base_a in type_a.__mro__:
+            for base_b in type_b.__mro__:
+                entry = self._registry.get((base_a, base_b))
+                if entry is not None:
+                    break
+            if entry is not None:
+                break
+        self._cache[key] = entry
+        return entry
+
+    def __call__(self, a, b):
+        entry = self.lookup(type(a), type(b))
+        if entry is None:
+            raise NotImplementedError("not implement %s %s with %s" % (self.name, type(a), type(b)))
+        func, swapped = entry
+        if swapped:
+            return func(b, a)
+        return func(a, b)
+
+__all__ = ('TypePairDispatcher',)
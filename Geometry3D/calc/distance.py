@@ -13,6 +13,7 @@ from ..utils.vector import Vector
 from .acute import acute
 from .angle import angle, parallel, orthogonal
 from .intersection import intersection
+from .gjk import gjk_distance, CONVEX_TYPES
 
 def distance(a, b):
     """
@@ -35,6 +36,8 @@ def distance(a, b):
     - Plane/Point
     
     - Plane/Line
+
+    - Point/Segment/ConvexPolygon/ConvexPolyhedron with each other, by GJK
     """
     if isinstance(a, Point) and isinstance(b, Point):
         # The distance between two Points A and B is just the length of
@@ -89,6 +92,11 @@ def distance(a, b):
         return 0.0
     elif isinstance(a, Plane) and isinstance(b, Line):
         return distance(b, a)
+
+    elif isinstance(a, CONVEX_TYPES) and isinstance(b, CONVEX_TYPES):
+        # The distance between convex bodies is the distance of the
+        # origin to their Minkowski difference, found by GJK
+        return gjk_distance(a, b)
     else:
         raise NotImplementedError("Not implemented distance between {} and {}".format(type(a),type(b)))
 
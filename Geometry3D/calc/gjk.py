@@ -0,0 +1,337 @@
+# -*- coding: utf-8 -*-
+"""
+GJK Module
+
+Distance, closest points and penetration depth of convex bodies by the
+Gilbert-Johnson-Keerthi algorithm and the Expanding Polytope Algorithm.
+Both only need the support function of the bodies, that is the vertex
+farthest in a direction. ConvexPolyhedrons answer it by climbing their vertex
+adjacency from the previous answer, the other bodies compare all their vertices.
+"""
+from ..geometry.point import Point
+from ..geometry.segment import Segment
+from ..geometry.polygon import ConvexPolygon
+from ..geometry.polyhedron import ConvexPolyhedron
+from ..utils.vector import Vector
+from ..utils.constant import get_eps
+
+MAX_ITERATIONS = 64
+
+CONVEX_TYPES = (Point, Segment, ConvexPolygon, ConvexPolyhedron)
+
+def _dot(u, v):
+    return u[0] * v[0] + u[1] * v[1] + u[2] * v[2]
+
+def _sub(u, v):
+    return (u[0] - v[0], u[1] - v[1], u[2] - v[2])
+
+def _cross(u, v):
+    return (u[1] * v[2] - u[2] * v[1], u[2] * v[0] - u[0] * v[2], u[0] * v[1] - u[1] * v[0])
+
+def convex_vertices(body):
+    """
+    **Input:**
+
+    - body: a Point, Segment, ConvexPolygon or ConvexPolyhedron
+
+    **Output:**
+
+    The vertices of body as a list of tuples
+    """
+    if isinstance(body, ConvexPolyhedron):
+        return [tuple(point) for point in body.point_set]
+    elif isinstance(body, ConvexPolygon):
+        return [tuple(point) for point in body.points]
+    elif isinstance(body, Segment):
+        return [tuple(body.start_point), tuple(body.end_point)]
+    elif isinstance(body, Point):
+        return [tuple(body)]
+    else:
+        raise TypeError("GJK is not implemented for %s" % (type(body),))
+
+def _support(vertices, d):
+    """return the vertex farthest in direction d"""
+    return max(vertices, key=lambda p: p[0] * d[0] + p[1] * d[1] + p[2] * d[2])
+
+def support_function(body):
+    """
+    **Input:**
+
+    - body: a Point, Segment, ConvexPolygon or ConvexPolyhedron
+
+    **Output:**
+
+    A function which maps a direction to the vertex of body farthest in it as a tuple
+    """
+    if isinstance(body, ConvexPolyhedron):
+        return lambda d: tuple(body.support(d))
+    vertices = convex_vertices(body)
+    return lambda d: _support(vertices, d)
+
+def _center(body):
+    """return a point inside body as a tuple"""
+    if isinstance(body, ConvexPolyhedron):
+        return tuple(body.center_point)
+    vertices = convex_vertices(body)
+    return tuple(sum(p[axis] for p in vertices) / len(vertices) for axis in range(3))
+
+def _minkowski_support(support_a, support_b, d):
+    """return (w, a, b) with w = a - b the point of the Minkowski difference farthest in direction d"""
+    a = support_a(d)
+    b = support_b((-d[0], -d[1], -d[2]))
+    return (_sub(a, b), a, b)
+
+def _affine_closest(ws):
+    """
+    return the barycentric coordinates of the point of the affine hull of ws
+    closest to the origin, None if ws are affinely dependent
+    """
+    w0 = ws[0]
+    edges = [_sub(w, w0) for w in ws[1:]]
+    k = len(edges)
+    if k == 0:
+        return [1.0]
+    # normal equations M x = r for the coordinates of the edges
+    m = [[_dot(edges[i], edges[j]) for j in range(k)] for i in range(k)]
+    r = [-_dot(edges[i], w0) for i in range(k)]
+    if k == 1:
+        if m[0][0] <= 0:
+            return None
+        x = [r[0] / m[0][0]]
+    elif k == 2:
+        det = m[0][0] * m[1][1] - m[0][1] * m[1][0]
+        if det <= 1e-12 * m[0][0] * m[1][1]:
+            return None
+        x = [(r[0] * m[1][1] - m[0][1] * r[1]) / det, (m[0][0] * r[1] - r[0] * m[1][0]) / det]
+    else:
+        c = [_cross(edges[1], edges[2]), _cross(edges[2], edges[0]), _cross(edges[0], edges[1])]
+        det = _dot(edges[0], c[0])
+        if abs(det) <= 1e-12 * (_dot(edges[0], edges[0]) * _dot(edges[1], edges[1]) * _dot(edges[2], edges[2])) ** 0.5:
+            return None
+        # the affine hull is the whole space, solve w0 + sum x_i e_i = 0
+        x = [-_dot(w0, c[i]) / det for i in range(3)]
+    return [1.0 - sum(x)] + x
+
+def _closest_on_simplex(simplex):
+    """
+    return (v, sub_simplex, weights), v is the point of the simplex closest to
+    the origin, the smallest sub simplex containing v and the barycentric weights
+    """
+    best = None
+    count = len(simplex)
+    for mask in range(1, 1 << count):
+        subset = [simplex[i] for i in range(count) if mask & (1 << i)]
+        weights = _affine_closest([s[0] for s in subset])
+        if weights is None or min(weights) < -1e-12:
+            continue
+        v = tuple(sum(weights[i] * subset[i][0][axis] for i in range(len(subset))) for axis in range(3))
+        norm = _dot(v, v)
+        if best is None or norm < best[0] - 1e-30 or (norm <= best[0] and len(subset) < len(best[2])):
+            best = (norm, v, subset, weights)
+    return best[1], best[2], best[3]
+
+def _interpolate(subset, weights, index):
+    """return the barycentric combination of the index-th entries of the subset"""
+    return tuple(sum(weights[i] * subset[i][index][axis] for i in range(len(subset))) for axis in range(3))
+
+def gjk(support_a, support_b, direction=(1.0, 0.0, 0.0)):
+    """
+    **Input:**
+
+    - support_a: the support function of a convex body, see support_function
+
+    - support_b: the support function of a convex body
+
+    - direction=(1.0, 0.0, 0.0): the first search direction, from a point in a to a point in b is a good guess
+
+    **Output:**
+
+    (distance, closest_a, closest_b, simplex), the closest points are tuples and simplex is the final
+    simplex of (w, a, b) entries. The distance is 0 if the bodies intersect.
+    """
+    eps = get_eps()
+    d = direction
+    if _dot(d, d) == 0:
+        d = (1.0, 0.0, 0.0)
+    simplex = [_minkowski_support(support_a, support_b, d)]
+    v, weights = simplex[0][0], [1.0]
+    for _ in range(MAX_ITERATIONS):
+        norm = _dot(v, v)
+        if norm <= eps * eps:
+            break
+        entry = _minkowski_support(support_a, support_b, (-v[0], -v[1], -v[2]))
+        w = entry[0]
+        # no point of the difference is closer to the origin along v
+        if norm - _dot(v, w) <= max(eps * eps, 1e-12 * norm) or any(w == s[0] for s in simplex):
+            break
+        v, simplex, weights = _closest_on_simplex(simplex + [entry])
+        if len(simplex) == 4:
+            # the origin is inside the tetrahedron
+            break
+    closest_a = _interpolate(simplex, weights, 1)
+    closest_b = _interpolate(simplex, weights, 2)
+    distance = _dot(v, v) ** 0.5
+    if distance <= eps:
+        distance = 0.0
+    return distance, closest_a, closest_b, simplex
+
+def _face(vertices, i, j, k, center):
+    """return the face (i, j, k, n, distance) of the polytope with the outer unit normal n"""
+    a, b, c = vertices[i][0], vertices[j][0], vertices[k][0]
+    n = _cross(_sub(b, a), _sub(c, a))
+    length = _dot(n, n) ** 0.5
+    if length == 0:
+        return None
+    n = (n[0] / length, n[1] / length, n[2] / length)
+    if _dot(n, _sub(a, center)) < 0:
+        return (i, k, j, (-n[0], -n[1], -n[2]), -_dot(n, a))
+    return (i, j, k, n, _dot(n, a))
+
+def _search_directions(polytope):
+    """return the directions to look for a point which is affinely independent of the polytope"""
+    axes = [(1.0, 0.0, 0.0), (0.0, 1.0, 0.0), (0.0, 0.0, 1.0)]
+    ws = [s[0] for s in polytope]
+    if len(ws) == 1:
+        directions = axes
+    elif len(ws) == 2:
+        directions = [_cross(_sub(ws[1], ws[0]), axis) for axis in axes]
+    else:
+        directions = [_cross(_sub(ws[1], ws[0]), _sub(ws[2], ws[0]))]
+    return directions + [(-d[0], -d[1], -d[2]) for d in directions]
+
+def _initial_polytope(support_a, support_b, simplex):
+    """
+    extend the final simplex of an intersecting pair to a tetrahedron of the Minkowski difference,
+    fewer points are returned if the Minkowski difference is flat
+    """
+    eps = get_eps()
+    polytope = list(simplex)
+    while len(polytope) < 4:
+        for d in _search_directions(polytope):
+            if _dot(d, d) <= eps * eps:
+                continue
+            entry = _minkowski_support(support_a, support_b, d)
+            if _affine_closest([s[0] for s in polytope] + [entry[0]]) is not None:
+                polytope.append(entry)
+                break
+        else:
+            # the Minkowski difference is flat
+            break
+    return polytope
+
+def _flat_normal(polytope):
+    """return a unit normal of the affine hull of a polytope with less than 4 points"""
+    for d in _search_directions(polytope):
+        length = _dot(d, d) ** 0.5
+        if length > get_eps():
+            return (d[0] / length, d[1] / length, d[2] / length)
+    return (1.0, 0.0, 0.0)
+
+def epa(support_a, support_b, simplex):
+    """
+    **Input:**
+
+    - support_a: the support function of a convex body, see support_function
+
+    - support_b: the support function of a convex body
+
+    - simplex: the final simplex of gjk for the intersecting pair
+
+    **Output:**
+
+    (depth, normal, contact_a, contact_b) with normal a unit tuple, moving b by depth * normal makes
+    the bodies touch. If the Minkowski difference is flat the depth is 0 and normal is orthogonal
+    to it, moving b along normal by any distance separates the bodies.
+    """
+    eps = get_eps()
+    polytope = _initial_polytope(support_a, support_b, simplex)
+    if len(polytope) == 4:
+        center = tuple(sum(s[0][axis] for s in polytope) / 4 for axis in range(3))
+        faces = [_face(polytope, i, j, k, center) for i, j, k in ((0, 1, 2), (0, 1, 3), (0, 2, 3), (1, 2, 3))]
+    if len(polytope) < 4 or any(face is None for face in faces):
+        # the origin is on the flat Minkowski difference, the bodies touch at the gjk closest points
+        _, subset, weights = _closest_on_simplex(simplex)
+        return (0.0, _flat_normal(polytope[:3]), _interpolate(subset, weights, 1), _interpolate(subset, weights, 2))
+    for _ in range(MAX_ITERATIONS):
+        closest = min(faces, key=lambda face: face[4])
+        n, face_distance = closest[3], closest[4]
+        entry = _minkowski_support(support_a, support_b, n)
+        if _dot(n, entry[0]) - face_distance <= eps:
+            break
+        visible = [face for face in faces if _dot(face[3], _sub(entry[0], polytope[face[0]][0])) > eps]
+        edges = set()
+        for i, j, k, _, _ in visible:
+            edges.update(((i, j), (j, k), (k, i)))
+        horizon = [(i, j) for i, j in edges if (j, i) not in edges]
+        polytope.append(entry)
+        new = len(polytope) - 1
+        new_faces = [_face(polytope, i, j, new, center) for i, j in horizon]
+        if any(face is None for face in new_faces):
+            break
+        faces = [face for face in faces if face not in visible] + new_faces
+    # the origin projected on the closest face gives the contact points
+    i, j, k = closest[0], closest[1], closest[2]
+    subset = [polytope[i], polytope[j], polytope[k]]
+    weights = _affine_closest([s[0] for s in subset])
+    if weights is None:
+        weights = [1.0 / 3] * 3
+    return (max(face_distance, 0.0), n, _interpolate(subset, weights, 1), _interpolate(subset, weights, 2))
+
+def _gjk_bodies(a, b):
+    """return gjk of the support functions of a and b, starting from the direction between their centers"""
+    return gjk(support_function(a), support_function(b), _sub(_center(b), _center(a)))
+
+def closest_points(a, b):
+    """
+    **Input:**
+
+    - a: a Point, Segment, ConvexPolygon or ConvexPolyhedron
+
+    - b: a Point, Segment, ConvexPolygon or ConvexPolyhedron
+
+    **Output:**
+
+    A tuple of Points (pa, pb), pa in a and pb in b are the closest points between a and b.
+    If a and b intersect, pa and pb are the same point of the intersection.
+    """
+    _, pa, pb, _ = _gjk_bodies(a, b)
+    return Point.from_floats(*pa), Point.from_floats(*pb)
+
+def gjk_distance(a, b):
+    """
+    **Input:**
+
+    - a: a Point, Segment, ConvexPolygon or ConvexPolyhedron
+
+    - b: a Point, Segment, ConvexPolygon or ConvexPolyhedron
+
+    **Output:**
+
+    The distance between a and b, 0 if they intersect
+    """
+    return _gjk_bodies(a, b)[0]
+
+def penetration(a, b):
+    """
+    **Input:**
+
+    - a: a Point, Segment, ConvexPolygon or ConvexPolyhedron
+
+    - b: a Point, Segment, ConvexPolygon or ConvexPolyhedron
+
+    **Output:**
+
+    None if a and b do not intersect. Otherwise a tuple (depth, direction) with a unit Vector
+    direction, moving b by depth * direction leaves a and b only touching. This is the
+    penetration depth computed by the Expanding Polytope Algorithm. If a - b is flat, for example
+    for two ConvexPolygons in the same plane, the depth is 0 and direction is orthogonal to a - b.
+    """
+    support_a, support_b = support_function(a), support_function(b)
+    distance, pa, _, simplex = gjk(support_a, support_b, _sub(_center(b), _center(a)))
+    if distance > 0:
+        return None
+    depth, n, _, _ = epa(support_a, support_b, simplex)
+    # moving b by t changes the Minkowski difference a - b to a - b - t
+    return (depth, Vector.from_floats(*n))
+
+__all__ = ('closest_points', 'penetration')
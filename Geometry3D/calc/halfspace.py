@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""
+Halfspace Module
+
+Builds the ConvexPolyhedron bounded by a list of Planes by clipping a large
+box with one plane after another.
+"""
+import math
+from ..geometry.point import Point
+from ..geometry.polygon import ConvexPolygon
+from ..geometry.polyhedron import ConvexPolyhedron
+from ..utils.constant import get_eps
+from .clip import clip_points
+
+def _box_faces(center, size):
+    """return the faces of the box around center as (vertices, plane index) with plane index None"""
+    cx, cy, cz = center
+    corners = [(cx + sx * size, cy + sy * size, cz + sz * size) for sx in (-1, 1) for sy in (-1, 1) for sz in (-1, 1)]
+    # corners[4 * ix + 2 * iy + iz]
+    quads = ((0, 1, 3, 2), (4, 6, 7, 5), (0, 4, 5, 1), (2, 3, 7, 6), (0, 2, 6, 4), (1, 5, 7, 3))
+    return [([corners[i] for i in quad], None) for quad in quads]
+
+def _sort_around(points, n):
+    """return the coplanar points sorted by their angle around n"""
+    count = len(points)
+    center = tuple(sum(p[i] for p in points) / count for i in range(3))
+    # any unit vector orthogonal to n
+    if abs(n[0]) < 0.9:
+        u = (0.0, n[2], -n[1])
+    else:
+        u = (-n[2], 0.0, n[0])
+    length = math.sqrt(u[0] * u[0] + u[1] * u[1] + u[2] * u[2])
+    u = (u[0] / length, u[1] / length, u[2] / length)
+    v = (n[1] * u[2] - n[2] * u[1], n[2] * u[0] - n[0] * u[2], n[0] * u[1] - n[1] * u[0])
+    def angle(p):
+        w = (p[0] - center[0], p[1] - center[1], p[2] - center[2])
+        return math.atan2(w[0] * v[0] + w[1] * v[1] + w[2] * v[2], w[0] * u[0] + w[1] * u[1] + w[2] * u[2])
+    return sorted(points, key=angle)
+
+def _unique(points):
+    """return the points without duplicates within eps"""
+    eps = get_eps()
+    unique = []
+    for p in points:
+        for q in unique:
+            if abs(p[0] - q[0]) < eps and abs(p[1] - q[1]) < eps and abs(p[2] - q[2]) < eps:
+                break
+        else:
+            unique.append(p)
+    return unique
+
+def _is_flat(points):
+    """return True if the points are on a line, so they do not make a face"""
+    if len(points) < 3:
+        return True
+    eps = get_eps()
+    p0 = points[0]
+    far = max(points, key=lambda p: (p[0] - p0[0]) ** 2 + (p[1] - p0[1]) ** 2 + (p[2] - p0[2]) ** 2)
+    u = (far[0] - p0[0], far[1] - p0[1], far[2] - p0[2])
+    length = math.sqrt(u[0] * u[0] + u[1] * u[1] + u[2] * u[2])
+    for p in points:
+        w = (p[0] - p0[0], p[1] - p0[1], p[2] - p0[2])
+        c = (u[1] * w[2] - u[2] * w[1], u[2] * w[0] - u[0] * w[2], u[0] * w[1] - u[1] * w[0])
+        # the distance of p to the line is |u x w| / |u|
+        if math.sqrt(c[0] * c[0] + c[1] * c[1] + c[2] * c[2]) > eps * length:
+            return False
+    return True
+
+def _clip_faces(faces, n, offset, index, eps):
+    """
+    clip the convex body given by its faces with the half space n * x <= offset,
+    return None if the half space is redundant
+    """
+    distances = [n[0] * p[0] + n[1] * p[1] + n[2] * p[2] - offset for vertices, _ in faces for p in vertices]
+    if max(distances) <= eps:
+        return None
+    if min(distances) > eps:
+        raise ValueError('The intersection of the half spaces is empty')
+    clipped_faces = []
+    cap = []
+    for vertices, face_index in faces:
+        clipped = clip_points(vertices, ((n, offset),), eps)
+        cap.extend(p for p in clipped if abs(n[0] * p[0] + n[1] * p[1] + n[2] * p[2] - offset) <= eps)
+        if len(clipped) >= 3:
+            clipped_faces.append((clipped, face_index))
+    cap = _unique(cap)
+    if len(cap) >= 3:
+        clipped_faces.append((_sort_around(cap, n), index))
+    return clipped_faces
+
+def _intersect_in_box(halfspaces, center, size):
+    """return the faces of the box clipped with all the half spaces"""
+    faces = _box_faces(center, size)
+    # the rounding errors grow with the coordinates
+    eps = get_eps() * max(1.0, size + max(abs(c) for c in center))
+    for index, (n, offset) in enumerate(halfspaces):
+        clipped_faces = _clip_faces(faces, n, offset, index, eps)
+        if clipped_faces is not None:
+            faces = clipped_faces
+    if any(face_index is None for _, face_index in faces):
+        raise ValueError('The intersection of the half spaces is unbounded')
+    return faces
+
+def halfspace_intersection(planes):
+    """
+    **Input:**
+
+    - planes: an iterable of Planes, the normal of each plane points to the outside, so a point x is inside the half space of the plane when n * (x - p) <= 0
+
+    **Output:**
+
+    - The ConvexPolyhedron bounded by the planes, redundant planes are dropped and the faces share their vertices
+
+    ValueError is raised if the intersection is empty, unbounded or flat.
+    """
+    halfspaces = []
+    for plane in planes:
+        n = tuple(float(c) for c in plane.n)
+        p = plane.p
+        halfspaces.append((n, n[0] * p.x + n[1] * p.y + n[2] * p.z))
+    if len(halfspaces) < 4:
+        raise ValueError('At least 4 planes are needed to bound a ConvexPolyhedron')
+    # first pass in a large box to find out the extent of the intersection
+    scale = 1.0 + max(abs(c) for plane in planes for c in plane.p)
+    faces = _intersect_in_box(halfspaces, (0.0, 0.0, 0.0), 1e6 * scale)
+    # second pass in a tight box for precise vertices
+    vertices = [p for vertices, _ in faces for p in vertices]
+    lower = [min(p[i] for p in vertices) for i in range(3)]
+    upper = [max(p[i] for p in vertices) for i in range(3)]
+    center = tuple((lower[i] + upper[i]) / 2 for i in range(3))
+    size = max(upper[i] - lower[i] for i in range(3)) + 1.0
+    faces = _intersect_in_box(halfspaces, center, size)
+    # the faces share one Point for every vertex
+    shared = [(p, Point.from_floats(*p)) for p in _unique([p for vertices, _ in faces for p in vertices])]
+    eps = get_eps()
+    def shared_point(p):
+        for q, point in shared:
+            if abs(p[0] - q[0]) < eps and abs(p[1] - q[1]) < eps and abs(p[2] - q[2]) < eps:
+                return point
+        raise TypeError("Bug detected! please contact the author")
+    polygons = []
+    for vertices, _ in faces:
+        points = []
+        for p in vertices:
+            point = shared_point(p)
+            if all(point is not q for q in points):
+                points.append(point)
+        if not _is_flat([tuple(point) for point in points]):
+            # the points are in counterclockwise order around the outer normal
+            polygons.append(ConvexPolygon.from_trusted(points))
+    if len(polygons) < 4:
+        raise ValueError('The intersection of the half spaces is flat')
+    return ConvexPolyhedron.from_trusted(polygons)
+
+__all__ = ('halfspace_intersection',)
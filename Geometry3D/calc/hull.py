@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+"""
+Hull Module
+
+The convex hull of a point cloud by Quickhull. Numpy is needed for this module.
+"""
+from ..geometry.point import Point,PointArray
+from ..geometry.polygon import ConvexPolygon
+from ..geometry.polyhedron import ConvexPolyhedron
+from ..utils.constant import get_eps
+from ..utils.util import as_coordinate_array
+
+class _Facet(object):
+    """A triangle of the hull, vertices are counterclockwise seen from outside"""
+    __slots__ = ("vertices", "normal", "offset", "outside", "alive")
+
+    def __init__(self, vertices, normal, offset, outside):
+        self.vertices = vertices
+        self.normal = normal
+        self.offset = offset
+        self.outside = outside # indices of the points above the facet
+        self.alive = True
+
+def _make_facet(coordinates, a, b, c):
+    """return the facet (a, b, c) with its unit normal, None if it is degenerated"""
+    pa, pb, pc = coordinates[a], coordinates[b], coordinates[c]
+    u = (pb[0] - pa[0], pb[1] - pa[1], pb[2] - pa[2])
+    v = (pc[0] - pa[0], pc[1] - pa[1], pc[2] - pa[2])
+    n = (u[1] * v[2] - u[2] * v[1], u[2] * v[0] - u[0] * v[2], u[0] * v[1] - u[1] * v[0])
+    length = (n[0] * n[0] + n[1] * n[1] + n[2] * n[2]) ** 0.5
+    if length == 0:
+        return None
+    n = (n[0] / length, n[1] / length, n[2] / length)
+    return _Facet((a, b, c), n, n[0] * pa[0] + n[1] * pa[1] + n[2] * pa[2], None)
+
+def _dot(u, v):
+    return u[0] * v[0] + u[1] * v[1] + u[2] * v[2]
+
+def _assign_outside(points, candidates, facets, eps):
+    """give every candidate point to the facet it is farthest above, points below all the facets are dropped"""
+    import numpy as np
+    if len(candidates) == 0:
+        for facet in facets:
+            facet.outside = candidates
+        return
+    normals = np.array([facet.normal for facet in facets])
+    offsets = np.array([facet.offset for facet in facets])
+    distances = points[candidates] @ normals.T - offsets
+    best = distances.argmax(axis=1)
+    above = distances[np.arange(len(candidates)), best] > eps
+    candidates, best = candidates[above], best[above]
+    for i, facet in enumerate(facets):
+        facet.outside = candidates[best == i]
+
+def _initial_simplex(points, eps):
+    """return the indices of 4 points spanning a tetrahedron"""
+    import numpy as np
+    extent = points.max(axis=0) - points.min(axis=0)
+    axis = int(extent.argmax())
+    i0, i1 = int(points[:, axis].argmin()), int(points[:, axis].argmax())
+    if extent[axis] <= eps:
+        raise ValueError('Cannot build a convex hull, the points are the same')
+    direction = points[i1] - points[i0]
+    direction = direction / np.sqrt(direction @ direction)
+    relative = points - points[i0]
+    lateral = relative - np.outer(relative @ direction, direction)
+    lateral_distances = np.einsum('ij,ij->i', lateral, lateral)
+    i2 = int(lateral_distances.argmax())
+    if np.sqrt(lateral_distances[i2]) <= eps:
+        raise ValueError('Cannot build a convex hull, the points are on a line')
+    normal = np.cross(points[i1] - points[i0], points[i2] - points[i0])
+    normal = normal / np.sqrt(normal @ normal)
+    plane_distances = relative @ normal
+    i3 = int(np.abs(plane_distances).argmax())
+    if abs(plane_distances[i3]) <= eps:
+        raise ValueError('Cannot build a convex hull, the points are on a plane')
+    if plane_distances[i3] > 0:
+        # keep (i0, i1, i2) counterclockwise seen from outside, that is from below
+        i1, i2 = i2, i1
+    return i0, i1, i2, i3
+
+def quickhull(points):
+    """
+    **Input:**
+
+    - points: an (N,3) numpy array
+
+    **Output:**
+
+    - A list of the hull triangles as (a, b, c, normal) with the point indices a, b, c counterclockwise seen from outside and the outer unit normal as a tuple
+
+    ValueError is raised if the points do not span a solid.
+    """
+    import numpy as np
+    eps = get_eps() * max(1.0, float(np.abs(points).max()))
+    i0, i1, i2, i3 = _initial_simplex(points, eps)
+    coordinates = points.tolist()
+    facets = [_make_facet(coordinates, *vertices) for vertices in ((i0, i1, i2), (i0, i3, i1), (i1, i3, i2), (i2, i3, i0))]
+    edges = dict() # edges[(a, b)] = the facet with the directed edge a -> b
+    for facet in facets:
+        a, b, c = facet.vertices
+        edges[(a, b)] = edges[(b, c)] = edges[(c, a)] = facet
+    _assign_outside(points, np.arange(len(points)), facets, eps)
+    stack = [facet for facet in facets if len(facet.outside)]
+    while stack:
+        facet = stack.pop()
+        if not facet.alive or len(facet.outside) == 0:
+            continue
+        outside = facet.outside
+        eye = int(outside[(points[outside] @ np.array(facet.normal)).argmax()])
+        eye_point = coordinates[eye]
+        # the facets seen from the eye point, found by walking over the edges
+        visible = [facet]
+        facet.alive = False
+        horizon = []
+        i = 0
+        while i < len(visible):
+            a, b, c = visible[i].vertices
+            for edge in ((a, b), (b, c), (c, a)):
+                neighbour = edges[(edge[1], edge[0])]
+                if not neighbour.alive:
+                    continue
+                if _dot(neighbour.normal, eye_point) - neighbour.offset > eps:
+                    neighbour.alive = False
+                    visible.append(neighbour)
+                else:
+                    horizon.append(edge)
+            i += 1
+        for old in visible:
+            a, b, c = old.vertices
+            for edge in ((a, b), (b, c), (c, a)):
+                if edges.get(edge) is old:
+                    del edges[edge]
+        new_facets = []
+        for a, b in horizon:
+            new_facet = _make_facet(coordinates, a, b, eye)
+            if new_facet is None:
+                raise ValueError('Cannot build a convex hull, numerical problem at point %d' % eye)
+            new_facets.append(new_facet)
+            edges[(a, b)] = edges[(b, eye)] = edges[(eye, a)] = new_facet
+        candidates = np.concatenate([old.outside for old in visible])
+        candidates = candidates[candidates != eye]
+        _assign_outside(points, candidates, new_facets, eps)
+        stack.extend(new_facet for new_facet in new_facets if len(new_facet.outside))
+    hull = []
+    for facet in dict.fromkeys(edges.values()):
+        a, b, c = facet.vertices
+        hull.append((a, b, c, facet.normal))
+    return hull
+
+def _merge_coplanar(points, triangles, eps):
+    """return the faces of the hull as lists of point indices, coplanar triangles are merged"""
+    coordinates = points.tolist()
+    parent = list(range(len(triangles)))
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+    owner = dict()
+    for i, (a, b, c, _) in enumerate(triangles):
+        owner[(a, b)] = owner[(b, c)] = owner[(c, a)] = i
+    for (a, b), i in owner.items():
+        j = owner[(b, a)]
+        if find(i) == find(j):
+            continue
+        normal_i, normal_j = triangles[i][3], triangles[j][3]
+        # j is coplanar with i if the far vertex of j is on the plane of i
+        far = [v for v in triangles[j][:3] if v != a and v != b][0]
+        if _dot(normal_i, normal_j) > 0 and abs(_dot(normal_i, coordinates[far]) - _dot(normal_i, coordinates[a])) <= eps:
+            parent[find(i)] = find(j)
+    groups = dict()
+    for i in range(len(triangles)):
+        groups.setdefault(find(i), []).append(i)
+    faces = []
+    for group in groups.values():
+        vertices = sorted(set(v for i in group for v in triangles[i][:3]))
+        normal = [sum(triangles[i][3][k] for i in group) for k in range(3)]
+        faces.append(_convex_polygon_indices(coordinates, vertices, normal, eps))
+    return faces
+
+def _convex_polygon_indices(coordinates, vertices, normal, eps):
+    """return the corners of the planar convex hull of the vertices, points on the edges are dropped"""
+    length = _dot(normal, normal) ** 0.5
+    n = (normal[0] / length, normal[1] / length, normal[2] / length)
+    # u and v span the plane of the face
+    if abs(n[0]) < 0.9:
+        u = (0.0, n[2], -n[1])
+    else:
+        u = (-n[2], 0.0, n[0])
+    length = _dot(u, u) ** 0.5
+    u = (u[0] / length, u[1] / length, u[2] / length)
+    v = (n[1] * u[2] - n[2] * u[1], n[2] * u[0] - n[0] * u[2], n[0] * u[1] - n[1] * u[0])
+    projected = sorted((_dot(coordinates[i], u), _dot(coordinates[i], v), i) for i in vertices)
+    def cross(o, a, b):
+        return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+    def half(sequence):
+        chain = []
+        for p in sequence:
+            while len(chain) >= 2 and cross(chain[-2], chain[-1], p) <= eps * max(abs(chain[-1][0] - chain[-2][0]) + abs(chain[-1][1] - chain[-2][1]), 1.0):
+                chain.pop()
+            chain.append(p)
+        return chain
+    lower = half(projected)
+    upper = half(reversed(projected))
+    return [p[2] for p in lower[:-1] + upper[:-1]]
+
+def convex_hull(points):
+    """
+    **Input:**
+
+    - points: a PointArray, an (N,3) array-like of coordinates or an iterable of Points
+
+    **Output:**
+
+    - The ConvexPolyhedron which is the convex hull of the points, coplanar triangles of the hull are merged into ConvexPolygons. Points within eps of the hull may be dropped.
+
+    ValueError is raised if the points do not span a solid.
+    """
+    if isinstance(points, PointArray):
+        points = points.array
+    points = as_coordinate_array(points)
+    if len(points) < 4:
+        raise ValueError('Cannot build a convex hull with less than 4 points')
+    import numpy as np
+    eps = get_eps() * max(1.0, float(np.abs(points).max()))
+    faces = _merge_coplanar(points, quickhull(points), eps)
+    shared = dict()
+    polygons = []
+    for face in faces:
+        for i in face:
+            if i not in shared:
+                shared[i] = Point.from_floats(*points[i].tolist())
+        # the corners are in counterclockwise order around the outer normal
+        polygons.append(ConvexPolygon.from_trusted(tuple(shared[i] for i in face)))
+    return ConvexPolyhedron.from_trusted(polygons)
+
+__all__ = ('convex_hull',)
@@ -9,14 +9,22 @@ from ..geometry.polygon import ConvexPolygon
 from ..geometry.pyramid import Pyramid
 from ..geometry.polyhedron import ConvexPolyhedron
 from ..geometry.halfline import HalfLine
+from ..geometry.body import GeoBody
 
-from ..utils.solver import solve, null
+from ..utils.solver import solve, null, solve_line_line
 from ..utils.vector import Vector
-from ..utils.logger import get_main_logger
+from ..utils.logger import get_logger
 
 from .acute import acute
+from .dispatch import TypePairDispatcher
+from .sat import separating_axis
+from .clip import clip_linear_convexpolyhedron,clip_convexpolygon_convexpolygon,clip_convexpolygon_convexpolyhedron
 from .angle import angle, parallel, orthogonal
-from .aux_calc import get_segment_from_point_list,get_segment_convexpolyhedron_intersection_point_set,get_segment_convexpolygon_intersection_point_set,points_in_a_line,get_halfline_convexpolyhedron_intersection_point_set
+from .aux_calc import get_segment_from_point_list,get_segment_convexpolyhedron_intersection_point_set,get_halfline_convexpolyhedron_intersection_point_set
+
+logger = get_logger(__name__)
+
+_BOXED_TYPES = (GeoBody, Point) # the types which have an aabb method
 
 def intersection(a, b):
     """
@@ -33,118 +41,53 @@ def intersection(a, b):
     Maybe None or GeoBody
     """
     # This is a wrapper function
-    get_main_logger().debug('Calling intersection with {} and {}'.format(a,b))
-    # There are totally 6 * 6 = 36 situations
+    logger.debug('Calling intersection with %s and %s', a, b)
     if a is None or b is None:
-        get_main_logger().warning('Intersecting something with None, which is always None')
+        logger.warning('Intersecting something with None, which is always None')
         return None
-    # Point
-    elif isinstance(a,Point) and isinstance(b,Point):
-        return inter_point_point(a,b)
-    elif isinstance(a,Point) and isinstance(b,Line):
-        return inter_point_line(a,b)
-    elif isinstance(a,Line) and isinstance(b,Point):
-        return inter_point_line(b,a)
-    elif isinstance(a,Point) and isinstance(b,Plane):
-        return inter_point_plane(a,b)
-    elif isinstance(a,Plane) and isinstance(b,Point):
-        return inter_point_plane(b,a)
-    elif isinstance(a,Point) and isinstance(b,Segment):
-        return inter_point_segment(a,b)
-    elif isinstance(a,Segment) and isinstance(b,Point):
-        return inter_point_segment(b,a)
-    elif isinstance(a,Point) and isinstance(b,ConvexPolygon):
-        return inter_point_convexpolygon(a,b)
-    elif isinstance(a,ConvexPolygon) and isinstance(b,Point):
-        return inter_point_convexpolygon(b,a)
-    elif isinstance(a,Point) and isinstance(b,ConvexPolyhedron):
-        return inter_point_convexpolyhedron(a,b)
-    elif isinstance(a,ConvexPolyhedron) and isinstance(b,Point):
-        return inter_point_convexpolyhedron(b,a)
-    elif isinstance(a,Point) and isinstance(b,HalfLine):
-        return inter_point_halfline(a,b)
-    elif isinstance(a,HalfLine) and isinstance(b,Point):
-        return inter_point_halfline(b,a)
-    # Line
-    elif isinstance(a, Line) and isinstance(b, Line):
-        return inter_line_line(a,b)
-    elif isinstance(a, Line) and isinstance(b, Plane):
-        return inter_line_plane(a,b)
-    elif isinstance(a, Plane) and isinstance(b, Line):
-        return inter_line_plane(b,a)
-    elif isinstance(a, Line) and isinstance(b, Segment):
-        return inter_line_segment(a,b)
-    elif isinstance(a, Segment) and isinstance(b, Line):
-        return inter_line_segment(b,a)
-    elif isinstance(a, Line) and isinstance(b,ConvexPolygon):
-        return inter_line_convexpolygon(a,b)
-    elif isinstance(a, ConvexPolygon) and isinstance(b, Line):
-        return inter_line_convexpolygon(b,a)
-    elif isinstance(a, Line) and isinstance(b, ConvexPolyhedron):
-        return inter_line_convexpolyhedron(a,b)
-    elif isinstance(a, ConvexPolyhedron) and isinstance(b, Line):
-        return inter_line_convexpolyhedron(b,a)
-    elif isinstance(a, Line) and isinstance(b, HalfLine):
-        return inter_line_halfline(a,b)
-    elif isinstance(a, HalfLine) and isinstance(b, Line):
-        return inter_line_halfline(b,a)
-    # plane
-    elif isinstance(a, Plane) and isinstance(b, Plane):
-        return inter_plane_plane(a,b)
-    elif isinstance(a, Plane) and isinstance(b,Segment):
-        return inter_plane_segment(a,b)
-    elif isinstance(a,Segment) and isinstance(b,Plane):
-        return inter_plane_segment(b,a)
-    elif isinstance(a, Plane) and isinstance(b, ConvexPolygon):
-        return inter_plane_convexpolygon(a,b)
-    elif isinstance(a, ConvexPolygon) and isinstance(a, Plane):
-        return inter_plane_convexpolygon(b,a)
-    elif isinstance(a, Plane) and isinstance(b, ConvexPolyhedron):
-        return inter_plane_convexpolyhedron(a,b)
-    elif isinstance(a,ConvexPolyhedron) and isinstance(b, Plane):
-        return inter_plane_convexpolyhedron(b,a)
-    elif isinstance(a, Plane) and isinstance(b, HalfLine):
-        return inter_plane_halfline(a,b)
-    elif isinstance(a, HalfLine) and isinstance(b, Plane):
-        return inter_plane_halfline(b,a)
-    # segment
-    elif isinstance(a,Segment) and isinstance(b,Segment):
-        return inter_segment_segment(a,b)
-    elif isinstance(a,Segment) and isinstance(b,ConvexPolygon):
-        return inter_segment_convexpolygon(a,b)
-    elif isinstance(a,ConvexPolygon) and isinstance(b,Segment):
-        return inter_segment_convexpolygon(b,a)
-    elif isinstance(a,Segment) and isinstance(b, ConvexPolyhedron):
-        return inter_segment_convexpolyhedron(a,b)
-    elif isinstance(a, ConvexPolyhedron) and isinstance(b,Segment):
-        return inter_segment_convexpolyhedron(b,a)
-    elif isinstance(a, Segment) and isinstance(b, HalfLine):
-        return inter_segment_halfline(a,b)
-    elif isinstance(a, HalfLine) and isinstance(b, Segment):
-        return inter_segment_halfline(b,a)
-    # convex polygon
-    elif isinstance(a, ConvexPolygon) and isinstance(b,ConvexPolygon):
-        return inter_convexpolygon_convexpolygon(a,b)
-    elif isinstance(a,ConvexPolyhedron) and isinstance(b,ConvexPolygon):
-        return inter_convexpolygon_convexPolyhedron(a,b)
-    elif isinstance(a,ConvexPolygon) and isinstance(b,ConvexPolyhedron):
-        return inter_convexpolygon_convexPolyhedron(b,a)
-    elif isinstance(a, ConvexPolygon) and isinstance(b, HalfLine):
-        return inter_convexpolygon_halfline(a,b)
-    elif isinstance(a, HalfLine) and isinstance(b, ConvexPolygon):
-        return inter_convexpolygon_halfline(b,a)
-    # convex polyhedron
-    elif isinstance(a,ConvexPolyhedron) and isinstance(b,ConvexPolyhedron):
-        return inter_convexpolyhedron_convexpolyhedron(a,b)
-    elif isinstance(a, ConvexPolyhedron) and isinstance(b, HalfLine):
-        return inter_convexpolyhedron_halfline(a,b)
-    elif isinstance(a, HalfLine) and isinstance(b, ConvexPolyhedron):
-        return inter_convexpolyhedron_halfline(b,a)
-    # halfline
-    elif isinstance(a, HalfLine) and isinstance(b, HalfLine):
-        return inter_halfline_halfline(a,b)
-    else:
-        raise NotImplementedError("not implement intersecting %s with %s"%(type(a),type(b)))
+    # Bodies whose bounding boxes are disjoint cannot intersect
+    if isinstance(a, _BOXED_TYPES) and isinstance(b, _BOXED_TYPES) and not a.aabb().overlaps(b.aabb()):
+        return None
+    return narrow_phase_intersection(a, b)
+
+def narrow_phase_intersection(a, b):
+    """
+    **Input:**
+
+    - a: GeoBody
+
+    - b: GeoBody
+
+    **Output:**
+
+    The Intersection, maybe None or GeoBody.
+
+    This is intersection() without the bounding box check, for callers such as
+    a broad phase which already know that the bounding boxes of a and b overlap.
+    """
+    # the face normals reject most of the disjoint pairs of ConvexPolyhedrons before their faces are clipped
+    if isinstance(a, ConvexPolyhedron) and isinstance(b, ConvexPolyhedron) and separating_axis(a, b, edges=False) is not None:
+        return None
+    return _intersection_dispatcher(a, b)
+
+def register_intersection(type_a, type_b, func):
+    """
+    **Input:**
+
+    - type_a: a type
+
+    - type_b: a type
+
+    - func: a function func(a, b) returning the intersection of an instance
+      of type_a and an instance of type_b
+
+    **Output:**
+
+    No output but intersection() dispatches the pair to func from now on,
+    in both orders. Subclasses of type_a and type_b are dispatched to func
+    as well unless they are registered themselves.
+    """
+    _intersection_dispatcher.register(type_a, type_b, func)
 
 def inter_point_point(p1,p2):
     """intersection function for Point and Point
@@ -260,22 +203,15 @@ def inter_line_line(l1,l2):
         # s1 + λ u1 = t1 + μ v1
         # s2 + λ u2 = t2 + μ v2
         # s3 + λ u3 = t3 + μ v3
-        # rearrange a bit, and you get
-        solution = solve([
-            [l1.dv[0], -l2.dv[0], l2.sv[0] - l1.sv[0]],
-            [l1.dv[1], -l2.dv[1], l2.sv[1] - l1.sv[1]],
-            [l1.dv[2], -l2.dv[2], l2.sv[2] - l1.sv[2]],
-        ])
-        # No intersection
-        if not solution:
+        # which is done in closed form from the closest points of the lines
+        lmb = solve_line_line(l1.sv, l1.dv, l2.sv, l2.dv)
+        # No intersection, the lines are parallel or skew
+        if lmb is None:
             return None
-        # We get λ and μ, we need to pick one and plug it into the
-        # right equation
-        lmb, _ = solution()
         lmb = float(lmb)
         # could've chosen b.sv + mu * b.dv instead, it doesn't matter
         # as they will point (pun intended) to the same point.
-        return Point(l1.sv + lmb * l1.dv)
+        return Point.from_floats(*(l1.sv + lmb * l1.dv))
 
 def inter_line_plane(l,p):
     """intersection function for Line and Plane 
@@ -302,7 +238,7 @@ def inter_line_plane(l,p):
     # rearrange and solve for the parameter:
     mu = (p.n * p.p.pv() - p.n * l.sv) / (p.n * l.dv)
     mu = float(mu)
-    return Point(l.sv + mu * l.dv)
+    return Point.from_floats(*(l.sv + mu * l.dv))
 
 def inter_line_segment(l,s):
     """intersection function for Line and Segment 
@@ -356,7 +292,7 @@ def inter_line_convexpolygon(l,cpg):
             point_list = list(point_set)
             return Segment(point_list[0],point_list[1])
         else:
-            get_main_logger().error("len: %d" %(len(point_set,)))
+            logger.error("len: %d", len(point_set))
             raise TypeError("Bug detected! please contact the author")
     elif isinstance(inter,Point):
         return intersection(inter,cpg)
@@ -364,10 +300,23 @@ def inter_line_convexpolygon(l,cpg):
         raise TypeError("Bug detected! please contact the author")
 
 def inter_line_convexpolyhedron(l,cph):
-    """intersection function for Line and ConvexPolygon 
+    """intersection function for Line and ConvexPolyhedron
     input:
     l: Line
-    cpg: ConvexPolygon
+    cph: ConvexPolyhedron
+
+    output:
+    intersection
+
+    The line is clipped with the half spaces of the faces
+    """
+    return clip_linear_convexpolyhedron(l,cph)
+
+def inter_line_convexpolyhedron_old(l,cph):
+    """intersection function for Line and ConvexPolyhedron by intersecting every face, slower than inter_line_convexpolyhedron
+    input:
+    l: Line
+    cph: ConvexPolyhedron
 
     output:
     intersection
@@ -598,6 +547,18 @@ def inter_segment_convexpolyhedron(a,b):
 
     Output:
     The intersection
+
+    The segment is clipped with the half spaces of the faces
+    '''
+    return clip_linear_convexpolyhedron(a,b)
+
+def inter_segment_convexpolyhedron_old(a,b):
+    '''Input:
+    a: Segment
+    b: ConvexPolyhedron
+
+    Output:
+    The intersection by intersecting every face, slower than inter_segment_convexpolyhedron
     '''
     if (a.start_point in b) and (a.end_point in b):
         return a
@@ -618,7 +579,7 @@ def inter_segment_convexpolyhedron(a,b):
     elif len(inter_point_list) == 2:
         return Segment(inter_point_list[0],inter_point_list[1])
     else:
-        get_main_logger().error('length of inter_point_list is {}, list is {}'.format(len(inter_point_list),inter_point_list))
+        logger.error('length of inter_point_list is %d, list is %s', len(inter_point_list), inter_point_list)
         raise TypeError("Bug detected! please contact the author")
 
 def inter_segment_halfline(a,b):
@@ -660,46 +621,15 @@ def inter_segment_halfline(a,b):
 
 def inter_convexpolygon_convexpolygon(a,b):
     '''Input:
-    a: ConvexPolyhedron
-    b: ConvexPolyhedron
+    a: ConvexPolygon
+    b: ConvexPolygon
 
     Output:
     The intersection
-    '''
-    inter_p_p = intersection(a.plane,b.plane)
-    if inter_p_p is None:
-        return None
-    elif isinstance(inter_p_p,Line):
-        inter_p_cph1 = intersection(inter_p_p,a)
-        inter_p_cph2 = intersection(inter_p_p,b)
-        if inter_p_cph1 is None or inter_p_cph2 is None:
-            return None
-        else:
-            return intersection(inter_p_cph1,inter_p_cph2)
-    else:
-        if not a.plane == b.plane:
-            raise TypeError("Bug detected! please contact the author")
-        point_set = set()
-        for pa in a.points:
-            if pa in b:
-                point_set.add(pa)
-        for pb in b.points:
-            if pb in a:
-                point_set.add(pb)
-        for seg in a.segments():
-            point_set = point_set.union(get_segment_convexpolygon_intersection_point_set(seg,b))
-        point_tuple = tuple(point_set)
-        if len(point_tuple) == 0:
-            return None
-        elif len(point_tuple) == 1:
-            return point_tuple[0]
-        elif len(point_tuple) == 2:
-            return Segment(point_tuple[0],point_tuple[1])
-        else:
-            if points_in_a_line(point_tuple):
-                raise TypeError("Bug detected! please contact the author")
-            return ConvexPolygon(point_tuple,check_convex=True)
 
+    The vertices of a are clipped with the half spaces of b
+    '''
+    return clip_convexpolygon_convexpolygon(a,b)
 
 def inter_convexpolygon_convexPolyhedron_old(cph,cpg):
     """Input:
@@ -742,14 +672,10 @@ def inter_convexpolygon_convexPolyhedron(cph,cpg):
     Output:
     a Point, Segment or ConvexPolygon
     the intersection part of cph and cpg
+
+    The vertices of cpg are clipped with the face half spaces of cph
     """
-    inter_p_cph = intersection(cph,cpg.plane)
-    if inter_p_cph is None:
-        return None
-    elif isinstance(inter_p_cph,Point) or isinstance(inter_p_cph,Segment) or isinstance(inter_p_cph,ConvexPolygon):
-        return intersection(inter_p_cph,cpg)
-    else:
-        raise TypeError("Bug detected! please contact the author")
+    return clip_convexpolygon_convexpolyhedron(cpg,cph)
 
 def inter_convexpolygon_halfline(cpg,h):
     '''Input:
@@ -815,7 +741,7 @@ def inter_convexpolyhedron_convexpolyhedron(cph1,cph2):
             # print('CPG !!!!!!\nhash:{}\ncpg:{},cpg_set_len:{}'.format(hash(inter),inter,len(cpg_set)))
             cpg_set.add(inter)
     if len(cpg_set) > 1:
-        get_main_logger().debug('cpg_set:{},length:{}'.format(cpg_set,len(cpg_set)))
+        logger.debug('cpg_set:%s,length:%d', cpg_set, len(cpg_set))
         return ConvexPolyhedron(tuple(cpg_set))
     elif len(cpg_set) == 1:
         return list(cpg_set)[0]
@@ -837,6 +763,18 @@ def inter_convexpolyhedron_halfline(cph,h):
 
     Output:
     The intersection
+
+    The halfline is clipped with the half spaces of the faces
+    '''
+    return clip_linear_convexpolyhedron(h,cph)
+
+def inter_convexpolyhedron_halfline_old(cph,h):
+    '''Input:
+    cph: ConvexPolyhedron
+    h: HalfLine
+
+    Output:
+    The intersection by intersecting every face, slower than inter_convexpolyhedron_halfline
     '''
     inter_point_set = get_halfline_convexpolyhedron_intersection_point_set(h,cph)
     if (h.point in cph):
@@ -849,7 +787,7 @@ def inter_convexpolyhedron_halfline(cph,h):
     elif len(inter_point_list) == 2:
         return Segment(inter_point_list[0],inter_point_list[1])
     else:
-        get_main_logger().error('length of inter_point_list is {}, list is {}'.format(len(inter_point_list),inter_point_list))
+        logger.error('length of inter_point_list is %d, list is %s', len(inter_point_list), inter_point_list)
         raise TypeError("Bug detected! please contact the author")
 
 
@@ -892,4 +830,34 @@ def inter_halfline_halfline(a,b):
         else:
             raise TypeError("Bug detected! please contact the author")
 
-__all__=('intersection',)
\ No newline at end of file
+_intersection_dispatcher = TypePairDispatcher('intersecting')
+register_intersection(Point, Point, inter_point_point)
+register_intersection(Point, Line, inter_point_line)
+register_intersection(Point, Plane, inter_point_plane)
+register_intersection(Point, Segment, inter_point_segment)
+register_intersection(Point, ConvexPolygon, inter_point_convexpolygon)
+register_intersection(Point, ConvexPolyhedron, inter_point_convexpolyhedron)
+register_intersection(Point, HalfLine, inter_point_halfline)
+register_intersection(Line, Line, inter_line_line)
+register_intersection(Line, Plane, inter_line_plane)
+register_intersection(Line, Segment, inter_line_segment)
+register_intersection(Line, ConvexPolygon, inter_line_convexpolygon)
+register_intersection(Line, ConvexPolyhedron, inter_line_convexpolyhedron)
+register_intersection(Line, HalfLine, inter_line_halfline)
+register_intersection(Plane, Plane, inter_plane_plane)
+register_intersection(Plane, Segment, inter_plane_segment)
+register_intersection(Plane, ConvexPolygon, inter_plane_convexpolygon)
+register_intersection(Plane, ConvexPolyhedron, inter_plane_convexpolyhedron)
+register_intersection(Plane, HalfLine, inter_plane_halfline)
+register_intersection(Segment, Segment, inter_segment_segment)
+register_intersection(Segment, ConvexPolygon, inter_segment_convexpolygon)
+register_intersection(Segment, ConvexPolyhedron, inter_segment_convexpolyhedron)
+register_intersection(Segment, HalfLine, inter_segment_halfline)
+register_intersection(ConvexPolygon, ConvexPolygon, inter_convexpolygon_convexpolygon)
+register_intersection(ConvexPolyhedron, ConvexPolygon, inter_convexpolygon_convexPolyhedron)
+register_intersection(ConvexPolygon, HalfLine, inter_convexpolygon_halfline)
+register_intersection(ConvexPolyhedron, ConvexPolyhedron, inter_convexpolyhedron_convexpolyhedron)
+register_intersection(ConvexPolyhedron, HalfLine, inter_convexpolyhedron_halfline)
+register_intersection(HalfLine, HalfLine, inter_halfline_halfline)
+
+__all__=('intersection','narrow_phase_intersection','register_intersection')
\ No newline at end of file
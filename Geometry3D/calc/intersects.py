@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+"""
+Intersects Module
+
+Boolean predicates telling whether two bodies intersect without building
+the intersection.
+"""
+from ..geometry.line import Line
+from ..geometry.plane import Plane
+from ..geometry.point import Point
+from ..geometry.segment import Segment
+from ..geometry.polygon import ConvexPolygon
+from ..geometry.polyhedron import ConvexPolyhedron
+from ..geometry.halfline import HalfLine
+from ..utils.constant import get_eps
+from ..utils.solver import line_line_parameters
+from ..utils.aabb import INF
+
+from .dispatch import TypePairDispatcher
+from .intersection import intersection, _BOXED_TYPES
+from .clip import linear_parameters, clip_interval, polygon_halfspaces
+from .sat import separating_axis
+
+def intersects(a, b):
+    """
+    **Input:**
+
+    - a: GeoBody or None
+
+    - b: GeoBody or None
+
+    **Output:**
+
+    Whether a and b intersect, that is bool(intersection(a, b)) but computed
+    with early exit tests that never build the intersection geometry.
+    """
+    if a is None or b is None:
+        return False
+    if isinstance(a, _BOXED_TYPES) and isinstance(b, _BOXED_TYPES) and not a.aabb().overlaps(b.aabb()):
+        return False
+    entry = _intersects_dispatcher.lookup(type(a), type(b))
+    if entry is None:
+        # types registered with register_intersection only
+        return intersection(a, b) is not None
+    func, swapped = entry
+    if swapped:
+        return func(b, a)
+    return func(a, b)
+
+def _dot(u, v):
+    return u[0] * v[0] + u[1] * v[1] + u[2] * v[2]
+
+def _plane_side_range(plane, points):
+    """return the min and max signed distance of the points to the plane"""
+    n = tuple(plane.n)
+    offset = _dot(n, tuple(plane.p))
+    distances = [_dot(n, tuple(point)) - offset for point in points]
+    return min(distances), max(distances)
+
+def _points_straddle_plane(plane, points):
+    low, high = _plane_side_range(plane, points)
+    eps = get_eps()
+    return low <= eps and high >= -eps
+
+def _sub(u, v):
+    return (u[0] - v[0], u[1] - v[1], u[2] - v[2])
+
+def _cross(u, v):
+    return (u[1] * v[2] - u[2] * v[1], u[2] * v[0] - u[0] * v[2], u[0] * v[1] - u[1] * v[0])
+
+def intersects_point_point(p1, p2):
+    """intersects function for Point and Point"""
+    return p1 == p2
+
+def intersects_point_body(point, body):
+    """intersects function for Point and a body, which contains the point or not"""
+    return point in body
+
+def intersects_linear_linear(a, b):
+    """intersects function for pairs of Lines, Segments and HalfLines"""
+    eps = get_eps()
+    p, d, t_min, t_max = linear_parameters(a)
+    q, e, s_min, s_max = linear_parameters(b)
+    d_length = _dot(d, d) ** 0.5
+    e_length = _dot(e, e) ** 0.5
+    parameters = line_line_parameters(p, d, q, e)
+    if parameters is None:
+        # parallel, b must be on the line of a and overlap its interval
+        w = _sub(q, p)
+        offset = _cross(w, d)
+        if _dot(offset, offset) > (eps * d_length) ** 2:
+            return False
+        u = (e[0] / e_length, e[1] / e_length, e[2] / e_length)
+        start = _dot(u, q)
+        halfspaces = []
+        if s_max < INF:
+            halfspaces.append((u, start + s_max * e_length))
+        if s_min > -INF:
+            halfspaces.append(((-u[0], -u[1], -u[2]), -start - s_min * e_length))
+        return clip_interval(p, d, t_min, t_max, halfspaces) is not None
+    t, s = parameters
+    # the closest points of the lines must meet and lie on both bodies
+    gap = (p[0] + t * d[0] - q[0] - s * e[0], p[1] + t * d[1] - q[1] - s * e[1], p[2] + t * d[2] - q[2] - s * e[2])
+    if _dot(gap, gap) > eps * eps:
+        return False
+    return (t_min - eps / d_length <= t <= t_max + eps / d_length and
+            s_min - eps / e_length <= s <= s_max + eps / e_length)
+
+def intersects_plane_line(plane, line):
+    """intersects function for Plane and Line"""
+    return not plane.n.orthogonal(line.dv) or Point(line.sv) in plane
+
+def intersects_plane_plane(p1, p2):
+    """intersects function for Plane and Plane"""
+    return not p1.n.parallel(p2.n) or p1 == p2
+
+def intersects_plane_segment(plane, segment):
+    """intersects function for Plane and Segment"""
+    return _points_straddle_plane(plane, (segment.start_point, segment.end_point))
+
+def intersects_plane_halfline(plane, halfline):
+    """intersects function for Plane and HalfLine"""
+    n = tuple(plane.n)
+    distance = _dot(n, tuple(halfline.point)) - _dot(n, tuple(plane.p))
+    if abs(distance) <= get_eps():
+        return True
+    # the halfline goes towards the plane
+    return distance * _dot(n, tuple(halfline.vector)) < 0
+
+def intersects_plane_convexpolygon(plane, cpg):
+    """intersects function for Plane and ConvexPolygon"""
+    return _points_straddle_plane(plane, cpg.points)
+
+def intersects_plane_convexpolyhedron(plane, cph):
+    """intersects function for Plane and ConvexPolyhedron"""
+    return _points_straddle_plane(plane, cph.point_set)
+
+def intersects_linear_convexpolygon(linear, cpg):
+    """intersects function for Line, Segment or HalfLine and ConvexPolygon"""
+    p, d, t_min, t_max = linear_parameters(linear)
+    return clip_interval(p, d, t_min, t_max, polygon_halfspaces(cpg)) is not None
+
+def intersects_linear_convexpolyhedron(linear, cph):
+    """intersects function for Line, Segment or HalfLine and ConvexPolyhedron"""
+    p, d, t_min, t_max = linear_parameters(linear)
+    return clip_interval(p, d, t_min, t_max, cph.halfspaces()) is not None
+
+def intersects_convex_convex(a, b):
+    """intersects function for pairs of ConvexPolygons and ConvexPolyhedrons, by the separating axis test"""
+    return separating_axis(a, b) is None
+
+_intersects_dispatcher = TypePairDispatcher('checking intersection of')
+_intersects_dispatcher.register(Point, Point, intersects_point_point)
+for _type in (Line, Plane, Segment, ConvexPolygon, ConvexPolyhedron, HalfLine):
+    _intersects_dispatcher.register(Point, _type, intersects_point_body)
+for _type in (Line, Segment, HalfLine):
+    _intersects_dispatcher.register(Line, _type, intersects_linear_linear)
+    _intersects_dispatcher.register(Segment, _type, intersects_linear_linear)
+    _intersects_dispatcher.register(HalfLine, _type, intersects_linear_linear)
+    _intersects_dispatcher.register(_type, ConvexPolygon, intersects_linear_convexpolygon)
+    _intersects_dispatcher.register(_type, ConvexPolyhedron, intersects_linear_convexpolyhedron)
+_intersects_dispatcher.register(Plane, Line, intersects_plane_line)
+_intersects_dispatcher.register(Plane, Plane, intersects_plane_plane)
+_intersects_dispatcher.register(Plane, Segment, intersects_plane_segment)
+_intersects_dispatcher.register(Plane, HalfLine, intersects_plane_halfline)
+_intersects_dispatcher.register(Plane, ConvexPolygon, intersects_plane_convexpolygon)
+_intersects_dispatcher.register(Plane, ConvexPolyhedron, intersects_plane_convexpolyhedron)
+_intersects_dispatcher.register(ConvexPolygon, ConvexPolygon, intersects_convex_convex)
+_intersects_dispatcher.register(ConvexPolygon, ConvexPolyhedron, intersects_convex_convex)
+_intersects_dispatcher.register(ConvexPolyhedron, ConvexPolyhedron, intersects_convex_convex)
+del _type
+
+__all__ = ('intersects',)
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+"""
+Mass Module
+
+Volume, center of mass and inertia tensor of ConvexPolyhedrons. Every face
+is split into a fan of triangles and every triangle makes a tetrahedron with
+the center point of its polyhedron, the integrals over the tetrahedra are
+summed with array math over all the polyhedra at once. Numpy is needed for
+this module.
+"""
+from ..geometry.point import Point
+from ..geometry.polyhedron import ConvexPolyhedron
+
+class MassProperties(object):
+    """
+    The mass properties of a ConvexPolyhedron with a uniform density.
+
+    - volume: the volume
+
+    - mass: the volume times the density
+
+    - centroid: the center of mass as a Point
+
+    - inertia: the (3, 3) numpy inertia tensor about the center of mass
+    """
+    def __init__(self, volume, mass, centroid, inertia):
+        self.volume = volume
+        self.mass = mass
+        self.centroid = centroid
+        self.inertia = inertia
+
+    def __repr__(self):
+        return "MassProperties(volume={}, mass={}, centroid={}, inertia={})".format(
+            self.volume, self.mass, self.centroid, self.inertia.tolist())
+
+def _tetrahedra(polyhedra):
+    """
+    return (references, triangles, owners), the center point of every polyhedron as an (N, 3) array,
+    the fan triangles of all the faces relative to the center point of their polyhedron as
+    a (T, 3, 3) array and the index of the polyhedron of every triangle
+    """
+    import numpy as np
+    references = []
+    triangles = []
+    owners = []
+    for index, cph in enumerate(polyhedra):
+        if not isinstance(cph, ConvexPolyhedron):
+            raise TypeError("Mass properties need ConvexPolyhedrons, not %s" % (type(cph),))
+        reference = tuple(cph.center_point)
+        references.append(reference)
+        count = len(triangles)
+        for polygon in cph.convex_polygons:
+            points = [tuple(point) for point in polygon.points]
+            for i in range(1, len(points) - 1):
+                triangles.append((points[0], points[i], points[i + 1]))
+        owners.extend([index] * (len(triangles) - count))
+    references = np.array(references, dtype=np.float64).reshape(-1, 3)
+    owners = np.array(owners, dtype=np.intp)
+    triangles = np.array(triangles, dtype=np.float64).reshape(-1, 3, 3) - references[owners][:, None, :]
+    return references, triangles, owners
+
+def mass_properties_many(polyhedra, density=1.0):
+    """
+    **Input:**
+
+    - polyhedra: an iterable of ConvexPolyhedrons
+
+    - density: the density, a number or one number for each ConvexPolyhedron
+
+    **Output:**
+
+    A list of MassProperties, one for each ConvexPolyhedron
+
+    The triangles of all the polyhedra are stacked in one array so that the
+    volume, the first and the second moments of all the tetrahedra are computed
+    by a few vectorized operations.
+
+    Numpy is needed for this function.
+    """
+    import numpy as np
+    polyhedra = list(polyhedra)
+    if len(polyhedra) == 0:
+        return []
+    references, triangles, owners = _tetrahedra(polyhedra)
+    densities = np.broadcast_to(np.asarray(density, dtype=np.float64), (len(polyhedra),))
+    a, b, c = triangles[:, 0], triangles[:, 1], triangles[:, 2]
+    # six times the volume of each tetrahedron, the apex is the center point of its polyhedron
+    # which is inside, so the absolute value does not depend on the order of the vertices
+    determinants = np.abs(np.einsum('ij,ij->i', a, np.cross(b, c)))
+    count = len(polyhedra)
+    volumes = np.bincount(owners, weights=determinants, minlength=count) / 6
+    # the first moment of a tetrahedron is its volume times the mean of its 4 vertices
+    first = np.stack([np.bincount(owners, weights=determinants * (a[:, k] + b[:, k] + c[:, k]), minlength=count) for k in range(3)], axis=1) / 24
+    # the second moment of the tetrahedron with the apex at the origin is
+    # det / 120 * (sum_i v_i v_i^T + (sum_i v_i) (sum_i v_i)^T)
+    s = a + b + c
+    outer = (np.einsum('ij,ik->ijk', a, a) + np.einsum('ij,ik->ijk', b, b) + np.einsum('ij,ik->ijk', c, c)
+             + np.einsum('ij,ik->ijk', s, s)) * (determinants / 120)[:, None, None]
+    second = np.zeros((count, 3, 3))
+    np.add.at(second, owners, outer)
+    centers = first / volumes[:, None]
+    # move the second moment to the center of mass
+    second -= volumes[:, None, None] * np.einsum('ij,ik->ijk', centers, centers)
+    traces = np.trace(second, axis1=1, axis2=2)
+    inertias = (traces[:, None, None] * np.eye(3) - second) * densities[:, None, None]
+    centroids = references + centers
+    return [
+        MassProperties(float(volumes[i]), float(volumes[i] * densities[i]), Point.from_floats(*centroids[i].tolist()), inertias[i])
+        for i in range(count)
+    ]
+
+def mass_properties(cph, density=1.0):
+    """
+    **Input:**
+
+    - cph: a ConvexPolyhedron
+
+    - density: the density
+
+    **Output:**
+
+    The MassProperties of cph, that is the volume, the mass, the centroid and the inertia tensor about the centroid
+
+    Numpy is needed for this function.
+    """
+    return mass_properties_many([cph], density)[0]
+
+__all__ = ('mass_properties', 'mass_properties_many', 'MassProperties')
@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+"""
+SAT Module
+
+The separating axis test for pairs of ConvexPolygons and ConvexPolyhedrons.
+Two convex bodies are disjoint if and only if their projections on one of
+the face normals or on one of the cross products of an edge of each body are
+disjoint. Edge pairs whose arcs on the Gauss map do not cross cannot give a
+separating axis and are skipped.
+"""
+from ..geometry.polygon import ConvexPolygon
+from ..geometry.polyhedron import ConvexPolyhedron
+from ..utils.vector import Vector
+from ..utils.constant import get_eps, get_sig_figures
+
+from .clip import polygon_halfspaces
+from .gjk import convex_vertices, support_function
+
+def _dot(u, v):
+    return u[0] * v[0] + u[1] * v[1] + u[2] * v[2]
+
+def _cross(u, v):
+    return (u[1] * v[2] - u[2] * v[1], u[2] * v[0] - u[0] * v[2], u[0] * v[1] - u[1] * v[0])
+
+def _sub(u, v):
+    return (u[0] - v[0], u[1] - v[1], u[2] - v[2])
+
+def _neg(u):
+    return (-u[0], -u[1], -u[2])
+
+def _polyhedron_edges(cph):
+    """
+    return the edges of cph as (point, direction, arcs), arcs holds the pair of
+    normals of the two faces at the edge. None if an edge does not have two faces.
+    """
+    sig_figures = get_sig_figures()
+    faces = dict()
+    for polygon in cph.convex_polygons:
+        n = tuple(polygon.plane.n)
+        points = [tuple(point) for point in polygon.points]
+        for i in range(len(points)):
+            p, q = points[i], points[(i + 1) % len(points)]
+            # the vertices are matched like Points, by their rounded coordinates
+            key = frozenset((tuple(round(c, sig_figures) for c in p), tuple(round(c, sig_figures) for c in q)))
+            faces.setdefault(key, (p, q, []))[2].append(n)
+    edges = []
+    for p, q, normals in faces.values():
+        if len(normals) != 2:
+            return None
+        edges.append((p, _sub(q, p), ((normals[0], normals[1]),)))
+    return edges
+
+def _polygon_edges(cpg):
+    """
+    return the edges of cpg like _polyhedron_edges, the arc of an edge of a flat
+    polygon is the half circle from n over the outer edge normal to -n, split in two
+    """
+    n = tuple(cpg.plane.n)
+    points = [tuple(point) for point in cpg.points]
+    edges = []
+    for i in range(len(points)):
+        direction = _sub(points[(i + 1) % len(points)], points[i])
+        m = _cross(direction, n)
+        length = _dot(m, m) ** 0.5
+        if length == 0:
+            continue
+        m = (m[0] / length, m[1] / length, m[2] / length)
+        edges.append((points[i], direction, ((n, m), (m, _neg(n)))))
+    return edges
+
+def _halfspaces(body):
+    """return the half spaces (n, offset) whose intersection is body"""
+    if isinstance(body, ConvexPolyhedron):
+        return body.halfspaces()
+    elif isinstance(body, ConvexPolygon):
+        return polygon_halfspaces(body)
+    else:
+        raise TypeError("Separating axis test is not implemented for %s" % (type(body),))
+
+def _edges(body):
+    """return the edges of body as (point, direction, arcs), None if they cannot be matched with the faces"""
+    if isinstance(body, ConvexPolyhedron):
+        return _polyhedron_edges(body)
+    return _polygon_edges(body)
+
+def _separating_face(halfspaces, support, eps):
+    """return the first normal n with the whole body of support beyond its half space, None else"""
+    for n, offset in halfspaces:
+        # the lowest vertex along n is the support in direction -n
+        p = support((-n[0], -n[1], -n[2]))
+        if n[0] * p[0] + n[1] * p[1] + n[2] * p[2] > offset + eps:
+            return n
+    return None
+
+def _separating_edges(edges_a, edges_b, eps):
+    """return the first cross product of edges separating the bodies oriented from a to b, None else"""
+    # the arcs of b are negated since the faces of the Minkowski difference a - b are looked for,
+    # c x d of the negated arc is the same as for the arc
+    arcs_b = []
+    for pb, eb, arcs in edges_b:
+        for c, d in arcs:
+            arcs_b.append((_neg(c), _neg(d), _cross(d, c), pb, eb))
+    for pa, ea, arcs_a in edges_a:
+        for a, b in arcs_a:
+            bxa0, bxa1, bxa2 = _cross(b, a)
+            for c, d, dxc, pb, eb in arcs_b:
+                # the arc c-d crosses the great circle of a-b
+                cba = c[0] * bxa0 + c[1] * bxa1 + c[2] * bxa2
+                dba = d[0] * bxa0 + d[1] * bxa1 + d[2] * bxa2
+                if cba * dba >= 0:
+                    continue
+                # the arc a-b crosses the great circle of c-d, in the same hemisphere
+                adc = _dot(a, dxc)
+                bdc = _dot(b, dxc)
+                if adc * bdc >= 0 or cba * bdc <= 0:
+                    continue
+                axis = _cross(ea, eb)
+                length = _dot(axis, axis) ** 0.5
+                if length <= eps * (_dot(ea, ea) * _dot(eb, eb)) ** 0.5:
+                    # parallel edges only give the face normals tried before
+                    continue
+                axis = (axis[0] / length, axis[1] / length, axis[2] / length)
+                # the axis is on the arc a-b, so it points outside a
+                if _dot(axis, (a[0] + b[0], a[1] + b[1], a[2] + b[2])) < 0:
+                    axis = _neg(axis)
+                if _dot(axis, _sub(pb, pa)) > eps:
+                    return axis
+    return None
+
+def _separating_edge_pairs(points_a, edges_a, points_b, edges_b, eps):
+    """return the first cross product of edges separating the bodies by projecting all the points"""
+    for _, ea in edges_a:
+        for _, eb in edges_b:
+            axis = _cross(ea, eb)
+            length = _dot(axis, axis) ** 0.5
+            if length <= eps:
+                continue
+            axis = (axis[0] / length, axis[1] / length, axis[2] / length)
+            projection_a = [_dot(axis, p) for p in points_a]
+            projection_b = [_dot(axis, p) for p in points_b]
+            if max(projection_a) < min(projection_b) - eps:
+                return axis
+            if max(projection_b) < min(projection_a) - eps:
+                return _neg(axis)
+    return None
+
+def separating_axis(a, b, edges=True):
+    """
+    **Input:**
+
+    - a: a ConvexPolygon or ConvexPolyhedron
+
+    - b: a ConvexPolygon or ConvexPolyhedron
+
+    - edges: whether the cross products of the edges are tried after the face normals
+
+    **Output:**
+
+    A unit Vector v such that the projection of a on v is smaller than the projection of b
+    by more than eps, that is a plane orthogonal to v separates a and b. None if a and b intersect.
+    With edges=False only the face normals are tried, which is cheaper but None then
+    does not always mean that a and b intersect.
+    """
+    eps = get_eps()
+    halfspaces_a, halfspaces_b = _halfspaces(a), _halfspaces(b)
+    axis = _separating_face(halfspaces_a, support_function(b), eps)
+    if axis is not None:
+        return Vector.from_floats(*axis)
+    axis = _separating_face(halfspaces_b, support_function(a), eps)
+    if axis is not None:
+        return -Vector.from_floats(*axis)
+    if not edges:
+        return None
+    edges_a, edges_b = _edges(a), _edges(b)
+    if edges_a is None or edges_b is None:
+        # without the faces at the edges every pair of edges has to be tried
+        axis = _separating_edge_pairs(convex_vertices(a), _all_edges(a), convex_vertices(b), _all_edges(b), eps)
+    else:
+        axis = _separating_edges(edges_a, edges_b, eps)
+    if axis is not None:
+        return Vector.from_floats(*axis)
+    return None
+
+def _all_edges(body):
+    """return the edges of body as (point, direction) without the faces"""
+    if isinstance(body, ConvexPolyhedron):
+        segments = body.segment_set
+    else:
+        segments = body.segments()
+    return [(tuple(s.start_point), _sub(tuple(s.end_point), tuple(s.start_point))) for s in segments]
+
+__all__ = ('separating_axis',)
@@ -2,7 +2,6 @@
 """Volume module"""
 from ..geometry.pyramid import Pyramid
 from ..geometry.polyhedron import ConvexPolyhedron
-from .distance import distance
 
 def volume(arg):
     """
@@ -18,14 +17,8 @@ def volume(arg):
     
     - ConvexPolyhedron
     """
-    if isinstance(arg,Pyramid):
-        height = distance(arg.point,arg.convex_polygon.plane)
-        return 1 / 3 * height * arg.convex_polygon.area()
-    elif isinstance(arg,ConvexPolyhedron):
-        total_volume = 0
-        for pyramid in arg.pyramid_set:
-            total_volume += volume(pyramid)
-        return total_volume
+    if isinstance(arg,Pyramid) or isinstance(arg,ConvexPolyhedron):
+        return arg.volume()
     else:
         raise ValueError("No attribut volume for this object")
 
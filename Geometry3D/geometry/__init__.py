@@ -1,12 +1,13 @@
 
 from .line import Line,x_axis,y_axis,z_axis
 from .plane import Plane,xy_plane,yz_plane,xz_plane
-from .point import Point,origin
+from .point import Point,PointArray,origin
 from .segment import Segment
 from .polygon import ConvexPolygon,Parallelogram,get_circle_point_list,Circle
 from .pyramid import Pyramid
 from .polyhedron import ConvexPolyhedron,Parallelepiped,Sphere,Cylinder,Cone
 from .halfline import HalfLine
+from .halfedge import HalfEdgeMesh
 __all__ = (
     "ConvexPolyhedron",
     "Parallelepiped",
@@ -21,7 +22,9 @@ __all__ = (
     "Line",
     "Plane",
     "Point",
+    "PointArray",
     "HalfLine",
+    "HalfEdgeMesh",
     "origin",
     "x_axis",
     "y_axis",
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 """Geobody module"""
+from ..utils.aabb import AABB
 class GeoBody(object):
     """A base class for geometric objects that provides some common
     methods to work with. In the end, everything is dispatched to
@@ -8,6 +9,37 @@ class GeoBody(object):
     instead of
     intersection(L1, L2)
     """
+    _cache = None # dict[name] = value of the derived data, dropped by _invalidate
+
+    def _cached(self, name, compute):
+        """return the derived data cached under name, compute() is called on first use and after self is changed"""
+        cache = self._cache
+        if cache is None:
+            cache = self._cache = dict()
+        if name not in cache:
+            cache[name] = compute()
+        return cache[name]
+
+    def _invalidate(self):
+        """drop all the cached derived data, this is called by move"""
+        # a new dict is made on the next use, so that a copy sharing the old one is not changed
+        self._cache = None
+
+    def __copy__(self):
+        """return a shallow copy of self which does not share the cached derived data"""
+        body = self.__class__.__new__(self.__class__)
+        body.__dict__.update(self.__dict__)
+        body._cache = None
+        return body
+
+    def aabb(self):
+        """return the axis aligned bounding box of self, which is cached until self is moved"""
+        return self._cached('aabb', self._get_aabb)
+
+    def _get_aabb(self):
+        """return the axis aligned bounding box, subclasses should make it as tight as they can"""
+        return AABB.infinite()
+
     def intersection(self, other):
         """return the intersection between self and other"""
         from ..calc.intersection import intersection
@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+"""HalfEdge Module"""
+
+class HalfEdgeMesh(object):
+    """
+    - HalfEdgeMesh(vertices, faces):
+
+    The half edge structure of a closed polyhedron. vertices is a list of
+    coordinate tuples and faces is a list of vertex index tuples, counterclockwise
+    around the outer normal of each face. ConvexPolyhedron.half_edges() builds it
+    once for a polyhedron.
+
+    Every edge is stored as two half edges of opposite directions, one on each
+    of its faces. The half edge h starts at the vertex origin[h] on the face face[h],
+    next[h] and prev[h] are the half edges after and before h around that face and
+    twin[h] is the half edge of the same edge on the neighbouring face.
+    vertex_half_edge[v] is a half edge starting at the vertex v and face_half_edge[f]
+    is a half edge of the face f, so that all the neighbours are found by walking
+    the lists without any hashing.
+    """
+    def __init__(self, vertices, faces):
+        self.vertices = [tuple(vertex) for vertex in vertices]
+        self.faces = [tuple(face) for face in faces]
+        self.origin = []
+        self.next = []
+        self.prev = []
+        self.face = []
+        self.face_half_edge = []
+        directed = dict() # dict[(u, v)] = the half edge from vertex u to vertex v
+        for f, face in enumerate(self.faces):
+            count = len(face)
+            if count < 3:
+                raise ValueError('Face %d has less than 3 vertices' % (f,))
+            start = len(self.origin)
+            self.face_half_edge.append(start)
+            for i in range(count):
+                key = (face[i], face[(i + 1) % count])
+                if key in directed:
+                    raise ValueError('The edge from vertex %d to vertex %d is used twice in the same direction, the faces may not be oriented' % key)
+                directed[key] = start + i
+                self.origin.append(face[i])
+                self.next.append(start + (i + 1) % count)
+                self.prev.append(start + (i - 1) % count)
+                self.face.append(f)
+        self.twin = [None] * len(self.origin)
+        for (u, v), h in directed.items():
+            twin = directed.get((v, u))
+            if twin is None:
+                raise ValueError('The edge from vertex %d to vertex %d has only one face, the polyhedron is not closed' % (u, v))
+            self.twin[h] = twin
+        self.vertex_half_edge = [None] * len(self.vertices)
+        for h in range(len(self.origin) - 1, -1, -1):
+            self.vertex_half_edge[self.origin[h]] = h
+        if None in self.vertex_half_edge:
+            raise ValueError('Vertex %d is not on any face' % (self.vertex_half_edge.index(None),))
+        self.normals = [self._get_normal(face) for face in self.faces]
+        # the neighbours of every vertex are listed once for the walks of extreme_vertex
+        self.adjacency = [self.vertex_neighbors(v) for v in range(len(self.vertices))]
+
+    def _get_normal(self, face):
+        """return the outer unit normal of a face by Newell's method"""
+        x, y, z = 0.0, 0.0, 0.0
+        for i in range(len(face)):
+            p = self.vertices[face[i]]
+            q = self.vertices[face[(i + 1) % len(face)]]
+            x += (p[1] - q[1]) * (p[2] + q[2])
+            y += (p[2] - q[2]) * (p[0] + q[0])
+            z += (p[0] - q[0]) * (p[1] + q[1])
+        length = (x * x + y * y + z * z) ** 0.5
+        if length == 0:
+            raise ValueError('Cannot compute the normal of the face {}'.format(face))
+        return (x / length, y / length, z / length)
+
+    def __repr__(self):
+        return "HalfEdgeMesh(V={}, E={}, F={})".format(len(self.vertices), len(self.origin) // 2, len(self.faces))
+
+    def destination(self, h):
+        """return the vertex the half edge h ends at"""
+        return self.origin[self.next[h]]
+
+    def edges(self):
+        """return a list with one half edge for every edge"""
+        return [h for h in range(len(self.origin)) if h < self.twin[h]]
+
+    def edge_faces(self, h):
+        """return the two faces at the edge of the half edge h, the face of h first"""
+        return (self.face[h], self.face[self.twin[h]])
+
+    def face_half_edges(self, f):
+        """yield the half edges of the face f in counterclockwise order"""
+        start = h = self.face_half_edge[f]
+        while True:
+            yield h
+            h = self.next[h]
+            if h == start:
+                break
+
+    def face_neighbors(self, f):
+        """return the faces sharing an edge with the face f, in counterclockwise order"""
+        return [self.face[self.twin[h]] for h in self.face_half_edges(f)]
+
+    def vertex_half_edges(self, v):
+        """yield the half edges starting at the vertex v, in order around the vertex"""
+        start = h = self.vertex_half_edge[v]
+        while True:
+            yield h
+            h = self.next[self.twin[h]]
+            if h == start:
+                break
+
+    def vertex_neighbors(self, v):
+        """return the vertices sharing an edge with the vertex v"""
+        return [self.destination(h) for h in self.vertex_half_edges(v)]
+
+    def vertex_faces(self, v):
+        """return the faces around the vertex v"""
+        return [self.face[h] for h in self.vertex_half_edges(v)]
+
+    def extreme_vertex(self, direction, start=0):
+        """
+        **Input:**
+
+        - direction: a Vector or a tuple
+
+        - start=0: the vertex to start from
+
+        **Output:**
+
+        The index of a vertex farthest in direction. The walk goes on to the farthest
+        neighbour as long as it is farther than the current vertex. On a convex polyhedron
+        a vertex with no farther neighbour is farthest of all, so only the vertices near
+        the path from start are visited.
+        """
+        d0, d1, d2 = direction[0], direction[1], direction[2]
+        vertices = self.vertices
+        adjacency = self.adjacency
+        v = start
+        p = vertices[v]
+        best = p[0] * d0 + p[1] * d1 + p[2] * d2
+        while True:
+            farther = None
+            for u in adjacency[v]:
+                q = vertices[u]
+                value = q[0] * d0 + q[1] * d1 + q[2] * d2
+                if value > best:
+                    best = value
+                    farther = u
+            if farther is None:
+                return v
+            v = farther
+
+    def silhouette(self, direction):
+        """
+        **Input:**
+
+        - direction: a Vector or a tuple
+
+        **Output:**
+
+        The half edges between a face whose normal points to direction and a face
+        whose normal does not, each half edge is on the face pointing to direction.
+        These edges are the outline of the polyhedron seen from far away along -direction.
+        """
+        d0, d1, d2 = direction[0], direction[1], direction[2]
+        front = [n[0] * d0 + n[1] * d1 + n[2] * d2 > 0 for n in self.normals]
+        return [h for h in range(len(self.origin)) if front[self.face[h]] and not front[self.face[self.twin[h]]]]
+
+__all__ = ("HalfEdgeMesh",)
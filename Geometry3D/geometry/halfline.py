@@ -6,10 +6,13 @@ from .plane import Plane
 from ..utils.vector import Vector
 from .line import Line
 from ..utils.constant import get_eps
-from ..utils.logger import get_main_logger
+from ..utils.logger import get_logger
+from ..utils.aabb import AABB,INF
 from .segment import Segment
 import math
-import copy
+
+logger = get_logger(__name__)
+
 class HalfLine(GeoBody):
     """
     **Input:**
@@ -20,8 +23,7 @@ class HalfLine(GeoBody):
     """
     class_level = 6 # the class level of HalfLine
     def __init__(self,a,b):
-        a = copy.deepcopy(a)
-        b = copy.deepcopy(b)
+        # Points are immutable so they are shared instead of copied
         if isinstance(a,Point) and isinstance(b,Point):
             if a == b:
                 raise ValueError("Cannot initialize a HalfLine with two identical Points")
@@ -31,6 +33,8 @@ class HalfLine(GeoBody):
         elif isinstance(a,Point) and isinstance(b,Vector):
             if b.length() < get_eps():
                 raise ValueError("Cannot initialize a HalfLine with the length of Vector is 0")
+            # Vectors are mutable, so the caller's Vector is copied
+            b = Vector.from_floats(*b)
             self.line = Line(a,b)
             self.point = a
             self.vector = b
@@ -57,7 +61,7 @@ class HalfLine(GeoBody):
         if isinstance(other, HalfLine):
             return (self.line == other.line) and (other.point in self) and ((self.vector * other.vector) > -get_eps())
         else:
-            get_main_logger().warning("Calling type {} in type {} which is always False".format(type(other),type(self)))
+            logger.warning("Calling type %s in type %s which is always False", type(other), type(self))
             return False
 
     def in_(self,other):
@@ -76,14 +80,39 @@ class HalfLine(GeoBody):
         hash(self.point) * hash(self.vector.normalized())
         ))
 
+    def _get_aabb(self):
+        """return the axis aligned bounding box, infinite in the direction of the halfline"""
+        min_corner = []
+        max_corner = []
+        for i in range(3):
+            if self.vector[i] > get_eps():
+                min_corner.append(self.point[i])
+                max_corner.append(INF)
+            elif self.vector[i] < -get_eps():
+                min_corner.append(-INF)
+                max_corner.append(self.point[i])
+            else:
+                min_corner.append(self.point[i])
+                max_corner.append(self.point[i])
+        return AABB(min_corner, max_corner)
+
     def move(self, v):
         """Return the HalfLine that you get when you move self by vector v, self is also moved"""
         if isinstance(v,Vector):
-            self.point.move(v)
+            self._invalidate()
+            self.point = self.point.translated(v)
+            self.line = Line(self.point,self.vector)
             return HalfLine(self.point,self.vector)
         else:
             raise NotImplementedError("The second parameter for move function must be Vector")
 
+    def translated(self, v):
+        """Return the HalfLine that you get when you move self by vector v, self is not changed"""
+        if isinstance(v,Vector):
+            return HalfLine(self.point.translated(v),self.vector)
+        else:
+            raise NotImplementedError("The second parameter for translated function must be Vector")
+
     def parametric(self):
         """Returns (point, vector) so that you can build the information for the halfline
         """
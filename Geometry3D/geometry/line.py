@@ -4,6 +4,7 @@ from .body import GeoBody
 from .point import Point,origin
 from ..utils.vector import Vector
 from ..utils.constant import *
+from ..utils.aabb import AABB,INF
 class Line(GeoBody):
     """
     - Line(Point, Point):
@@ -82,16 +83,36 @@ class Line(GeoBody):
         round(self.dv[0] * self.sv[1] - self.dv[1] * self.sv[0],SIG_FIGURES)
         ))
     
+    def _get_aabb(self):
+        """return the axis aligned bounding box, finite only along the axes the line is orthogonal to"""
+        min_corner = []
+        max_corner = []
+        for i in range(3):
+            if abs(self.dv[i]) < get_eps():
+                min_corner.append(self.sv[i])
+                max_corner.append(self.sv[i])
+            else:
+                min_corner.append(-INF)
+                max_corner.append(INF)
+        return AABB(min_corner, max_corner)
+
     def move(self, v):
         """Return the line that you get when you move self by vector v, self is also moved"""
         if isinstance(v,Vector):
-            self.sv[0] += v[0]
-            self.sv[1] += v[1]
-            self.sv[2] += v[2]
+            self._invalidate()
+            # a new support vector is made since it may be shared with the caller
+            self.sv = self.sv + v
             return Line(self.sv,self.dv)
         else:
             raise NotImplementedError("The second parameter for move function must be Vector")
 
+    def translated(self, v):
+        """Return the line that you get when you move self by vector v, self is not changed"""
+        if isinstance(v,Vector):
+            return Line(self.sv + v,self.dv)
+        else:
+            raise NotImplementedError("The second parameter for translated function must be Vector")
+
     def parametric(self):
         """Returns (s, u) so that you can build the equation for the line
            _   _    _
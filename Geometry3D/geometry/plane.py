@@ -3,9 +3,10 @@
 from .body import GeoBody
 from .point import Point,origin
 from .line import Line
-from ..utils.solver import solve
+from ..utils.solver import general_form_point,orthogonal_vectors
 from ..utils.vector import Vector,x_unit_vector,y_unit_vector,z_unit_vector
 from ..utils.constant import *
+from ..utils.aabb import AABB,INF
 class Plane(GeoBody):
     """
     - Plane(Point, Point, Point):
@@ -78,11 +79,9 @@ class Plane(GeoBody):
         """Initialise a plane given in the general form."""
         # We need
         # 1) a normal vector -> given by (a, b, c)
-        # 2) a point on the plane -> solve the equation and chose a
-        #    "random" point
-        solution = solve([[a, b, c, d]])
+        # 2) a point on the plane -> the one closest to the origin
+        self.p = Point.from_floats(*general_form_point(a, b, c, float(d)))
         self.n = Vector(a, b, c).normalized()
-        self.p = Point(*solution(1, 1))
 
     def __eq__(self, other):
         """Checks if two planes are equal. Two planes can be equal even
@@ -140,14 +139,31 @@ class Plane(GeoBody):
         """return the hash of a Plane"""
         return hash(("Plane",round(self.n[0],SIG_FIGURES),round(self.n[1],SIG_FIGURES),round(self.n[2],SIG_FIGURES),round(self.n * self.p.pv(),SIG_FIGURES)))
     
+    def _get_aabb(self):
+        """return the axis aligned bounding box, finite only for planes orthogonal to an axis"""
+        min_corner = [-INF, -INF, -INF]
+        max_corner = [INF, INF, INF]
+        for i in range(3):
+            if abs(self.n[i - 1]) < get_eps() and abs(self.n[i - 2]) < get_eps():
+                min_corner[i] = max_corner[i] = self.p[i]
+        return AABB(min_corner, max_corner)
+
     def move(self,v):
         """Return the plane that you get when you move self by vector v, self is also moved"""
         if isinstance(v,Vector):
-            self.p.move(v)
+            self._invalidate()
+            self.p = self.p.translated(v)
             return Plane(self.p,self.n)
         else:
             return NotImplementedError("The second parameter for move function must be Vector")
 
+    def translated(self,v):
+        """Return the plane that you get when you move self by vector v, self is not changed"""
+        if isinstance(v,Vector):
+            return Plane(self.p.translated(v),self.n)
+        else:
+            raise NotImplementedError("The second parameter for translated function must be Vector")
+
     def parametric(self):
         """Returns (u, v, w) so that you can build the equation
            _   _    _    _ 
@@ -155,21 +171,11 @@ class Plane(GeoBody):
 
         to describe the plane (a point and two vectors).
         """
-        s = solve([list(self.n) + [0]])
-        # Pick a first vector orthogonal to the normal vector
-        # there are infinitely many solutions, varying in direction
+        # Pick two vectors orthogonal to the normal vector and to each
+        # other, there are infinitely many solutions, varying in direction
         # and length, so just choose some values
-        v = Vector(*s(1, 1))
-        assert v.orthogonal(self.n)
-        # Pick a second vector orthogonal to the normal vector and
-        # orthogonal to the first vector (v)
-        # again, there are infinitely many solutions, varying in length
-        s = solve([
-            list(self.n) + [0],
-            list(v) + [0],
-        ])
-        w = Vector(*s(1))
-        return (self.p.pv(), v, w)
+        v, w = orthogonal_vectors(self.n)
+        return (self.p.pv(), Vector.from_floats(*v), Vector.from_floats(*w))
     
     def __neg__(self):
         """Return the negative plane, the normal is the negative normal"""
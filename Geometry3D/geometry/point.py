@@ -2,9 +2,13 @@
 """Point Module"""
 from ..utils.util import unify_types
 import math
-from ..utils.logger import get_main_logger
+import warnings
+from ..utils.logger import get_logger
 from ..utils.constant import get_sig_figures,get_eps
-from ..utils.vector import Vector
+from ..utils.vector import Vector,VectorArray
+from ..utils.aabb import AABB
+
+logger = get_logger(__name__)
 
 class Point(object):
     """
@@ -19,8 +23,27 @@ class Point(object):
     The point that you get when you move the origin by the given
     vector. If the vector has coordinates (a | b | c), the point
     will have the coordinates (a | b | c) (as easy as pi).
+
+    Points are immutable, so they can be shared by Segments, ConvexPolygons
+    and ConvexPolyhedrons without copying. Use translated to get a moved Point.
     """
     class_level = 0 # the class level of Point
+    __slots__ = ("x", "y", "z")
+
+    @classmethod
+    def from_floats(cls, x, y, z):
+        """Returns the Point (x | y | z)
+
+        This is the fast constructor, the coordinates are stored as they are
+        without type promotion or logging. They should be floats (or at least
+        share one numeric type), otherwise use Point(x, y, z).
+        """
+        point = object.__new__(cls)
+        _set_x(point, x)
+        _set_y(point, y)
+        _set_z(point, z)
+        return point
+
     @classmethod
     def origin(cls):
         """Returns the Point (0 | 0 | 0)"""
@@ -35,8 +58,11 @@ class Point(object):
         else:
             raise TypeError("Point() takes one or three arguments, not {}"
                     .format(len(args)))
-        self.x, self.y, self.z = unify_types(coords)
-        get_main_logger().debug('Create %s' %(self.__repr__(),))
+        x, y, z = unify_types(coords)
+        _set_x(self, x)
+        _set_y(self, y)
+        _set_z(self, z)
+        logger.debug('Create %s', self)
 
 
     def __repr__(self):
@@ -70,29 +96,134 @@ class Point(object):
         """return the i element of a Point"""
         return (self.x, self.y, self.z)[item]
 
+    def __iter__(self):
+        return iter((self.x, self.y, self.z))
+
     def __setitem__(self, item, value):
-        """set the i element of a Point"""
-        setattr(self, "xyz"[item], value)
-    
+        """Points are immutable, use translated instead"""
+        raise TypeError("Point is immutable, use translated to get a moved Point")
+
+    def __setattr__(self, name, value):
+        """Points are immutable, use translated instead"""
+        raise TypeError("Point is immutable, use translated to get a moved Point")
+
+    def __delattr__(self, name):
+        """Points are immutable"""
+        raise TypeError("Point is immutable")
+
+    def __reduce__(self):
+        # the coordinates cannot be set by the default unpickling
+        return (self.__class__.from_floats, (self.x, self.y, self.z))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+    def aabb(self):
+        """return the axis aligned bounding box of the point, which is the point itself"""
+        corner = (self.x, self.y, self.z)
+        return AABB(corner, corner)
 
     def pv(self):
         """Return the position vector of the point."""
-        return Vector(self.x, self.y, self.z)
+        return Vector.from_floats(self.x, self.y, self.z)
 
-    def move(self, v):
-        """Return the point that you get when you move self by vector v, self is also moved"""
+    def translated(self, v):
+        """Return the point that you get when you move self by vector v, self is not changed"""
         if isinstance(v,Vector):
-            self.x += v[0]
-            self.y += v[1]
-            self.z += v[2]
-            return Point(self.pv())
+            return Point.from_floats(self.x + v[0], self.y + v[1], self.z + v[2])
         else:
-            raise NotImplementedError("The second parameter for move function must be Vector")
+            raise NotImplementedError("The second parameter for translated function must be Vector")
+
+    def move(self, v):
+        """Deprecated, Points are immutable so self is not moved. Return the point that you get when you move self by vector v, use translated instead"""
+        warnings.warn("Point.move does not move the immutable Point any more, it returns a new Point. Use Point.translated instead",
+                DeprecationWarning, stacklevel=2)
+        return self.translated(v)
     
     def distance(self,other):
         """Return the distance between self and other"""
         return math.sqrt((self.x -other.x) ** 2 + (self.y -other.y) ** 2 + (self.z -other.z) ** 2)
 
+# Point blocks __setattr__, the constructors set the coordinates through the slots
+_set_x, _set_y, _set_z = Point.x.__set__, Point.y.__set__, Point.z.__set__
+
+class PointArray(object):
+    """
+    - PointArray(array):
+
+    N points stored as an (N,3) float64 numpy array.
+
+    - PointArray(points):
+
+    The same but initialised from an iterable of Points.
+
+    Subtracting two PointArrays gives a VectorArray and adding a Vector or
+    VectorArray moves all the points at once. Numpy is needed for this class.
+    """
+    def __init__(self, data):
+        from ..utils.util import as_coordinate_array
+        if isinstance(data, PointArray):
+            data = data.array
+        self.array = as_coordinate_array(data)
+
+    @classmethod
+    def from_points(cls, points):
+        """Returns the PointArray built from an iterable of Points"""
+        return cls(points)
+
+    def to_points(self):
+        """Returns a list of Points"""
+        return [Point.from_floats(*row) for row in self.array.tolist()]
+
+    def __len__(self):
+        return self.array.shape[0]
+
+    def __iter__(self):
+        return iter(self.to_points())
+
+    def __getitem__(self, item):
+        """return the i Point or a PointArray for slices and masks"""
+        if isinstance(item, int):
+            return Point.from_floats(*self.array[item].tolist())
+        return PointArray(self.array[item])
+
+    def __repr__(self):
+        return "PointArray({})".format(self.array.tolist())
+
+    def _other_array(self, other):
+        import numpy as np
+        if isinstance(other, (PointArray, VectorArray)):
+            return other.array
+        elif isinstance(other, (Point, Vector)):
+            return np.array(tuple(other), dtype=np.float64)
+        return other
+
+    def pv(self):
+        """Return the position vectors of the points."""
+        return VectorArray(self.array)
+
+    def __add__(self, other):
+        """Move all the points by a Vector or a VectorArray"""
+        if isinstance(other, (Vector, VectorArray)):
+            return PointArray(self.array + self._other_array(other))
+        return NotImplemented
+
+    def __sub__(self, other):
+        """PointArray - Point(Array) gives a VectorArray and PointArray - Vector(Array) gives a PointArray"""
+        if isinstance(other, (Point, PointArray)):
+            return VectorArray(self.array - self._other_array(other))
+        elif isinstance(other, (Vector, VectorArray)):
+            return PointArray(self.array - self._other_array(other))
+        return NotImplemented
+
+    def distance(self, other):
+        """Return the (N,) array of distances to a Point or a PointArray"""
+        return (self - other).length()
+
 origin = Point.origin
 
-__all__ = ("Point","origin")
+__all__ = ("Point","PointArray","origin")
@@ -8,14 +8,14 @@ from .segment import Segment
 from .plane import Plane
 from ..utils.constant import *
 from ..utils.vector import x_unit_vector,y_unit_vector
+from ..utils.aabb import AABB
 
-import copy
 import math
 
 def get_circle_point_list(center,normal,radius,n=10):
     if n <= 2:
         raise ValueError("n must be at least 3 to construct an inscribed polygon for a circle")
-    import math,copy
+    import math
     if normal.angle(x_unit_vector()) < SMALL_ANGLE:
         base_vector = y_unit_vector()
         if normal.angle(y_unit_vector()) < SMALL_ANGLE:
@@ -29,31 +29,9 @@ def get_circle_point_list(center,normal,radius,n=10):
     point_list = []
     for i in range(n):
         angle_i = math.pi * 2 / n * i
-        point_list.append(copy.deepcopy(center).move(v1 * math.cos(angle_i) + v2 * math.sin(angle_i)))
+        point_list.append(center.translated(v1 * math.cos(angle_i) + v2 * math.sin(angle_i)))
     return point_list
 
-def get_triangle_area(pa,pb,pc):
-    """
-    **Input:**
-    
-    - pa: a Point
-    
-    - pb: a Point
-    
-    - pc: a Point
-
-    **Output:**
-    
-    The area of the triangle composed by pa, pb and pc.
-
-    Heron's formula is used
-    """
-    a = pa.distance(pb)
-    b = pb.distance(pc)
-    c = pc.distance(pa)
-    p = (a + b + c) / 2
-    return math.sqrt(p * (p - a) * (p - b) * (p - c))
-
 class ConvexPolygon(GeoBody):
     """
     - ConvexPolygons(points)
@@ -110,16 +88,41 @@ class ConvexPolygon(GeoBody):
             else:
                 return cls((
                     base_point,
-                    copy.deepcopy(base_point).move(v1),
-                    copy.deepcopy(base_point).move(v2),
-                    copy.deepcopy(base_point).move(v1).move(v2)
+                    base_point.translated(v1),
+                    base_point.translated(v2),
+                    base_point.translated(v1).translated(v2)
                 ))
         else:
             raise TypeError("Parallelogram should be initialized with Point, Vector and Vector, but the given types are %s, %s and %s" %(type(base_point),type(v1),type(v2)))
     
+    @classmethod
+    def from_trusted(cls,points,plane=None):
+        """
+        A special function for creating a ConvexPolygon from points which are known to be valid
+
+        **Input:**
+
+        - points: the points of a convex polygon without duplicates, in counterclockwise order around the normal
+
+        - plane=None: the Plane of the polygon, by default its normal is computed from all the points by Newell's method
+
+        **Output:**
+
+        - A ConvexPolygon using the given points, which are neither copied, sorted nor checked. Call validate() to check them.
+        """
+        convex_polygon = cls.__new__(cls)
+        convex_polygon.points = tuple(points)
+        if len(convex_polygon.points) < 3:
+            raise ValueError('Cannot build a polygon with number of points smaller than 3')
+        convex_polygon.center_point = convex_polygon._get_center_point()
+        if plane is None:
+            plane = Plane(convex_polygon.points[0],convex_polygon._get_newell_normal())
+        convex_polygon.plane = plane
+        return convex_polygon
+
     def __init__(self,pts,reverse = False, check_convex=False):
-        # merge same points
-        points = copy.deepcopy(pts)
+        # merge same points, Points are immutable so they are shared instead of copied
+        points = list(pts)
         self.points = sorted(set(points),key=points.index)
         if len(points) < 3:
             raise ValueError('Cannot build a polygon with number of points smaller than 3')
@@ -176,17 +179,88 @@ class ConvexPolygon(GeoBody):
 
         **Output:**
         
-        - The area of the convex polygon
+        - The area of the convex polygon, which is cached until self is moved
+        """
+        return self._cached('area_centroid', self._get_area_centroid)[0]
+
+    def centroid(self):
+        """
+        **Input:**
+        
+        - self
+
+        **Output:**
+        
+        - The Point at the center of mass of the area, which is cached until self is moved
         """
-        area = 0
+        return self._cached('area_centroid', self._get_area_centroid)[1]
+
+    def _get_area_centroid(self):
+        """return the area and the centroid computed in one pass over the fan of triangles from the first point"""
+        x0, y0, z0 = self.points[0]
+        area = 0.0
+        cx, cy, cz = 0.0, 0.0, 0.0
+        for i in range(1, len(self.points) - 1):
+            ux, uy, uz = self.points[i].x - x0, self.points[i].y - y0, self.points[i].z - z0
+            vx, vy, vz = self.points[i + 1].x - x0, self.points[i + 1].y - y0, self.points[i + 1].z - z0
+            # half the length of the cross product is the area of the triangle
+            nx, ny, nz = uy * vz - uz * vy, uz * vx - ux * vz, ux * vy - uy * vx
+            triangle_area = math.sqrt(nx * nx + ny * ny + nz * nz) / 2
+            area += triangle_area
+            # the centroid of the triangle relative to the first point is (u + v) / 3
+            cx += triangle_area * (ux + vx)
+            cy += triangle_area * (uy + vy)
+            cz += triangle_area * (uz + vz)
+        if area == 0:
+            return (area, self.center_point)
+        return (area, Point(x0 + cx / (3 * area), y0 + cy / (3 * area), z0 + cz / (3 * area)))
+
+    def _get_newell_normal(self):
+        """return the normal of the points by Newell's method, its direction follows the counterclockwise order"""
+        cx, cy, cz = self.center_point
+        nx, ny, nz = 0.0, 0.0, 0.0
         for i in range(len(self.points)):
-            index_0 = i
-            if i == len(self.points) - 1:
-                index_1 = 0
-            else:
-                index_1 = i + 1
-            area += get_triangle_area(self.center_point,self.points[index_0],self.points[index_1])
-        return area
+            ax, ay, az = self.points[i - 1].x - cx, self.points[i - 1].y - cy, self.points[i - 1].z - cz
+            bx, by, bz = self.points[i].x - cx, self.points[i].y - cy, self.points[i].z - cz
+            nx += (ay - by) * (az + bz)
+            ny += (az - bz) * (ax + bx)
+            nz += (ax - bx) * (ay + by)
+        if nx == 0 and ny == 0 and nz == 0:
+            raise ValueError('Cannot build a polygon with all the points on a line')
+        return Vector(nx,ny,nz)
+
+    def validate(self):
+        """
+        **Input:**
+        
+        - self
+
+        **Output:**
+
+        - self, ValueError is raised if a point is repeated or not on the plane, or if the points are not in convex counterclockwise order around the normal
+        """
+        eps = get_eps()
+        if len(self.points) < 3:
+            raise ValueError('Cannot build a polygon with number of points smaller than 3')
+        if len(set(self.points)) != len(self.points):
+            raise ValueError('The points of the polygon are repeated')
+        for point in self.points:
+            if not point in self.plane:
+                raise ValueError('Convex Check Fails Because {} Is Not On {}'.format(point,self.plane))
+        n = self.plane.n
+        winding = 0.0
+        for i in range(len(self.points)):
+            u = self.points[i - 1].pv() - self.points[i - 2].pv()
+            v = self.points[i].pv() - self.points[i - 1].pv()
+            # the signed turning angle at points[i - 1] around n
+            turn = math.atan2(u.cross(v) * n,u * v)
+            if turn < -eps:
+                raise ValueError('Convex Check Fails Because The Points Are Not In Counterclockwise Order')
+            winding += turn
+        # a convex polygon winds around its normal exactly once
+        if abs(winding - 2 * math.pi) > 1e-6:
+            raise ValueError('Convex Check Fails Because The Points Wind {} Times'.format(winding / (2 * math.pi)))
+        return self
 
     def _check_and_sort_points(self):
         """
@@ -321,19 +395,35 @@ class ConvexPolygon(GeoBody):
             length += segment.length()
         return length
 
+    def _get_aabb(self):
+        """return the axis aligned bounding box of the points"""
+        return AABB.from_points(self.points)
+
     def move(self,v):
         """Return the ConvexPolygon that you get when you move self by vector v, self is also moved"""
         if isinstance(v,Vector):
-            point_list = []
-            for point in self.points:
-                point_list.append(point.move(v))
-            self.points = tuple(point_list)
-            self.plane = Plane(self.points[0],self.points[1],self.points[2])
+            self._invalidate()
+            # new points are made since the points may be shared with other polygons
+            self.points = tuple(Point.from_floats(point.x + v[0],point.y + v[1],point.z + v[2]) for point in self.points)
+            # the normal and the order of the points are kept by a translation
+            self.plane = Plane(self.points[0],self.plane.n)
             self.center_point = self._get_center_point()
-            return ConvexPolygon(self.points)
+            return self.__copy__()
         else:
             raise NotImplementedError("The second parameter for move function must be Vector")
 
+    def translated(self,v):
+        """Return the ConvexPolygon that you get when you move self by vector v, self is not changed"""
+        if isinstance(v,Vector):
+            points = tuple(point.translated(v) for point in self.points)
+            return self.from_trusted(points,Plane(points[0],self.plane.n))
+        else:
+            raise NotImplementedError("The second parameter for translated function must be Vector")
+
+    def __copy__(self):
+        """return a ConvexPolygon sharing the immutable points of self but not its cached data"""
+        return self.from_trusted(self.points,self.plane)
+
 Parallelogram = ConvexPolygon.Parallelogram
 Circle = ConvexPolygon.Circle
 
@@ -6,10 +6,15 @@ from .line import Line
 from .segment import Segment
 from .plane import Plane
 from .pyramid import Pyramid
+from .halfedge import HalfEdgeMesh
 from ..utils.vector import Vector,x_unit_vector,y_unit_vector,z_unit_vector
 from ..utils.constant import *
-from ..utils.logger import get_main_logger
+from ..utils.logger import get_logger
+from ..utils.aabb import AABB
 import copy
+
+logger = get_logger(__name__)
+
 class ConvexPolyhedron(GeoBody):
     class_level = 5 # the class level of ConvexPolyhedron
     """
@@ -46,7 +51,7 @@ class ConvexPolyhedron(GeoBody):
             elif v1.parallel(v2) or v1.parallel(v3) or v2.parallel(v3):
                 raise ValueError("The three vectors shouldn't be parallel to each other")
             else:
-                p_diag = copy.deepcopy(base_point).move(v1).move(v2).move(v3)
+                p_diag = base_point.translated(v1).translated(v2).translated(v3)
                 rectangle0=Parallelogram(base_point,v1,v2)
                 rectangle1=Parallelogram(base_point,v2,v3)
                 rectangle2=Parallelogram(base_point,v1,v3)
@@ -77,12 +82,11 @@ class ConvexPolyhedron(GeoBody):
 
         - An inscribed polyhedron of the given sphere.
         """
-        import copy
         import math
         cpg_list = []
         mc = get_circle_point_list(center = center,normal = z_unit_vector(),radius = radius,n=n1) # medium circle
-        top_point = copy.deepcopy(center).move(radius * z_unit_vector())
-        bottom_point = copy.deepcopy(center).move(-radius * z_unit_vector())
+        top_point = center.translated(radius * z_unit_vector())
+        bottom_point = center.translated(-radius * z_unit_vector())
         # heights=[]
         # radii = []
         tc = [] # top circles
@@ -92,13 +96,13 @@ class ConvexPolyhedron(GeoBody):
             height_i=radius * math.sin(angle_i)
             r_i=radius * math.cos(angle_i)
             tc.append(get_circle_point_list(
-                center = copy.deepcopy(center).move(height_i * z_unit_vector()),
+                center = center.translated(height_i * z_unit_vector()),
                 normal = z_unit_vector(),
                 radius = r_i,
                 n=n1
             ))
             bc.append(get_circle_point_list(
-                center = copy.deepcopy(center).move(-height_i * z_unit_vector()),
+                center = center.translated(-height_i * z_unit_vector()),
                 normal = z_unit_vector(),
                 radius = r_i,
                 n=n1
@@ -135,8 +139,7 @@ class ConvexPolyhedron(GeoBody):
 
         - An inscribed polyhedron of the given cylinder.
         """
-        import copy
-        top_point = copy.deepcopy(circle_center).move(height_vector)
+        top_point = circle_center.translated(height_vector)
         # print(top_point)
         bottom_circle = Circle(center=circle_center,normal=height_vector,radius=radius,n=n)
         bottom_circle_point_list = get_circle_point_list(center=circle_center,normal=height_vector,radius=radius,n=n)
@@ -169,8 +172,7 @@ class ConvexPolyhedron(GeoBody):
 
         - An inscribed polyhedron of the given cone.
         """
-        import copy
-        top_point = copy.deepcopy(circle_center).move(height_vector)
+        top_point = circle_center.translated(height_vector)
         # print(top_point)
         circle = Circle(center=circle_center,normal=height_vector,radius=radius,n=n)
         circle_point_list = get_circle_point_list(center=circle_center,normal=height_vector,radius=radius,n=n)
@@ -181,35 +183,230 @@ class ConvexPolyhedron(GeoBody):
             cpg_list.append(ConvexPolygon((top_point,circle_point_list[start],circle_point_list[end])))
         return cls(tuple(cpg_list))
 
-    def __init__(self,convex_polygons):
-        self.convex_polygons = list(copy.deepcopy(convex_polygons))
-        # self.convex_polygons = list(convex_polygons)
-        self.point_set = set()
-        self.segment_set = set()
-        self.pyramid_set = set()
-        
-        for convex_polygon in self.convex_polygons:    
+    @classmethod
+    def from_halfspaces(cls,planes):
+        """
+        A special function for creating the ConvexPolyhedron bounded by planes
+
+        **Input:**
+
+        - planes: an iterable of Planes whose normals point to the outside, a point x is in the half space of a plane when n * (x - p) <= 0
+
+        **Output:**
+
+        - A ConvexPolyhedron, redundant planes are dropped and the faces share their vertices. ValueError is raised if the intersection of the half spaces is empty, unbounded or flat.
+        """
+        from ..calc.halfspace import halfspace_intersection
+        return halfspace_intersection(planes)
+
+    @classmethod
+    def from_points(cls,points):
+        """
+        A special function for creating the convex hull of points
+
+        **Input:**
+
+        - points: a PointArray, an (N,3) array-like of coordinates or an iterable of Points
+
+        **Output:**
+
+        - The ConvexPolyhedron which is the convex hull of the points, computed by Quickhull with coplanar triangles merged into ConvexPolygons. ValueError is raised if the points do not span a solid.
+
+        Numpy is needed for this function, ImportError is raised without it.
+        """
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError("numpy is required by ConvexPolyhedron.from_points, install numpy to compute convex hulls")
+        from ..calc.hull import convex_hull
+        return convex_hull(points)
+
+    @classmethod
+    def from_trusted(cls,convex_polygons):
+        """
+        A special function for creating a ConvexPolyhedron from faces which are known to be valid
+
+        **Input:**
+
+        - convex_polygons: the ConvexPolygons of a closed convex polyhedron with their normals pointing to the outside
+
+        **Output:**
+
+        - A ConvexPolyhedron using the given ConvexPolygons, which are neither copied, turned nor checked. Call validate() to check them.
+        """
+        convex_polyhedron = cls.__new__(cls)
+        convex_polyhedron.convex_polygons = list(convex_polygons)
+        convex_polyhedron._support_hint = 0
+        return convex_polyhedron
+
+    @classmethod
+    def from_indexed(cls,vertices,faces):
+        """
+        A special function for creating a ConvexPolyhedron from a vertex buffer and face index lists
+
+        **Input:**
+
+        - vertices: a PointArray, a (V,3) array-like of coordinates or an iterable of Points
+
+        - faces: an iterable of index lists, the indices of the vertices of each face in order around the face
+
+        **Output:**
+
+        - A ConvexPolyhedron whose faces share one Point for each vertex. The normals are turned to the outside and the faces are checked like in ConvexPolyhedron(convex_polygons), ValueError is raised if a face is not planar or not convex.
+        """
+        if hasattr(vertices,'array'):
+            # a PointArray
+            vertices = vertices.array
+        if hasattr(vertices,'tolist'):
+            vertices = vertices.tolist()
+        points = [Point.from_floats(float(x),float(y),float(z)) for x,y,z in vertices]
+        # the faces are in order already, so they are checked instead of sorted again
+        return cls(ConvexPolygon.from_trusted([points[index] for index in face]).validate() for face in faces)
+
+    def to_indexed(self):
+        """
+        **Input:**
+
+        - self
+
+        **Output:**
+
+        - (vertices, faces), vertices is the (V,3) numpy array of the vertices and faces is a list of tuples with the indices of the vertices of each face, counterclockwise around the outer normal. ConvexPolyhedron.from_indexed(vertices, faces) builds the polyhedron again.
+
+        Numpy is needed for this function.
+        """
+        import numpy as np
+        coordinates,faces = self._get_indexed()
+        return np.array(coordinates,dtype=np.float64).reshape(-1,3),list(faces)
+
+    def half_edges(self):
+        """
+        **Input:**
+
+        - self
+
+        **Output:**
+
+        - The HalfEdgeMesh of self with the vertex and face adjacency, which is built on first use and cached until self is moved. The faces are numbered like self.convex_polygons.
+        """
+        return self._cached('half_edges', lambda: HalfEdgeMesh(*self._get_indexed()))
+
+    def support(self,direction,hint=None):
+        """
+        **Input:**
+
+        - direction: a Vector or a tuple
+
+        - hint=None: the index of a vertex of self.half_edges() to start from, by default the vertex found by the previous call
+
+        **Output:**
+
+        - The vertex of self farthest in direction as a Point. The vertex adjacency of half_edges() is climbed from the hint, so when the direction changes little between calls only a few vertices are visited. ValueError is raised if hint is not a vertex index.
+        """
+        mesh = self.half_edges()
+        count = len(mesh.vertices)
+        if hint is None:
+            hint = self._support_hint if self._support_hint < count else 0
+        elif not 0 <= hint < count:
+            raise ValueError('The hint {} is not the index of one of the {} vertices'.format(hint, count))
+        index = mesh.extreme_vertex(direction,hint)
+        # the vertices keep their indices when self is moved, so the hint stays useful
+        self._support_hint = index
+        return Point.from_floats(*mesh.vertices[index])
+
+    def _get_indexed(self):
+        """return the vertex coordinates and the face index tuples, the vertices are matched by their rounded coordinates"""
+        return self._cached('indexed', self._get_indexed_lists)
+
+    def _get_indexed_lists(self):
+        sig_figures = get_sig_figures()
+        indices = dict() # dict[rounded coordinates] = index of the vertex
+        coordinates = []
+        faces = []
+        for convex_polygon in self.convex_polygons:
+            face = []
             for point in convex_polygon.points:
-                self.point_set.add(point)
-            for segment in convex_polygon.segments():
-                self.segment_set.add(segment)
-        
-        self.center_point = self._get_center_point()
+                key = (round(point.x,sig_figures),round(point.y,sig_figures),round(point.z,sig_figures))
+                index = indices.get(key)
+                if index is None:
+                    index = indices[key] = len(coordinates)
+                    coordinates.append((point.x,point.y,point.z))
+                face.append(index)
+            faces.append(tuple(face))
+        return coordinates,faces
 
-        for i in range(len(self.convex_polygons)):
-            convex_polygon = self.convex_polygons[i]
-            if Vector(self.center_point,convex_polygon.plane.p) * convex_polygon.plane.n < -get_eps():
-                self.convex_polygons[i] = - convex_polygon
-            self.pyramid_set.add(Pyramid(convex_polygon,self.center_point,direct_call=False))
+    def __init__(self,convex_polygons):
+        # shallow copies share the immutable points, so moving self does not move the given polygons
+        self.convex_polygons = [copy.copy(convex_polygon) for convex_polygon in convex_polygons]
+        # the vertex found by the last call of support, where the next call starts
+        self._support_hint = 0
+        # the point_set, segment_set, pyramid_set and center_point are computed on first use
+        self._orient_polygons()
         if not self._check_normal():
             raise ValueError('Check Normal Fails For The Convex Polyhedron')
         if not self._euler_check():
-            get_main_logger().critical('V:{} E:{} F:{}'.format(len(self.point_set),len(self.segment_set),len(self.convex_polygons)))
+            logger.critical('V:%d E:%d F:%d', len(self.point_set), len(self.segment_set), len(self.convex_polygons))
             raise ValueError('Check for the number of vertices, faces and edges fails, the polyhedron may not be closed')
 
+    def _orient_polygons(self):
+        """turn the normals of the polygons to the outside, the center point must not be on a face"""
+        eps = get_eps()
+        center_point = self.center_point
+        flipped = False
+        for i in range(len(self.convex_polygons)):
+            convex_polygon = self.convex_polygons[i]
+            height = Vector(center_point,convex_polygon.plane.p) * convex_polygon.plane.n
+            if abs(height) < eps:
+                raise ValueError('Cannot build a ConvexPolyhedron with the center point on the plane of a face')
+            if height < 0:
+                self.convex_polygons[i] = - convex_polygon
+                flipped = True
+        if flipped:
+            # the flipped polygons are new objects in a new order
+            self._invalidate()
+
+    @property
+    def point_set(self):
+        """the set of the vertices, built on first use"""
+        return self._cached('point_set', lambda: set(self._get_vertices().values()))
+
+    @property
+    def segment_set(self):
+        """the set of the edges as Segments, built on first use"""
+        return self._cached('segment_set', lambda: set(segment for convex_polygon in self.convex_polygons for segment in convex_polygon.segments()))
+
+    @property
+    def pyramid_set(self):
+        """the set of Pyramids from the center point to the faces, built on first use"""
+        return self._cached('pyramid_set', lambda: set(Pyramid(convex_polygon,self.center_point,direct_call=False) for convex_polygon in self.convex_polygons))
+
+    @property
+    def center_point(self):
+        """the mean of the vertices, computed on first use"""
+        return self._cached('center_point', self._get_center_point)
+
+    def _get_vertices(self):
+        """return a dict of the vertices keyed by their coordinates rounded like in the hash of Point"""
+        return self._cached('vertices', self._get_vertex_dict)
+
+    def _get_vertex_dict(self):
+        sig_figures = get_sig_figures()
+        vertices = dict()
+        for convex_polygon in self.convex_polygons:
+            for point in convex_polygon.points:
+                vertices.setdefault((round(point.x,sig_figures),round(point.y,sig_figures),round(point.z,sig_figures)),point)
+        return vertices
+
     def _euler_check(self):
-        number_points = len(self.point_set)
-        number_segments = len(self.segment_set)
+        """return True if V - E + F == 2, the vertices and edges are counted by their rounded coordinates"""
+        sig_figures = get_sig_figures()
+        edges = set()
+        for convex_polygon in self.convex_polygons:
+            keys = [(round(point.x,sig_figures),round(point.y,sig_figures),round(point.z,sig_figures)) for point in convex_polygon.points]
+            for i in range(len(keys)):
+                edges.add(frozenset((keys[i - 1],keys[i])))
+        number_points = len(self._get_vertices())
+        number_segments = len(edges)
         number_polygons = len(self.convex_polygons)
         return number_points - number_segments + number_polygons == 2
 
@@ -220,6 +417,32 @@ class ConvexPolyhedron(GeoBody):
                 return False
         return True
     
+    def validate(self):
+        """
+        **Input:**
+        
+        - self
+
+        **Output:**
+
+        - self, ValueError is raised if a face is not a valid ConvexPolygon, if a vertex is outside the plane of a face, if a normal does not point to the outside or if the faces are not closed according to Euler's formula
+        """
+        eps = get_eps()
+        for convex_polygon in self.convex_polygons:
+            convex_polygon.validate()
+        center_point = self.center_point
+        for convex_polygon in self.convex_polygons:
+            if Vector(center_point,convex_polygon.plane.p) * convex_polygon.plane.n < eps:
+                raise ValueError('Check Normal Fails For The Convex Polyhedron')
+        vertices = list(self._get_vertices().values())
+        for n, offset in self.halfspaces():
+            for point in vertices:
+                if n[0] * point.x + n[1] * point.y + n[2] * point.z - offset > eps:
+                    raise ValueError('Convex Check Fails Because {} Is Outside A Face'.format(point))
+        if not self._euler_check():
+            raise ValueError('Check for the number of vertices, faces and edges fails, the polyhedron may not be closed')
+        return self
+
     def _get_center_point(self):
         """
         **Input:**
@@ -231,8 +454,9 @@ class ConvexPolyhedron(GeoBody):
         - The center point of this point set
         """
         x,y,z = 0,0,0
-        num_points = len(self.point_set)
-        for point in self.point_set:
+        vertices = self._get_vertices()
+        num_points = len(vertices)
+        for point in vertices.values():
             x += point.x
             y += point.y
             z += point.z
@@ -252,9 +476,10 @@ class ConvexPolyhedron(GeoBody):
         - Whether the polyhedron contains the point
         """
         if isinstance(other,Point):
-            for polygon in self.convex_polygons:
-                direction_vector = Vector(polygon.center_point,other)
-                if direction_vector * polygon.plane.n > get_eps():
+            eps = get_eps()
+            x, y, z = other.x, other.y, other.z
+            for n, offset in self.halfspaces():
+                if n[0] * x + n[1] * y + n[2] * z - offset > eps:
                     return False
             return True
 
@@ -275,38 +500,100 @@ class ConvexPolyhedron(GeoBody):
         else:
             return False
 
+    def _get_aabb(self):
+        """return the axis aligned bounding box of the vertices"""
+        return AABB.from_points(self.point_set)
+
+    def halfspaces(self):
+        """
+        **Input:**
+
+        - self
+
+        **Output:**
+
+        - A tuple of (n, offset) for the faces, n is the outer unit normal as a tuple and a point x is inside the face's half space when n * x <= offset. The result is cached until self is moved.
+        """
+        return self._cached('halfspaces', self._get_halfspaces)
+
+    def _get_halfspaces(self):
+        halfspaces = []
+        for polygon in self.convex_polygons:
+            n = tuple(polygon.plane.n)
+            p = polygon.plane.p
+            halfspaces.append((n, n[0] * p.x + n[1] * p.y + n[2] * p.z))
+        return tuple(halfspaces)
+
+    def plane_matrix(self):
+        """
+        **Input:**
+
+        - self
+
+        **Output:**
+
+        - An (F,4) numpy array, the row of a face is (nx, ny, nz, -offset) so that (x, y, z, 1) is inside the face's half space when its dot product with the row is not positive. The result is cached until self is moved.
+
+        Numpy is needed for this method.
+        """
+        return self._cached('plane_matrix', self._get_plane_matrix)
+
+    def _get_plane_matrix(self):
+        import numpy as np
+        return np.array([n + (-offset,) for n, offset in self.halfspaces()], dtype=np.float64)
+
+    def contains_points(self, points, chunk_size=65536):
+        """
+        **Input:**
+
+        - points: a PointArray, an (N,3) array-like of coordinates or an iterable of Points
+
+        - chunk_size: the number of points classified by one matrix multiplication
+
+        **Output:**
+
+        - An (N,) boolean numpy array telling whether each point is in the polyhedron, with the same tolerance as the in operator
+
+        Numpy is required for this method, the points are classified with the numpy array of plane_matrix.
+        """
+        import numpy as np
+        from .point import PointArray
+        from ..utils.util import as_coordinate_array
+        if isinstance(points, PointArray):
+            points = points.array
+        points = as_coordinate_array(points)
+        matrix = self.plane_matrix()
+        normals, offsets = matrix[:, :3].T, matrix[:, 3]
+        eps = get_eps()
+        inside = np.empty(points.shape[0], dtype=bool)
+        for start in range(0, points.shape[0], chunk_size):
+            distances = points[start:start + chunk_size] @ normals + offsets
+            inside[start:start + chunk_size] = distances.max(axis=1, initial=-np.inf) <= eps
+        return inside
+
     def move(self,v):
         """Return the ConvexPolyhedron that you get when you move self by vector v, self is also moved"""
         if isinstance(v,Vector):
-            convexpolygon_list = []
             for convexpolygon in self.convex_polygons:
-                convexpolygon_list.append(convexpolygon.move(v))
-            self.convex_polygons = tuple(convexpolygon_list)   
-            self.point_set = set()
-            self.segment_set = set()
-            self.pyramid_set = set()
-            for convex_polygon in self.convex_polygons: 
-                for point in convex_polygon.points:
-                    self.point_set.add(point)
-                for segment in convex_polygon.segments():
-                    self.segment_set.add(segment)
-        
-            self.center_point = self._get_center_point()
-
-            for i in range(len(self.convex_polygons)):
-                convex_polygon = self.convex_polygons[i]
-                if Vector(self.center_point,convex_polygon.plane.p) * convex_polygon.plane.n < -get_eps():
-                    self.convex_polygons[i] = - convex_polygon
-                self.pyramid_set.add(Pyramid(convex_polygon,self.center_point,direct_call=False))
-            if not self._check_normal():
-                raise ValueError('Check Normal Fails For The Convex Polyhedron')
-            if not self._euler_check():
-                get_main_logger().critical('V:{} F:{} E:{}'.format(len(self.point_set),len(self.segment_set),len(self.convex_polygons)))
-                raise ValueError('Check for the number of vertices, faces and edges fails, the polyhedron may not be closed')
-            return ConvexPolyhedron(self.convex_polygons)
+                convexpolygon.move(v)
+            # a translation keeps the faces valid, only the derived data is out of date
+            self._invalidate()
+            return self.__copy__()
         else:
             raise NotImplementedError("The second parameter for move function must be Vector")
 
+    def translated(self,v):
+        """Return the ConvexPolyhedron that you get when you move self by vector v, self is not changed"""
+        if isinstance(v,Vector):
+            # a translation keeps the faces valid, so they are not checked again
+            return self.from_trusted([convexpolygon.translated(v) for convexpolygon in self.convex_polygons])
+        else:
+            raise NotImplementedError("The second parameter for translated function must be Vector")
+
+    def __copy__(self):
+        """return a ConvexPolyhedron with copies of the faces of self, so that moving it does not change self"""
+        return self.from_trusted([copy.copy(convexpolygon) for convexpolygon in self.convex_polygons])
+
     def _get_polygon_hash_sum(self):
         """return the sum of hash value of all the ConvexPolygons"""
         hash_sum = 0
@@ -342,18 +629,41 @@ class ConvexPolyhedron(GeoBody):
         return l
 
     def area(self):
-        """return the total area of the polyhedron"""
-        a = 0
-        for polygon in self.convex_polygons:
-            a += polygon.area()
-        return a
+        """return the total area of the polyhedron, which is cached until self is moved"""
+        return self._cached('mass_properties', self._get_mass_properties)[0]
 
     def volume(self):
-        """return the total volume of the polyhedron"""
-        v = 0
-        for pyramid in self.pyramid_set:
-            v += pyramid.volume()
-        return v
+        """return the total volume of the polyhedron, which is cached until self is moved"""
+        return self._cached('mass_properties', self._get_mass_properties)[1]
+
+    def centroid(self):
+        """return the Point at the center of mass of the volume, which is cached until self is moved"""
+        return self._cached('mass_properties', self._get_mass_properties)[2]
+
+    def _get_mass_properties(self):
+        """
+        return the area, volume and centroid computed in one pass over the faces, every face is the
+        base of a pyramid with the apex at the center point, the height is the distance from
+        the center point to the plane of the face
+        """
+        cx, cy, cz = self.center_point
+        area = 0.0
+        volume = 0.0
+        mx, my, mz = 0.0, 0.0, 0.0
+        for polygon in self.convex_polygons:
+            face_area = polygon.area()
+            n = polygon.plane.n
+            p = polygon.plane.p
+            height = abs(n[0] * (p.x - cx) + n[1] * (p.y - cy) + n[2] * (p.z - cz))
+            pyramid_volume = face_area * height / 3
+            area += face_area
+            volume += pyramid_volume
+            # the centroid of a pyramid is 3 / 4 of the way from the apex to the centroid of the base
+            centroid = polygon.centroid()
+            mx += pyramid_volume * (centroid.x - cx)
+            my += pyramid_volume * (centroid.y - cy)
+            mz += pyramid_volume * (centroid.z - cz)
+        return (area, volume, Point(cx + 0.75 * mx / volume, cy + 0.75 * my / volume, cz + 0.75 * mz / volume))
 
 Parallelepiped = ConvexPolyhedron.Parallelepiped
 Cone = ConvexPolyhedron.Cone
@@ -5,7 +5,10 @@ from .point import Point
 from ..utils.vector import Vector
 from .line import Line
 from .polygon import ConvexPolygon
-from ..utils.logger import get_main_logger
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
 # Pyramid is an auxilary geometry
 # Direct use is not suggested
 # Calculation of pyramids should be applied using ConvexPolygon
@@ -20,7 +23,7 @@ class Pyramid(GeoBody):
     """
     def __init__(self,cp,p,direct_call=True):
         if direct_call:
-            get_main_logger().warning('Pyramid is an auxilary geometry. Direct use is not suggested. Consider using ConvexPolyhedron instead.')
+            logger.warning('Pyramid is an auxilary geometry. Direct use is not suggested. Consider using ConvexPolyhedron instead.')
         if isinstance(cp,ConvexPolygon) and isinstance(p,Point):
             self.convex_polygon = cp
             self.point = p
@@ -32,6 +35,10 @@ class Pyramid(GeoBody):
     def __repr__(self):
         return "Pyramid({}, {})".format(self.convex_polygon, self.point)
     
+    def _get_aabb(self):
+        """return the axis aligned bounding box of the polygon and the apex"""
+        return self.convex_polygon.aabb().union(self.point.aabb())
+
     def height(self):
         """ return the height of the pyramid"""
         p0 = self.convex_polygon.points[0]
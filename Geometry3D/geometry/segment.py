@@ -6,9 +6,12 @@ from .plane import Plane
 from ..utils.vector import Vector
 from .line import Line
 from ..utils.constant import get_eps
-from ..utils.logger import get_main_logger
+from ..utils.logger import get_logger
+from ..utils.aabb import AABB
 import math
-import copy
+
+logger = get_logger(__name__)
+
 class Segment(GeoBody):
     """
     **Input:**
@@ -19,8 +22,7 @@ class Segment(GeoBody):
     """
     class_level = 3 # the class level of Segment
     def __init__(self,a,b):
-        a = copy.deepcopy(a)
-        b = copy.deepcopy(b)
+        # Points are immutable so they are shared instead of copied
         if isinstance(a,Point) and isinstance(b,Point):
             if a == b:
                 raise ValueError("Cannot initialize a Segment with two identical Points")
@@ -60,7 +62,7 @@ class Segment(GeoBody):
         elif isinstance(other,Segment):
             return (other.start_point in self) and (other.end_point in self)
         else:
-            get_main_logger().warning("Calling type {} in type {} which is always False".format(type(other),type(self)))
+            logger.warning("Calling type %s in type %s which is always False", type(other), type(self))
             return False
 
     def in_(self,other):
@@ -85,6 +87,7 @@ class Segment(GeoBody):
 
     def __setitem__(self,idx,value):
         """set the i point of the segment"""
+        self._invalidate()
         if idx == 0:
             self.start_point = value
         elif idx == 1:
@@ -92,15 +95,28 @@ class Segment(GeoBody):
         else:
             raise IndexError("Index out of range")
 
+    def _get_aabb(self):
+        """return the axis aligned bounding box of the two end points"""
+        return AABB.from_points((self.start_point, self.end_point))
+
     def move(self, v):
         """Return the Segment that you get when you move self by vector v, self is also moved"""
         if isinstance(v,Vector):
-            self.start_point.move(v)
-            self.end_point.move(v)
+            self._invalidate()
+            self.start_point = self.start_point.translated(v)
+            self.end_point = self.end_point.translated(v)
+            self.line = Line(self.start_point,self.end_point)
             return Segment(self.start_point,self.end_point)
         else:
             raise NotImplementedError("The second parameter for move function must be Vector")
 
+    def translated(self, v):
+        """Return the Segment that you get when you move self by vector v, self is not changed"""
+        if isinstance(v,Vector):
+            return Segment(self.start_point.translated(v),self.end_point.translated(v))
+        else:
+            raise NotImplementedError("The second parameter for translated function must be Vector")
+
     def parametric(self):
         """Returns (start_point, end_point) so that you can build the information for the segment
         """
@@ -0,0 +1,5 @@
+from .bvh import BVH
+from .broad_phase import overlapping_pairs,intersect_all
+
+
+__all__ = ('BVH','overlapping_pairs','intersect_all',)
\ No newline at end of file
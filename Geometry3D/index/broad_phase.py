@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""
+Broad Phase Module
+
+Finds the pairs of bodies whose bounding boxes overlap by sweep and prune,
+so that the intersection functions only run on candidate pairs.
+"""
+from ..calc.intersection import narrow_phase_intersection
+from ..utils.constant import get_eps
+
+def _sweep_axis(boxes):
+    """return the axis along which the box centers spread the most"""
+    best_axis, best_spread = 0, -1.0
+    for axis in range(3):
+        centers = [(box.min_corner[axis] + box.max_corner[axis]) / 2 for box in boxes]
+        centers = [c for c in centers if abs(c) < float('inf')]
+        if len(centers) == 0:
+            continue
+        spread = max(centers) - min(centers)
+        if spread > best_spread:
+            best_axis, best_spread = axis, spread
+    return best_axis
+
+def overlapping_pairs(bodies):
+    """
+    **Input:**
+
+    - bodies: a sequence of GeoBodys or Points
+
+    **Output:**
+
+    A generator of the pairs (i, j) with i < j whose bounding boxes overlap
+
+    The boxes are sorted by their lower bound along the axis with the largest
+    spread and swept once, only the pairs overlapping along that axis are
+    checked on all three axes.
+    """
+    boxes = [body.aabb() for body in bodies]
+    if len(boxes) < 2:
+        return
+    axis = _sweep_axis(boxes)
+    eps = get_eps()
+    order = sorted(range(len(boxes)), key=lambda i: boxes[i].min_corner[axis])
+    active = []
+    for i in order:
+        box = boxes[i]
+        lower = box.min_corner[axis] - eps
+        active = [j for j in active if boxes[j].max_corner[axis] >= lower]
+        for j in active:
+            if box.overlaps(boxes[j]):
+                yield (j, i) if j < i else (i, j)
+        active.append(i)
+
+def intersect_all(bodies):
+    """
+    **Input:**
+
+    - bodies: a sequence of GeoBodys or Points
+
+    **Output:**
+
+    A generator of the tuples (i, j, result) with i < j for every pair of
+    bodies that intersect, where result is intersection(bodies[i], bodies[j])
+    """
+    for i, j in overlapping_pairs(bodies):
+        result = narrow_phase_intersection(bodies[i], bodies[j])
+        if result is not None:
+            yield (i, j, result)
+
+__all__ = ('overlapping_pairs', 'intersect_all')
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+"""
+BVH Module
+
+A bounding volume hierarchy over ConvexPolygons for HalfLine, Segment and
+Line queries in logarithmic time.
+"""
+from ..geometry.segment import Segment
+from ..geometry.polygon import ConvexPolygon
+from ..geometry.polyhedron import ConvexPolyhedron
+from ..calc.intersection import intersection
+from ..calc.clip import linear_parameters, clip_interval_aabb
+from ..utils.aabb import INF
+
+class _BVHNode(object):
+    """A node of the BVH, leaves have faces in [start, end) and no children"""
+    __slots__ = ("min_corner", "max_corner", "left", "right", "start", "end")
+
+    def __init__(self, box, start, end):
+        self.min_corner = box.min_corner
+        self.max_corner = box.max_corner
+        self.left = None
+        self.right = None
+        self.start = start
+        self.end = end
+
+class BVH(object):
+    """
+    - BVH(bodies, leaf_size=4)
+
+    A bounding volume hierarchy over ConvexPolygons.
+
+    bodies: an iterable of ConvexPolygons and ConvexPolyhedrons, the faces of the
+    ConvexPolyhedrons are put into the hierarchy one by one.
+
+    Queries return hits as tuples (body, face, intersection), where body is the
+    ConvexPolygon or ConvexPolyhedron given at construction and face is the
+    ConvexPolygon that is hit.
+    """
+    def __init__(self, bodies, leaf_size=4):
+        self.bodies = []
+        self.faces = []
+        self._owners = [] # index of the body of each face
+        for body in bodies:
+            if isinstance(body,ConvexPolyhedron):
+                faces = body.convex_polygons
+            elif isinstance(body,ConvexPolygon):
+                faces = (body,)
+            else:
+                raise TypeError('Cannot build BVH with type:%s' % (type(body),))
+            for face in faces:
+                self.faces.append(face)
+                self._owners.append(len(self.bodies))
+            self.bodies.append(body)
+        self.leaf_size = max(1, leaf_size)
+        if len(self.faces) == 0:
+            self.root = None
+            return
+        boxes = [face.aabb() for face in self.faces]
+        centers = [box.center() for box in boxes]
+        order = list(range(len(self.faces)))
+        self.root = self._build(order, 0, len(order), boxes, centers)
+        self.faces = [self.faces[i] for i in order]
+        self._owners = [self._owners[i] for i in order]
+
+    def _build(self, order, start, end, boxes, centers):
+        """build the node for order[start:end], sorting the slice in place"""
+        box = boxes[order[start]]
+        for i in range(start + 1, end):
+            box = box.union(boxes[order[i]])
+        node = _BVHNode(box, start, end)
+        if end - start <= self.leaf_size:
+            return node
+        # split at the median of the centers along the longest axis
+        lower = [min(centers[order[i]][axis] for i in range(start, end)) for axis in range(3)]
+        upper = [max(centers[order[i]][axis] for i in range(start, end)) for axis in range(3)]
+        spread = [upper[axis] - lower[axis] for axis in range(3)]
+        axis = spread.index(max(spread))
+        order[start:end] = sorted(order[start:end], key=lambda i: centers[i][axis])
+        middle = (start + end) // 2
+        node.left = self._build(order, start, middle, boxes, centers)
+        node.right = self._build(order, middle, end, boxes, centers)
+        return node
+
+    def __len__(self):
+        return len(self.faces)
+
+    def _hit(self, query, index, p, d):
+        """return (t, hit) if query hits the face index, None else"""
+        inter = intersection(query, self.faces[index])
+        if inter is None:
+            return None
+        if isinstance(inter,Segment):
+            points = (inter.start_point, inter.end_point)
+        else:
+            points = (inter,)
+        dd = d[0] * d[0] + d[1] * d[1] + d[2] * d[2]
+        t = min(((q[0] - p[0]) * d[0] + (q[1] - p[1]) * d[1] + (q[2] - p[2]) * d[2]) / dd for q in points)
+        face = self.faces[index]
+        return (t, (self.bodies[self._owners[index]], face, inter))
+
+    def all_hits(self, query):
+        """
+        **Input:**
+
+        - query: a HalfLine, Segment or Line
+
+        **Output:**
+
+        A list of hits (body, face, intersection) sorted along the query
+        """
+        if self.root is None:
+            return []
+        p, d, t_min, t_max = linear_parameters(query)
+        hits = []
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if clip_interval_aabb(p, d, t_min, t_max, node.min_corner, node.max_corner) is None:
+                continue
+            if node.left is None:
+                for index in range(node.start, node.end):
+                    hit = self._hit(query, index, p, d)
+                    if hit is not None:
+                        hits.append(hit)
+            else:
+                stack.append(node.left)
+                stack.append(node.right)
+        hits.sort(key=lambda hit: hit[0])
+        return [hit for _, hit in hits]
+
+    def first_hit(self, query):
+        """
+        **Input:**
+
+        - query: a HalfLine, Segment or Line
+
+        **Output:**
+
+        The first hit (body, face, intersection) along the query, None if nothing is hit
+        """
+        if self.root is None:
+            return None
+        p, d, t_min, t_max = linear_parameters(query)
+        best_t = INF
+        best = None
+        # nodes are visited near to far and skipped once they start behind the best hit
+        interval = clip_interval_aabb(p, d, t_min, t_max, self.root.min_corner, self.root.max_corner)
+        stack = [] if interval is None else [(interval[0], self.root)]
+        while stack:
+            t_enter, node = stack.pop()
+            if t_enter > best_t:
+                continue
+            if node.left is None:
+                for index in range(node.start, node.end):
+                    hit = self._hit(query, index, p, d)
+                    if hit is not None and hit[0] < best_t:
+                        best_t, best = hit
+                continue
+            children = []
+            for child in (node.left, node.right):
+                interval = clip_interval_aabb(p, d, t_min, t_max, child.min_corner, child.max_corner)
+                if interval is not None and interval[0] <= best_t:
+                    children.append((interval[0], child))
+            # push the far child first so that the near one is popped first
+            children.sort(key=lambda child: -child[0])
+            stack.extend(children)
+        return best
+
+__all__ = ('BVH',)
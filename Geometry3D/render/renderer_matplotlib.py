@@ -4,7 +4,10 @@ from ..geometry.segment import Segment
 from ..geometry.polygon import ConvexPolygon
 from ..geometry.polyhedron import ConvexPolyhedron
 from .arrow import Arrow
-from ..utils.logger import get_main_logger
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
 class MatplotlibRenderer():
     """ Renderer module to visualize geometries"""
     def __init__(self):
@@ -25,7 +28,7 @@ class MatplotlibRenderer():
         from mpl_toolkits.mplot3d import Axes3D
         fig = plt.figure()
         ax = Axes3D(fig)
-        get_main_logger().info('Showing geometries with %d points, %d segments, %d arrows using matplotlib' %(len(self.point_set),len(self.segment_set),len(self.arrow_set)))
+        logger.info('Showing geometries with %d points, %d segments, %d arrows using matplotlib', len(self.point_set), len(self.segment_set), len(self.arrow_set))
         for point_tuple in self.point_set:
             point = point_tuple[0]
             color = point_tuple[1]
@@ -1,10 +1,14 @@
-from .solver import solve
-from .vector import Vector,x_unit_vector,y_unit_vector,z_unit_vector
+from .solver import solve,solve_batch
+from .vector import Vector,VectorArray,x_unit_vector,y_unit_vector,z_unit_vector
 from .constant import set_eps,get_eps,get_sig_figures,set_sig_figures,SMALL_ANGLE
-from .logger import set_log_level,get_main_logger
+from .aabb import AABB
+from .logger import set_log_level,get_main_logger,get_logger
 __all__=(
     "solve",
+    "solve_batch",
     "Vector",
+    "VectorArray",
+    "AABB",
     "x_unit_vector",
     "y_unit_vector",
     "z_unit_vector",
@@ -14,5 +18,6 @@ __all__=(
     "get_sig_figures",
     "set_sig_figures",
     "set_log_level",
-    "get_main_logger"
+    "get_main_logger",
+    "get_logger"
 )
\ No newline at end of file
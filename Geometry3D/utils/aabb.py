@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""AABB Module, axis aligned bounding boxes"""
+from .constant import get_eps
+
+INF = float('inf')
+
+class AABB(object):
+    """
+    - AABB(min_corner, max_corner):
+
+    The axis aligned box between the two corners, which are tuples of 3
+    coordinates. Unbounded bodies like Line and Plane use infinite coordinates.
+    """
+    __slots__ = ("min_corner", "max_corner")
+
+    @classmethod
+    def infinite(cls):
+        """Returns the box covering the whole space"""
+        return cls((-INF, -INF, -INF), (INF, INF, INF))
+
+    @classmethod
+    def from_points(cls, points):
+        """Returns the smallest box containing all the points"""
+        xs, ys, zs = zip(*((p.x, p.y, p.z) for p in points))
+        return cls((min(xs), min(ys), min(zs)), (max(xs), max(ys), max(zs)))
+
+    def __init__(self, min_corner, max_corner):
+        self.min_corner = tuple(min_corner)
+        self.max_corner = tuple(max_corner)
+
+    def __repr__(self):
+        return "AABB({}, {})".format(self.min_corner, self.max_corner)
+
+    def __eq__(self, other):
+        if isinstance(other, AABB):
+            return self.min_corner == other.min_corner and self.max_corner == other.max_corner
+        else:
+            return False
+
+    def __hash__(self):
+        return hash(("AABB", self.min_corner, self.max_corner))
+
+    def overlaps(self, other):
+        """Returns whether the two boxes overlap or touch within eps"""
+        eps = get_eps()
+        a_min, a_max = self.min_corner, self.max_corner
+        b_min, b_max = other.min_corner, other.max_corner
+        return (a_min[0] <= b_max[0] + eps and b_min[0] <= a_max[0] + eps and
+                a_min[1] <= b_max[1] + eps and b_min[1] <= a_max[1] + eps and
+                a_min[2] <= b_max[2] + eps and b_min[2] <= a_max[2] + eps)
+
+    def union(self, other):
+        """Returns the smallest box containing both boxes"""
+        return AABB(
+            tuple(min(a, b) for a, b in zip(self.min_corner, other.min_corner)),
+            tuple(max(a, b) for a, b in zip(self.max_corner, other.max_corner))
+        )
+
+    def is_bounded(self):
+        """Returns whether all the coordinates are finite"""
+        return all(abs(c) < INF for c in self.min_corner + self.max_corner)
+
+    def center(self):
+        """Returns the center of the box as a tuple"""
+        return tuple((a + b) / 2 for a, b in zip(self.min_corner, self.max_corner))
+
+    def extent(self):
+        """Returns the size of the box along the three axes as a tuple"""
+        return tuple(b - a for a, b in zip(self.min_corner, self.max_corner))
+
+__all__ = ("AABB",)
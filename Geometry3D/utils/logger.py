@@ -5,6 +5,7 @@ from logging.config import dictConfig
 log_level = logging.WARNING
 logging_config = dict(
     version=1,
+    disable_existing_loggers=False,
     formatters={
         'f':
         {
@@ -61,6 +62,7 @@ def change_main_logger():
     global main_logger, log_level
     logging_config = dict(
         version=1,
+        disable_existing_loggers=False,
         formatters={
             'f':
             {
@@ -96,3 +98,21 @@ def get_main_logger():
     '''
     global main_logger
     return main_logger
+
+
+def get_logger(name):
+    '''
+    **Input:**
+
+    - name: the name of the module, usually __name__
+
+    **Output:**
+
+    logger: The module level logger instance
+
+    The module loggers propagate to the main logger, so they follow set_log_level.
+    Pass the arguments to the logger instead of formatting the message yourself,
+    e.g. logger.debug('Create %s', point). The message is then only formatted
+    when the level is enabled, which keeps the calls cheap in hot paths.
+    '''
+    return logging.getLogger(name)
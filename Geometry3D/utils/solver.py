@@ -57,6 +57,107 @@ def solve(matrix):
     ref = gaussian_elimination(matrix)
     return Solution(ref)
 
+# Closed form kernels for the fixed size systems in the geometry code.
+# They take plain sequences of 3 numbers (Vectors work as well) and
+# avoid building a matrix and a Solution object.
+
+def _dot(a, b):
+    return a[0] * b[0] + a[1] * b[1] + a[2] * b[2]
+
+def _cross(a, b):
+    return (
+        a[1] * b[2] - a[2] * b[1],
+        a[2] * b[0] - a[0] * b[2],
+        a[0] * b[1] - a[1] * b[0],
+    )
+
+def line_line_parameters(s1, u1, s2, u2):
+    """
+    **Input:**
+
+    - s1, u1: support and direction vector of the first line
+
+    - s2, u2: support and direction vector of the second line
+
+    **Output:**
+
+    (λ, μ) such that s1 + λ u1 and s2 + μ u2 are the closest points
+    of the two lines, None if the lines are parallel.
+    """
+    w = (s1[0] - s2[0], s1[1] - s2[1], s1[2] - s2[2])
+    a = _dot(u1, u1)
+    b = _dot(u1, u2)
+    c = _dot(u2, u2)
+    d = _dot(u1, w)
+    e = _dot(u2, w)
+    # den = |u1 x u2| ** 2 = a * c * sin(angle) ** 2
+    den = a * c - b * b
+    if den <= get_eps() * a * c:
+        return None
+    return ((b * e - c * d) / den, (a * e - b * d) / den)
+
+def solve_line_line(s1, u1, s2, u2):
+    """
+    **Input:**
+
+    - s1, u1: support and direction vector of the first line
+
+    - s2, u2: support and direction vector of the second line
+
+    **Output:**
+
+    λ such that s1 + λ u1 is the intersection point of the two lines,
+    None if the lines are parallel or skew.
+
+    This replaces solving the 3x2 system s1 + λ u1 = s2 + μ u2.
+    """
+    parameters = line_line_parameters(s1, u1, s2, u2)
+    if parameters is None:
+        return None
+    lmb, mu = parameters
+    gap = (
+        s1[0] + lmb * u1[0] - s2[0] - mu * u2[0],
+        s1[1] + lmb * u1[1] - s2[1] - mu * u2[1],
+        s1[2] + lmb * u1[2] - s2[2] - mu * u2[2],
+    )
+    if _dot(gap, gap) > get_eps() ** 2:
+        return None
+    return lmb
+
+def general_form_point(a, b, c, d):
+    """
+    **Input:**
+
+    - a, b, c, d: the plane ax1 + bx2 + cx3 = d
+
+    **Output:**
+
+    The point (x1, x2, x3) of the plane that is closest to the origin.
+    """
+    nn = a * a + b * b + c * c
+    if nn == 0:
+        raise ValueError("Invalid Plane, the normal vector is zero")
+    t = d / nn
+    return (a * t, b * t, c * t)
+
+def orthogonal_vectors(n):
+    """
+    **Input:**
+
+    - n: a non-zero vector
+
+    **Output:**
+
+    (v, w), two coordinate tuples orthogonal to n and to each other.
+    """
+    # Cross with the axis that is the least parallel to n
+    magnitudes = (abs(n[0]), abs(n[1]), abs(n[2]))
+    axis = [0.0, 0.0, 0.0]
+    axis[magnitudes.index(min(magnitudes))] = 1.0
+    v = _cross(n, axis)
+    w = _cross(n, v)
+    return (v, w)
+
 def count(f, l):
     c = 0
     for i in l:
@@ -126,3 +227,88 @@ class Solution(object):
             s += row[-1]
             vals[tbd] = s / row[tbd]
         return tuple(vals)
+
+def solve_batch(matrices):
+    """
+    **Input:**
+
+    - matrices: an (N, M, K) array-like, N augmented systems of M equations
+      in K - 1 variables, the last column being the right hand side
+
+    **Output:**
+
+    A BatchSolution for all the N systems, solved in one vectorized pass.
+
+    Numpy is needed for this function.
+    """
+    import numpy as np
+    m = np.array(matrices, dtype=np.float64)
+    if m.ndim != 3:
+        raise ValueError("solve_batch expects an (N, M, K) array, not {}".format(m.shape))
+    n, num_rows, num_cols = m.shape
+    eps = get_eps()
+    systems = np.arange(n)
+    row_index = np.arange(num_rows)
+    rank = np.zeros(n, dtype=int)
+    # Gauss-Jordan elimination with partial pivoting, vectorized over the
+    # systems. rank is the row where the next pivot of each system goes.
+    for j in range(num_cols - 1):
+        candidates = np.abs(m[:, :, j])
+        candidates[row_index[None, :] < rank[:, None]] = -1
+        pivot = candidates.argmax(axis=1)
+        has_pivot = candidates[systems, pivot] >= eps
+        if not has_pivot.any():
+            continue
+        sel = systems[has_pivot]
+        target = rank[has_pivot]
+        pivot = pivot[has_pivot]
+        pivot_rows = m[sel, pivot]
+        m[sel, pivot] = m[sel, target]
+        pivot_rows = pivot_rows / pivot_rows[:, j][:, None]
+        m[sel, target] = pivot_rows
+        factors = m[sel, :, j]
+        factors[np.arange(sel.shape[0]), target] = 0
+        m[sel] -= factors[:, :, None] * pivot_rows[:, None, :]
+        rank[has_pivot] += 1
+    return BatchSolution(m, rank)
+
+class BatchSolution(object):
+    """Holds the solutions to a batch of systems of equations.
+
+    - solvable: (N,) bool array, False if a system has no solution
+
+    - varargs: (N,) int array, the number of free variables of each system
+
+    - exact: (N,) bool array, True if a system has exactly one solution
+
+    - values: (N, K - 1) float array, the solution of the exact systems and
+      NaN for the others. Use solve() on a single system to get its
+      parametrized solutions.
+    """
+    def __init__(self, rref, rank):
+        import numpy as np
+        self._s = rref
+        self.varcount = rref.shape[2] - 1
+        eps = get_eps()
+        null_coeffs = (np.abs(rref[:, :, :-1]) < eps).all(axis=2)
+        null_rhs = np.abs(rref[:, :, -1]) < eps
+        # No solution, 0a + 0b + 0c + ... = 1 which can never be true
+        self.solvable = ~(null_coeffs & ~null_rhs).any(axis=1)
+        unique_equations = (~(null_coeffs & null_rhs)).sum(axis=1)
+        self.varargs = self.varcount - unique_equations
+        self.exact = self.solvable & (self.varargs == 0)
+        self.values = np.full((rref.shape[0], self.varcount), np.nan)
+        if rref.shape[1] >= self.varcount:
+            # The reduced form of an exact system is the identity
+            self.values[self.exact] = rref[self.exact, :self.varcount, -1]
+
+    def __len__(self):
+        return self._s.shape[0]
+
+    def __getitem__(self, item):
+        """return the solution of the i system as a tuple"""
+        if not self.solvable[item]:
+            raise ValueError("Has no solution")
+        if not self.exact[item]:
+            raise ValueError("Has infinitely many solutions, use solve() to parametrize them")
+        return tuple(self.values[item].tolist())
@@ -35,3 +35,26 @@ def unify_types(items):
     result_type = min(types)[1]
     return [result_type(i) for i in items]
 
+
+def as_coordinate_array(data):
+    """
+    **Input:**
+
+    - data: an (N,3) array-like of coordinates or an iterable of Points or Vectors
+
+    **Output:**
+
+    A (N,3) numpy array of float64.
+
+    Numpy is needed for this function.
+    """
+    import numpy as np
+    if isinstance(data, np.ndarray):
+        array = data.astype(np.float64, copy=False)
+    else:
+        array = np.array([tuple(item) for item in data], dtype=np.float64)
+    if array.size == 0:
+        array = array.reshape(0, 3)
+    if array.ndim != 2 or array.shape[1] != 3:
+        raise ValueError("Coordinate array must have shape (N, 3), not {}".format(array.shape))
+    return array
@@ -7,6 +7,20 @@ from .constant import get_eps,get_sig_figures
 
 class Vector(object):
     """Vector Class"""
+    __slots__ = ("_v",)
+
+    @classmethod
+    def from_floats(cls, x, y, z):
+        """Returns the Vector (x | y | z)
+
+        This is the fast constructor, the coordinates are stored as they are
+        without type promotion. They should be floats (or at least share one
+        numeric type), otherwise use Vector(x, y, z).
+        """
+        vector = object.__new__(cls)
+        vector._v = [x, y, z]
+        return vector
+
     @classmethod
     def zero(cls):
         """Returns the zero vector (0 | 0 | 0)"""
@@ -73,15 +87,19 @@ class Vector(object):
         return abs(self._v[0] - other._v[0]) < get_eps() and abs(self._v[1] - other._v[1]) < get_eps() and abs(self._v[2] - other._v[2]) < get_eps()
 
     def __add__(self, other):
-        return Vector(x+y for x, y in zip(self, other))
+        a, b = self._v, other._v
+        return Vector.from_floats(a[0] + b[0], a[1] + b[1], a[2] + b[2])
     
     def __sub__(self, other):
-        return Vector([x-y for x, y in zip(self, other)])
+        a, b = self._v, other._v
+        return Vector.from_floats(a[0] - b[0], a[1] - b[1], a[2] - b[2])
 
     def __mul__(self, other):
+        a = self._v
         if isinstance(other, Vector):
-            return sum(x*y for x, y in zip(self, other))
-        return Vector([x*other for x in self._v])
+            b = other._v
+            return a[0] * b[0] + a[1] * b[1] + a[2] * b[2]
+        return Vector.from_floats(a[0] * other, a[1] * other, a[2] * other)
 
     def __rmul__(self, other):
         return self * other
@@ -92,6 +110,9 @@ class Vector(object):
     def __getitem__(self, item):
         return self._v[item]
 
+    def __iter__(self):
+        return iter(self._v)
+
     def __setitem__(self, item, value):
         self._v[item] = value
     
@@ -108,7 +129,7 @@ class Vector(object):
         is the area of the parallelogram given by x and y.
         """
         a, b = self._v, other._v
-        return Vector(
+        return Vector.from_floats(
                 a[1] * b[2] - a[2] * b[1],
                 a[2] * b[0] - a[0] * b[2],
                 a[0] * b[1] - a[1] * b[0]
@@ -121,7 +142,6 @@ class Vector(object):
 
     def parallel(self, other):
         """Returns true if both vectors are parallel."""
-        from .solver import solve
         if self == Vector.zero() or other == Vector.zero():
             return True
         if self == other:
@@ -145,7 +165,100 @@ class Vector(object):
         return float(1 / self.length()) * self
     unit = normalized
 
+class VectorArray(object):
+    """
+    - VectorArray(array):
+
+    N vectors stored as an (N,3) float64 numpy array.
+
+    - VectorArray(vectors):
+
+    The same but initialised from an iterable of Vectors.
+
+    All the operations are vectorized, so bulk workloads run at array speed.
+    Numpy is needed for this class.
+    """
+    def __init__(self, data):
+        from .util import as_coordinate_array
+        if isinstance(data, VectorArray):
+            data = data.array
+        self.array = as_coordinate_array(data)
+
+    @classmethod
+    def from_vectors(cls, vectors):
+        """Returns the VectorArray built from an iterable of Vectors"""
+        return cls(vectors)
+
+    def to_vectors(self):
+        """Returns a list of Vectors"""
+        return [Vector.from_floats(*row) for row in self.array.tolist()]
+
+    def __len__(self):
+        return self.array.shape[0]
+
+    def __iter__(self):
+        return iter(self.to_vectors())
+
+    def __getitem__(self, item):
+        """return the i Vector or a VectorArray for slices and masks"""
+        if isinstance(item, int):
+            return Vector.from_floats(*self.array[item].tolist())
+        return VectorArray(self.array[item])
+
+    def __repr__(self):
+        return "VectorArray({})".format(self.array.tolist())
+
+    def _other_array(self, other):
+        if isinstance(other, VectorArray):
+            return other.array
+        elif isinstance(other, Vector):
+            import numpy as np
+            return np.array(other._v, dtype=np.float64)
+        return other
+
+    def __add__(self, other):
+        return VectorArray(self.array + self._other_array(other))
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        return VectorArray(self.array - self._other_array(other))
+
+    def __mul__(self, other):
+        """Scale by a number or by an (N,) array of numbers"""
+        import numpy as np
+        other = np.asarray(other, dtype=np.float64)
+        if other.ndim == 1:
+            other = other[:, None]
+        return VectorArray(self.array * other)
+    __rmul__ = __mul__
+
+    def __neg__(self):
+        return VectorArray(-self.array)
+
+    def dot(self, other):
+        """Returns the (N,) array of dot products with a Vector or a VectorArray"""
+        import numpy as np
+        return np.einsum('ij,ij->i', self.array, np.broadcast_to(self._other_array(other), self.array.shape))
+
+    def cross(self, other):
+        """Returns the VectorArray of cross products with a Vector or a VectorArray"""
+        import numpy as np
+        return VectorArray(np.cross(self.array, self._other_array(other)))
+
+    def length(self):
+        """Returns the (N,) array of lengths"""
+        import numpy as np
+        return np.sqrt(self.dot(self))
+
+    def normalized(self):
+        """Returns the VectorArray of unit vectors, zero vectors raise ValueError"""
+        length = self.length()
+        if (length < get_eps()).any():
+            raise ValueError("Cannot normalize a zero Vector")
+        return VectorArray(self.array / length[:, None])
+    unit = normalized
+
 x_unit_vector = Vector.x_unit_vector
 y_unit_vector = Vector.y_unit_vector
 z_unit_vector = Vector.z_unit_vector
-__all__ = ("Vector","x_unit_vector","y_unit_vector","z_unit_vector")
+__all__ = ("Vector","VectorArray","x_unit_vector","y_unit_vector","z_unit_vector")
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+import copy
+import unittest
+from Geometry3D import *
+
+INF = float('inf')
+
+
+class AABBTest(unittest.TestCase):
+    def test_aabb_overlaps(self):
+        box = AABB((0, 0, 0), (1, 1, 1))
+        self.assertTrue(box.overlaps(AABB((1, 1, 1), (2, 2, 2))))
+        self.assertFalse(box.overlaps(AABB((1.1, 0, 0), (2, 1, 1))))
+        self.assertTrue(box.overlaps(AABB.infinite()))
+        self.assertEqual(box.union(AABB((-1, 0.5, 0), (0, 2, 0.5))), AABB((-1, 0, 0), (1, 2, 1)))
+        self.assertTrue(box.is_bounded())
+        self.assertFalse(AABB.infinite().is_bounded())
+
+    def test_aabb_of_bodies(self):
+        self.assertEqual(Point(1, 2, 3).aabb(), AABB((1, 2, 3), (1, 2, 3)))
+        self.assertEqual(Segment(Point(1, 0, 3), Point(0, 2, 1)).aabb(), AABB((0, 0, 1), (1, 2, 3)))
+        self.assertEqual(x_axis().aabb(), AABB((-INF, 0, 0), (INF, 0, 0)))
+        self.assertEqual(xy_plane().aabb(), AABB((-INF, -INF, 0), (INF, INF, 0)))
+        self.assertEqual(HalfLine(origin(), Vector(1, -1, 0)).aabb(), AABB((0, -INF, 0), (INF, 0, 0)))
+        cph = Parallelepiped(origin(), x_unit_vector(), y_unit_vector(), 2 * z_unit_vector())
+        self.assertEqual(cph.aabb(), AABB((0, 0, 0), (1, 1, 2)))
+
+    def test_aabb_cache_invalidated_by_move(self):
+        cph = Parallelepiped(origin(), x_unit_vector(), y_unit_vector(), z_unit_vector())
+        self.assertIs(cph.aabb(), cph.aabb())
+        cph.move(Vector(1, 0, 0))
+        self.assertEqual(cph.aabb(), AABB((1, 0, 0), (2, 1, 1)))
+        s = Segment(origin(), Point(1, 1, 1))
+        s.aabb()
+        s.move(Vector(1, 0, 0))
+        self.assertEqual(s.aabb(), AABB((1, 0, 0), (2, 1, 1)))
+
+    def test_aabb_cache_not_shared_by_copies(self):
+        s = Segment(origin(), Point(1, 0, 0))
+        s.aabb()
+        t = copy.copy(s)
+        t.move(Vector(5, 0, 0))
+        self.assertEqual(t.aabb(), AABB((5, 0, 0), (6, 0, 0)))
+        s.move(Vector(0, 7, 0))
+        self.assertEqual(s.aabb(), AABB((0, 7, 0), (1, 7, 0)))
+
+    def test_aabb_rejects_far_bodies(self):
+        cph0 = Parallelepiped(origin(), x_unit_vector(), y_unit_vector(), z_unit_vector())
+        cph1 = copy.deepcopy(cph0).move(Vector(1000, 0, 0))
+        self.assertIsNone(intersection(cph0, cph1))
+        self.assertIsNone(intersection(cph0, Point(0, 0, 1.5)))
+        self.assertEqual(intersection(cph0, copy.deepcopy(cph0).move(Vector(1, 0, 0))),
+                         Parallelogram(Point(1, 0, 0), y_unit_vector(), z_unit_vector()))
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+import math
+import unittest
+try:
+    import numpy as np
+except ImportError:
+    np = None
+from Geometry3D import *
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class VectorArrayTest(unittest.TestCase):
+    def test_vector_array_conversion(self):
+        vectors = [Vector(1, 2, 3), Vector(-1, 0, 2.5)]
+        va = VectorArray.from_vectors(vectors)
+        self.assertEqual(va.array.shape, (2, 3))
+        self.assertEqual(va.array.dtype, np.float64)
+        self.assertEqual(va.to_vectors(), vectors)
+        self.assertEqual(va[1], Vector(-1, 0, 2.5))
+        self.assertEqual(len(va[:1]), 1)
+
+    def test_vector_array_add_sub(self):
+        va = VectorArray([[1, 2, 3], [4, 5, 6]])
+        vb = VectorArray([[1, 1, 1], [2, 2, 2]])
+        self.assertEqual((va + vb).to_vectors(), [Vector(2, 3, 4), Vector(6, 7, 8)])
+        self.assertEqual((va - vb).to_vectors(), [Vector(0, 1, 2), Vector(2, 3, 4)])
+        self.assertEqual((va + x_unit_vector()).to_vectors(), [Vector(2, 2, 3), Vector(5, 5, 6)])
+        self.assertEqual((-va)[0], Vector(-1, -2, -3))
+
+    def test_vector_array_dot_cross(self):
+        va = VectorArray([[2, 3, 5], [1, 0, 0]])
+        vb = VectorArray([[7, 11, 13], [0, 1, 0]])
+        self.assertEqual(va.dot(vb).tolist(), [2 * 7 + 3 * 11 + 5 * 13, 0])
+        self.assertEqual(va.dot(Vector(1, 1, 1)).tolist(), [10, 1])
+        cross = va.cross(vb).to_vectors()
+        self.assertEqual(cross[0], Vector(2, 3, 5).cross(Vector(7, 11, 13)))
+        self.assertEqual(cross[1], z_unit_vector())
+
+    def test_vector_array_length_normalized(self):
+        va = VectorArray([[3, 4, 0], [1, 1, 1]])
+        self.assertEqual(va.length().tolist()[0], 5)
+        self.assertAlmostEqual(va.length()[1], math.sqrt(3))
+        for length in va.normalized().length():
+            self.assertAlmostEqual(length, 1)
+        self.assertRaises(ValueError, VectorArray([[0, 0, 0]]).normalized)
+
+    def test_vector_array_shape(self):
+        self.assertRaises(ValueError, VectorArray, [[1, 2]])
+        self.assertEqual(len(VectorArray([])), 0)
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class PointArrayTest(unittest.TestCase):
+    def test_point_array_conversion(self):
+        points = [origin(), Point(1, 2, 3)]
+        pa = PointArray.from_points(points)
+        self.assertEqual(pa.to_points(), points)
+        self.assertEqual(pa[1], Point(1, 2, 3))
+        self.assertEqual(list(pa), points)
+
+    def test_point_array_operations(self):
+        pa = PointArray([[1, 1, 1], [2, 0, 0]])
+        self.assertEqual((pa - origin()).to_vectors(), [Vector(1, 1, 1), Vector(2, 0, 0)])
+        self.assertIsInstance(pa - pa, VectorArray)
+        self.assertEqual((pa + Vector(0, 0, 1)).to_points(), [Point(1, 1, 2), Point(2, 0, 1)])
+        self.assertEqual((pa - Vector(0, 0, 1)).to_points(), [Point(1, 1, 0), Point(2, 0, -1)])
+        self.assertEqual(pa.distance(Point(2, 1, 1)).tolist(), [1, math.sqrt(2)])
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+import itertools
+import unittest
+from Geometry3D import *
+
+
+class BroadPhaseTest(unittest.TestCase):
+    def setUp(self):
+        # a row of cubes overlapping their neighbours, and a far column
+        self.bodies = [Parallelepiped(Point(0.75 * i, 0, 0), x_unit_vector(), y_unit_vector(), z_unit_vector()) for i in range(6)]
+        self.bodies += [Parallelepiped(Point(0, 10, 1.5 * i), x_unit_vector(), y_unit_vector(), z_unit_vector()) for i in range(4)]
+
+    def test_overlapping_pairs(self):
+        pairs = sorted(overlapping_pairs(self.bodies))
+        expected = [(i, j) for i, j in itertools.combinations(range(len(self.bodies)), 2)
+                    if self.bodies[i].aabb().overlaps(self.bodies[j].aabb())]
+        self.assertEqual(pairs, expected)
+        self.assertIn((0, 1), pairs)
+        self.assertNotIn((0, 2), pairs)
+        self.assertNotIn((6, 7), pairs)
+        self.assertEqual(list(overlapping_pairs(self.bodies[:1])), [])
+
+    def test_overlapping_pairs_unbounded(self):
+        bodies = [Parallelepiped(origin(), x_unit_vector(), y_unit_vector(), z_unit_vector()), x_axis(),
+                  Parallelepiped(Point(5, 5, 5), x_unit_vector(), y_unit_vector(), z_unit_vector())]
+        self.assertEqual(sorted(overlapping_pairs(bodies)), [(0, 1)])
+
+    def test_intersect_all(self):
+        results = list(intersect_all(self.bodies))
+        expected = [(i, j, intersection(self.bodies[i], self.bodies[j]))
+                    for i, j in itertools.combinations(range(len(self.bodies)), 2)
+                    if intersection(self.bodies[i], self.bodies[j]) is not None]
+        self.assertEqual(sorted(results, key=lambda r: r[:2]), expected)
+        self.assertEqual(len(results), 5)
+
+    def test_narrow_phase_intersection(self):
+        cube = self.bodies[0]
+        self.assertEqual(narrow_phase_intersection(cube, self.bodies[1]), intersection(cube, self.bodies[1]))
+        self.assertIsNone(narrow_phase_intersection(cube, self.bodies[2]))
+        self.assertEqual(narrow_phase_intersection(cube, Point(0.5, 0.5, 0.5)), Point(0.5, 0.5, 0.5))
+
+
+if __name__ == '__main__':
+    unittest.main()
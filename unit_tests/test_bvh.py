@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+import unittest
+from Geometry3D import *
+
+
+class BVHTest(unittest.TestCase):
+    def setUp(self):
+        self.cubes = [Parallelepiped(Point(2 * i, 2 * j, 0), x_unit_vector(), y_unit_vector(), z_unit_vector()) for i in range(5) for j in range(5)]
+        self.bvh = BVH(self.cubes)
+
+    def test_bvh_build(self):
+        self.assertEqual(len(self.bvh), 6 * 25)
+        self.assertEqual(len(BVH([ConvexPolygon((origin(), Point(1, 0, 0), Point(0, 1, 0)))])), 1)
+        self.assertIsNone(BVH([]).first_hit(x_axis()))
+        self.assertRaises(TypeError, BVH, [origin()])
+
+    def test_bvh_first_hit(self):
+        ray = HalfLine(Point(-5, 0.5, 0.5), Vector(1, 0, 0))
+        body, face, inter = self.bvh.first_hit(ray)
+        self.assertIs(body, self.cubes[0])
+        self.assertIn(face, body.convex_polygons)
+        self.assertEqual(inter, Point(0, 0.5, 0.5))
+        ray = HalfLine(Point(20, 4.5, 0.5), Vector(-1, 0, 0))
+        body, face, inter = self.bvh.first_hit(ray)
+        self.assertIs(body, self.cubes[22])
+        self.assertEqual(inter, Point(9, 4.5, 0.5))
+        self.assertIsNone(self.bvh.first_hit(HalfLine(Point(-5, 0.5, 0.5), Vector(-1, 0, 0))))
+        self.assertIsNone(self.bvh.first_hit(HalfLine(Point(1.5, 1.5, 0.5), Vector(0, 0, 1))))
+
+    def test_bvh_segment_query(self):
+        segment = Segment(Point(0.5, 0.5, 5), Point(0.5, 0.5, 0.5))
+        body, face, inter = self.bvh.first_hit(segment)
+        self.assertIs(body, self.cubes[0])
+        self.assertEqual(inter, Point(0.5, 0.5, 1))
+        self.assertEqual(len(self.bvh.all_hits(segment)), 1)
+        self.assertIsNone(self.bvh.first_hit(Segment(Point(0.5, 0.5, 5), Point(0.5, 0.5, 2))))
+
+    def test_bvh_all_hits(self):
+        ray = HalfLine(Point(-5, 0.5, 0.5), Vector(1, 0, 0))
+        hits = self.bvh.all_hits(ray)
+        expected = [(cube, face) for cube in self.cubes for face in cube.convex_polygons if intersection(ray, face) is not None]
+        self.assertEqual(len(hits), len(expected))
+        self.assertEqual(len(hits), 10)
+        xs = [inter.x for _, _, inter in hits]
+        self.assertEqual(xs, sorted(xs))
+        line_hits = self.bvh.all_hits(Line(Point(0, 0.5, 0.5), Vector(1, 0, 0)))
+        self.assertEqual(len(line_hits), 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+import copy
+import unittest
+from Geometry3D import *
+
+cph0 = Parallelepiped(origin(), x_unit_vector(), y_unit_vector(), z_unit_vector())
+
+class DistanceTest(unittest.TestCase):
+    def test_distance_convexpolyhedron(self):
+        self.assertAlmostEqual(distance(cph0, Parallelepiped(Point(3, 0, 0), x_unit_vector(), y_unit_vector(), z_unit_vector())), 2)
+        self.assertAlmostEqual(distance(cph0, Parallelepiped(Point(3, 3, 0), x_unit_vector(), y_unit_vector(), z_unit_vector())), 8 ** 0.5)
+        self.assertAlmostEqual(distance(cph0, Parallelepiped(Point(1, 1, 1), x_unit_vector(), y_unit_vector(), z_unit_vector())), 0)
+        self.assertAlmostEqual(distance(cph0, Parallelepiped(Point(0.5, 0.5, 0.5), x_unit_vector(), y_unit_vector(), z_unit_vector())), 0)
+        sphere0 = Sphere(origin(), 1, n1=20, n2=10)
+        sphere1 = Sphere(Point(3, 0, 0), 1, n1=20, n2=10)
+        self.assertTrue(1 <= distance(sphere0, sphere1) <= 1.1)
+
+    def test_distance_mixed(self):
+        self.assertAlmostEqual(distance(Point(5, 0.5, 0.5), cph0), 4)
+        self.assertAlmostEqual(distance(Segment(Point(2, 2, 2), Point(3, 3, 3)), cph0), 3 ** 0.5)
+        self.assertAlmostEqual(distance(ConvexPolygon((Point(0, 0, 2), Point(1, 0, 2), Point(0, 1, 2))), cph0), 1)
+        self.assertAlmostEqual(distance(Point(0, 0, 0), Point(3, 4, 0)), 5)
+        self.assertRaises(NotImplementedError, distance, Plane(origin(), z_unit_vector()), cph0)
+
+    def test_closest_points(self):
+        pa, pb = closest_points(cph0, Parallelepiped(Point(3, 0.5, 0.2), x_unit_vector(), y_unit_vector(), z_unit_vector()))
+        self.assertAlmostEqual(pa.x, 1)
+        self.assertAlmostEqual(pb.x, 3)
+        self.assertAlmostEqual(pa.y, pb.y)
+        self.assertAlmostEqual(pa.z, pb.z)
+        self.assertTrue(pa in cph0)
+
+    def test_penetration(self):
+        self.assertEqual(penetration(cph0, Parallelepiped(Point(3, 0, 0), x_unit_vector(), y_unit_vector(), z_unit_vector())), None)
+        depth, direction = penetration(cph0, Parallelepiped(Point(0.8, 0.1, 0.2), x_unit_vector(), y_unit_vector(), z_unit_vector()))
+        self.assertAlmostEqual(depth, 0.2)
+        self.assertEqual(direction, Vector(1, 0, 0))
+        depth, direction = penetration(cph0, Parallelepiped(Point(1, 0, 0), x_unit_vector(), y_unit_vector(), z_unit_vector()))
+        self.assertAlmostEqual(depth, 0)
+        cph1 = Parallelepiped(Point(0.3, -0.2, 0.4), Vector(1, 0.2, 0.1), Vector(0, 1, 0.3), Vector(0.2, 0, 1))
+        depth, direction = penetration(cph0, cph1)
+        self.assertFalse(intersects(cph0, copy.deepcopy(cph1).move(direction * (depth + 1e-6))))
+        self.assertTrue(intersects(cph0, copy.deepcopy(cph1).move(direction * (depth - 1e-3))))
+
+    def test_penetration_flat(self):
+        # a - b is flat, moving b along the direction by any distance separates the bodies
+        cpg0 = Parallelogram(origin(), x_unit_vector(), y_unit_vector())
+        cpg1 = Parallelogram(Point(0.5, 0.5, 0), x_unit_vector(), y_unit_vector())
+        depth, direction = penetration(cpg0, cpg1)
+        self.assertEqual(depth, 0)
+        self.assertTrue(direction == z_unit_vector() or direction == -z_unit_vector())
+        s0 = Segment(origin(), Point(2, 0, 0))
+        s1 = Segment(Point(1, 0, 0), Point(3, 0, 0))
+        depth, direction = penetration(s0, s1)
+        self.assertEqual(depth, 0)
+        self.assertAlmostEqual(direction.length(), 1)
+        self.assertTrue(direction.orthogonal(x_unit_vector()))
+        self.assertFalse(intersects(s0, copy.deepcopy(s1).move(direction * 1e-3)))
+        depth, direction = penetration(Point(1, 2, 3), Point(1, 2, 3))
+        self.assertEqual(depth, 0)
+        self.assertAlmostEqual(direction.length(), 1)
+
+if __name__ == '__main__':
+    unittest.main()
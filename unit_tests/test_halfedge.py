@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+import unittest
+from Geometry3D import *
+
+
+class HalfEdgeTest(unittest.TestCase):
+    def test_half_edge_cube(self):
+        cph = Parallelepiped(origin(), x_unit_vector(), y_unit_vector(), z_unit_vector())
+        mesh = cph.half_edges()
+        self.assertIs(mesh, cph.half_edges())
+        self.assertEqual((len(mesh.vertices), len(mesh.edges()), len(mesh.faces)), (8, 12, 6))
+        for h in range(len(mesh.origin)):
+            self.assertEqual(mesh.twin[mesh.twin[h]], h)
+            self.assertEqual(mesh.next[mesh.prev[h]], h)
+            self.assertEqual(mesh.destination(mesh.twin[h]), mesh.origin[h])
+        v = mesh.vertices.index((0.0, 0.0, 0.0))
+        self.assertEqual(sorted(mesh.vertices[u] for u in mesh.vertex_neighbors(v)),
+                         [(0.0, 0.0, 1.0), (0.0, 1.0, 0.0), (1.0, 0.0, 0.0)])
+        self.assertEqual(len(mesh.vertex_faces(v)), 3)
+        for f in range(6):
+            neighbors = mesh.face_neighbors(f)
+            self.assertEqual(len(set(neighbors)), 4)
+            self.assertNotIn(f, neighbors)
+        self.assertEqual(len(mesh.silhouette(z_unit_vector())), 4)
+        self.assertEqual(len(mesh.silhouette(Vector(1, 1, 1))), 6)
+        cph.move(Vector(1, 0, 0))
+        self.assertIsNot(cph.half_edges(), mesh)
+        self.assertIn((1.0, 0.0, 0.0), cph.half_edges().vertices)
+
+    def test_half_edge_sphere(self):
+        sphere = Sphere(origin(), 1, n1=12, n2=4)
+        mesh = sphere.half_edges()
+        for f, normal in enumerate(mesh.normals):
+            self.assertAlmostEqual(Vector(*normal) * sphere.convex_polygons[f].plane.n, 1)
+        for v in range(len(mesh.vertices)):
+            self.assertEqual(set(mesh.vertex_faces(v)), set(f for f, face in enumerate(mesh.faces) if v in face))
+
+    def test_half_edge_extreme_vertex(self):
+        sphere = Sphere(origin(), 1, n1=12, n2=4)
+        mesh = sphere.half_edges()
+        for direction in ((1, 0, 0), (0, 0, -1), (1, -2, 0.5)):
+            farthest = max(sum(p[i] * direction[i] for i in range(3)) for p in mesh.vertices)
+            for start in (0, len(mesh.vertices) - 1):
+                v = mesh.extreme_vertex(direction, start)
+                self.assertAlmostEqual(sum(mesh.vertices[v][i] * direction[i] for i in range(3)), farthest)
+
+    def test_half_edge_errors(self):
+        with self.assertRaises(ValueError):
+            # an open box
+            HalfEdgeMesh([(0, 0, 0), (1, 0, 0), (0, 1, 0), (0, 0, 1)], [(0, 2, 1), (0, 1, 3), (0, 3, 2)])
+        with self.assertRaises(ValueError):
+            # the last face is not oriented like the others
+            HalfEdgeMesh([(0, 0, 0), (1, 0, 0), (0, 1, 0), (0, 0, 1)], [(0, 2, 1), (0, 1, 3), (0, 3, 2), (1, 3, 2)])
+
+
+if __name__ == '__main__':
+    unittest.main()
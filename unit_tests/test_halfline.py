@@ -81,6 +81,14 @@ class HalfLineTest(unittest.TestCase):
     def test_halfline_equal(self):
         self.assertTrue(HalfLine(origin(),Point(1,0,0)),HalfLine(Point(0,0,0),Vector(3,0,0)))
 
+    def test_halfline_vector_copied(self):
+        v = Vector(1,0,0)
+        h = HalfLine(origin(),v)
+        v[0] = -1
+        self.assertEqual(h.vector,Vector(1,0,0))
+        self.assertTrue(Point(2,0,0) in h)
+        self.assertFalse(Point(-2,0,0) in h)
+
     def test_halfline_move(self):
         self.assertEqual(
             HalfLine(origin(),Point(2,3,1)).move(Vector(1,2,3)),
@@ -4,6 +4,10 @@ import unittest
 from Geometry3D import *
 import Geometry3D
 import copy
+from Geometry3D.calc.dispatch import TypePairDispatcher
+from Geometry3D.calc.intersection import (inter_line_convexpolyhedron,inter_segment_convexpolyhedron,inter_convexpolyhedron_halfline,
+    inter_line_convexpolyhedron_old,inter_segment_convexpolyhedron_old,inter_convexpolyhedron_halfline_old,
+    inter_convexpolygon_convexpolygon,inter_convexpolygon_convexPolyhedron)
 
 class PointIntersectionTest(unittest.TestCase):
     def test_intersection_point_point(self):
@@ -41,7 +45,7 @@ class PointIntersectionTest(unittest.TestCase):
         self.assertEqual(intersection(cph,origin()),origin())
         self.assertEqual(intersection(Point(0.5,0,0),cph),Point(0.5,0,0))
         self.assertEqual(intersection(cph,Point(0.5,0.5,0)),Point(0.5,0.5,0))
-        self.assertEqual(intersection(Point(0.5,0.5,1),cph),origin().move(Vector(0.5,0.5,1)))
+        self.assertEqual(intersection(Point(0.5,0.5,1),cph),origin().translated(Vector(0.5,0.5,1)))
         self.assertTrue(intersection(cph,Point(-0.1,0.5,0.5)) is None)
 
     def test_intersection_point_halfline(self):
@@ -173,7 +177,7 @@ class PlaneIntersectionTest(unittest.TestCase):
         cpg2 = Parallelogram(origin(),x_unit_vector(),z_unit_vector())
         cpg3 = Parallelogram(origin(),Vector(0,1,1),Vector(0,-1,1))
         cpg4 = copy.deepcopy(cpg2).move(Vector(0,0,-0.5))
-        cpg5 = Parallelogram(origin().move(z_unit_vector()),x_unit_vector(),y_unit_vector())
+        cpg5 = Parallelogram(origin().translated(z_unit_vector()),x_unit_vector(),y_unit_vector())
         self.assertEqual(intersection(p1,cpg1),cpg1)
         self.assertEqual(intersection(p1,cpg2),Segment(origin(),Point(1,0,0)))
         self.assertEqual(intersection(p1,cpg3),origin())
@@ -190,7 +194,7 @@ class PlaneIntersectionTest(unittest.TestCase):
         p6 = Plane(Point(-0.1,-0.1,-0.1),Vector(-1,-1,-1))
         p7 = xy_plane().move(-z_unit_vector())
         self.assertTrue(intersection(cph,p1) == (Parallelogram(origin(),x_unit_vector(),y_unit_vector())))
-        self.assertTrue(intersection(cph,p2) == (Parallelogram(origin().move(0.5*z_unit_vector()),x_unit_vector(),y_unit_vector())))
+        self.assertTrue(intersection(cph,p2) == (Parallelogram(origin().translated(0.5*z_unit_vector()),x_unit_vector(),y_unit_vector())))
         self.assertEqual(intersection(cph,p3),Point(1,1,1))
         self.assertEqual(intersection(cph,p4),Segment(origin(),Point(0,0,1)))
         self.assertTrue(intersection(cph,p5) == (ConvexPolygon((Point(0,0,0.3),Point(0,0.3,0),Point(0.3,0,0)))))
@@ -235,7 +239,7 @@ class SegmentIntersectionTest(unittest.TestCase):
         s2 = Segment(Point(-0.5,0.5,0),Point(0.5,0.5,0))
         s3 = Segment(Point(-0.5,0.5,0),Point(1.5,0.5,0))
         s4 = Segment(Point(0.2,0.5,0),Point(0.8,0.5,0))
-        s5 = Segment(origin(),origin().move(z_unit_vector()))
+        s5 = Segment(origin(),origin().translated(z_unit_vector()))
         s6 = Segment(Point(-1,-1,0),Point(1.5,1.5,0))
         s7 = copy.deepcopy(s5).move(Vector(-0.1,-0.1,0))
         s8 = Segment(Point(0.5,0.5,0.5),Point(0.5,0.5,1))
@@ -256,7 +260,7 @@ class SegmentIntersectionTest(unittest.TestCase):
         s2 = Segment(Point(-0.5,0.5,0),Point(0.5,0.5,0))
         s3 = Segment(Point(-0.5,0.5,0),Point(1.5,0.5,0))
         s4 = Segment(Point(0.2,0.5,0),Point(0.8,0.5,0))
-        s5 = Segment(origin(),origin().move(z_unit_vector()))
+        s5 = Segment(origin(),origin().translated(z_unit_vector()))
         s6 = Segment(Point(-1,-1,0),Point(1.5,1.5,0))
         s7 = copy.deepcopy(s5).move(Vector(-0.1,-0.1,0))
         s8 = Segment(Point(0.5,0.5,0.5),Point(0.5,0.5,1))
@@ -331,7 +335,7 @@ class ConvexPolygonIntersectionTest(unittest.TestCase):
         self.assertEqual(intersection(cpg0,cpg5),Point(1,0.5,0))
         cpg6 = Parallelogram(Point(1,-0.5,0),x_unit_vector(),y_unit_vector())
         self.assertEqual(intersection(cpg0,cpg6),Segment(Point(1,0,0),Point(1,0.5,0)))
-        cpg7 = Parallelogram(origin().move(z_unit_vector()),x_unit_vector(),y_unit_vector())
+        cpg7 = Parallelogram(origin().translated(z_unit_vector()),x_unit_vector(),y_unit_vector())
         self.assertTrue(intersection(cpg0,cpg7) is None)
         cpg8 = Parallelogram(Point(0.5,0,-0.5),x_unit_vector(),z_unit_vector())
         self.assertEqual(intersection(cpg0,cpg8),Segment(Point(0.5,0,0),Point(1,0,0)))
@@ -367,7 +371,7 @@ class ConvexPolygonIntersectionTest(unittest.TestCase):
         self.assertEqual(intersection(cph,cpg5),Point(1,0.5,0))
         cpg6 = Parallelogram(Point(1,-0.5,0),x_unit_vector(),y_unit_vector())
         self.assertEqual(intersection(cph,cpg6),Segment(Point(1,0,0),Point(1,0.5,0)))
-        cpg7 = Parallelogram(origin().move(0.5*z_unit_vector()),x_unit_vector(),y_unit_vector())
+        cpg7 = Parallelogram(origin().translated(0.5*z_unit_vector()),x_unit_vector(),y_unit_vector())
         self.assertTrue(intersection(cph,cpg7) == (cpg7))
         cpg8 = Parallelogram(Point(0.5,0,-0.5),x_unit_vector(),z_unit_vector())
         self.assertTrue(intersection(cph,cpg8) == (Parallelogram(Point(0.5,0,0),0.5*x_unit_vector(),0.5*z_unit_vector())))
@@ -463,4 +467,144 @@ class HalfLineIntersectionTest(unittest.TestCase):
         self.assertEqual(intersection(h1,h4),origin())
         self.assertEqual(intersection(h1,h5),Point(1,0,0))
         self.assertTrue(intersection(h1,h6) is None)
-        self.assertEqual(intersection(h1,h7),h7)
\ No newline at end of file
+        self.assertEqual(intersection(h1,h7),h7)
+
+class DispatchIntersectionTest(unittest.TestCase):
+    def test_intersection_symmetric_dispatch(self):
+        cpg = Parallelogram(origin(),x_unit_vector(),y_unit_vector())
+        p = xz_plane()
+        self.assertEqual(intersection(cpg,p),intersection(p,cpg))
+
+    def test_intersection_register(self):
+        class Marker(object):
+            pass
+        class SubPoint(Point):
+            pass
+        # a local dispatcher, registering on the one of intersection() would leak into the other tests
+        dispatcher = TypePairDispatcher('intersecting')
+        dispatcher.register(Marker,Point,lambda m,p: p)
+        self.assertEqual(dispatcher(Marker(),origin()),origin())
+        self.assertEqual(dispatcher(SubPoint(1,2,3),Marker()),Point(1,2,3))
+        self.assertRaises(NotImplementedError,dispatcher,Marker(),Marker())
+
+class ClipIntersectionTest(unittest.TestCase):
+    def test_intersection_clip_linear_convexpolyhedron(self):
+        cph = Parallelepiped(origin(),x_unit_vector(),y_unit_vector(),z_unit_vector())
+        # (segment, intersection with the segment, with its line, with its halfline)
+        cases = [
+            (Segment(Point(-1,0.5,0.5),Point(2,0.5,0.5)),Segment(Point(0,0.5,0.5),Point(1,0.5,0.5)),Segment(Point(0,0.5,0.5),Point(1,0.5,0.5)),Segment(Point(0,0.5,0.5),Point(1,0.5,0.5))),
+            (Segment(Point(0.5,0.5,0.5),Point(0.5,0.5,2)),Segment(Point(0.5,0.5,0.5),Point(0.5,0.5,1)),Segment(Point(0.5,0.5,0),Point(0.5,0.5,1)),Segment(Point(0.5,0.5,0.5),Point(0.5,0.5,1))),
+            (Segment(Point(1,1,1),Point(2,2,2)),Point(1,1,1),Segment(origin(),Point(1,1,1)),Point(1,1,1)),
+            (Segment(origin(),Point(1,0,0)),Segment(origin(),Point(1,0,0)),Segment(origin(),Point(1,0,0)),Segment(origin(),Point(1,0,0))),
+            (Segment(Point(2,0,0),Point(3,0,0)),None,Segment(origin(),Point(1,0,0)),None),
+        ]
+        for s,inter_segment,inter_line,inter_halfline in cases:
+            self.assertEqual(inter_segment_convexpolyhedron(s,cph),inter_segment)
+            self.assertEqual(inter_line_convexpolyhedron(s.line,cph),inter_line)
+            self.assertEqual(inter_convexpolyhedron_halfline(cph,HalfLine(s.start_point,s.end_point)),inter_halfline)
+
+    def test_intersection_clip_agrees_with_old(self):
+        # the former kernels intersect every face and are kept to verify the clipping
+        cph = Parallelepiped(Point(-0.5,-0.5,-0.5),x_unit_vector(),y_unit_vector(),z_unit_vector())
+        sphere = Sphere(Point(2,0,0),1,n1=8,n2=3)
+        starts = [Point(-1,0.2,0.1),Point(0,0,0),Point(0.5,0.5,0.5),Point(2,2,2),Point(1.5,-0.3,0.2)]
+        ends = [Point(1,-0.1,0.3),Point(0.5,0,0),Point(-0.5,0.5,0.5),Point(3,-1,0.5),Point(2.5,0.4,-0.1)]
+        for body in (cph,sphere):
+            for start in starts:
+                for end in ends:
+                    s = Segment(start,end)
+                    self.assertEqual(inter_segment_convexpolyhedron(s,body),inter_segment_convexpolyhedron_old(s,body))
+                    self.assertEqual(inter_line_convexpolyhedron(s.line,body),inter_line_convexpolyhedron_old(s.line,body))
+                    h = HalfLine(start,end)
+                    self.assertEqual(inter_convexpolyhedron_halfline(body,h),inter_convexpolyhedron_halfline_old(body,h))
+
+    def test_intersection_clip_convexpolygon(self):
+        cph = Parallelepiped(origin(),x_unit_vector(),y_unit_vector(),z_unit_vector())
+        square = Parallelogram(origin(),x_unit_vector(),y_unit_vector())
+        # (polygon, intersection with the square, with the cube)
+        cases = [
+            (ConvexPolygon((Point(0.5,0.5,0),Point(2,0.5,0),Point(0.5,2,0))),Parallelogram(Point(0.5,0.5,0),0.5 * x_unit_vector(),0.5 * y_unit_vector()),Parallelogram(Point(0.5,0.5,0),0.5 * x_unit_vector(),0.5 * y_unit_vector())),
+            (ConvexPolygon((Point(-1,0.5,-1),Point(2,0.5,-1),Point(0.5,0.5,2))),Segment(Point(0,0.5,0),Point(1,0.5,0)),Parallelogram(Point(0,0.5,0),x_unit_vector(),z_unit_vector())),
+            (ConvexPolygon((Point(1,0,0),Point(2,0,0),Point(1,1,0))),Segment(Point(1,0,0),Point(1,1,0)),Segment(Point(1,0,0),Point(1,1,0))),
+            (ConvexPolygon((Point(1,1,0),Point(2,1,0),Point(2,2,0))),Point(1,1,0),Point(1,1,0)),
+            (ConvexPolygon((Point(3,3,3),Point(4,3,3),Point(3,4,3))),None,None),
+        ]
+        for cpg,inter_square,inter_cube in cases:
+            self.assertEqual(inter_convexpolygon_convexpolygon(cpg,square),inter_square)
+            self.assertEqual(intersection(cpg,square),inter_square)
+            self.assertEqual(inter_convexpolygon_convexPolyhedron(cph,cpg),inter_cube)
+
+class IntersectsTest(unittest.TestCase):
+    def test_intersects_touching(self):
+        cph0 = Parallelepiped(origin(),x_unit_vector(),y_unit_vector(),z_unit_vector())
+        cph1 = Parallelepiped(Point(1,1,1),x_unit_vector(),y_unit_vector(),z_unit_vector())
+        cph2 = Parallelepiped(Point(0.5,0.5,1.001),x_unit_vector(),y_unit_vector(),z_unit_vector())
+        self.assertTrue(intersects(cph0,cph1))
+        self.assertFalse(intersects(cph0,cph2))
+        cpg = ConvexPolygon((Point(2,0,0),Point(0,2,0),Point(0,0,2)))
+        self.assertFalse(intersects(cph1,cpg))
+        self.assertTrue(intersects(cph0,cpg))
+        self.assertTrue(intersects(cpg,Parallelogram(Point(0.5,0.5,0),x_unit_vector(),y_unit_vector())))
+        self.assertFalse(intersects(cpg,Parallelogram(Point(1.5,1.5,0),x_unit_vector(),y_unit_vector())))
+
+    def test_intersects_linear(self):
+        cph = Parallelepiped(origin(),x_unit_vector(),y_unit_vector(),z_unit_vector())
+        self.assertTrue(intersects(HalfLine(Point(-1,0.5,0.5),x_unit_vector()),cph))
+        self.assertFalse(intersects(HalfLine(Point(-1,0.5,0.5),-x_unit_vector()),cph))
+        self.assertTrue(intersects(Segment(Point(2,2,2),Point(1,1,1)),cph))
+        self.assertFalse(intersects(Segment(Point(2,2,2),Point(1.1,1,1)),cph))
+        self.assertTrue(intersects(xy_plane(),Segment(Point(0,0,-1),Point(0,0,1))))
+        self.assertFalse(intersects(xy_plane(),HalfLine(Point(0,0,1),z_unit_vector())))
+        self.assertTrue(intersects(Plane(origin(),Vector(1,1,1)),cph))
+        self.assertFalse(intersects(Plane(Point(0,0,4),Vector(1,1,1)),cph))
+
+    def test_intersects_linear_pairs(self):
+        self.assertTrue(intersects(Segment(origin(),Point(2,2,0)),Segment(Point(0,2,0),Point(2,0,0))))
+        self.assertFalse(intersects(Segment(origin(),Point(2,2,0)),Segment(Point(0,2,1),Point(2,0,1))))
+        self.assertFalse(intersects(Segment(origin(),Point(1,1,0)),Segment(Point(0,4,0),Point(4,0,0))))
+        self.assertTrue(intersects(HalfLine(origin(),Point(1,1,0)),Segment(Point(0,4,0),Point(4,0,0))))
+        self.assertFalse(intersects(HalfLine(Point(1,0,0),x_unit_vector()),HalfLine(origin(),-x_unit_vector())))
+        self.assertTrue(intersects(HalfLine(origin(),x_unit_vector()),HalfLine(Point(1,0,0),-x_unit_vector())))
+        self.assertTrue(intersects(Segment(origin(),Point(1,0,0)),Segment(Point(1,0,0),Point(3,0,0))))
+        self.assertFalse(intersects(Segment(origin(),Point(1,0,0)),Segment(Point(1.1,0,0),Point(3,0,0))))
+        self.assertFalse(intersects(x_axis(),Line(Point(0,1,0),Point(1,1,0))))
+        self.assertTrue(intersects(x_axis(),Line(Point(2,1,0),Point(1,2,0))))
+        self.assertTrue(intersects(Point(0.5,0,0),Segment(origin(),Point(1,0,0))))
+        self.assertFalse(intersects(Point(0.5,0,0),HalfLine(Point(1,0,0),x_unit_vector())))
+
+    def test_intersects_agrees_with_intersection(self):
+        cpg = ConvexPolygon((origin(),Point(1,0,0),Point(0,1,0)))
+        cph = Parallelepiped(Point(-0.5,-0.5,-0.5),x_unit_vector(),y_unit_vector(),z_unit_vector())
+        bodies = [origin(),Point(3,3,3),x_axis(),xy_plane(),Segment(Point(0.2,0.2,-1),Point(0.2,0.2,1)),
+                  cpg,cph,HalfLine(Point(0,0,5),-z_unit_vector()),Segment(Point(-1,0,0),Point(2,0,0)),
+                  HalfLine(Point(0.2,0.2,0),Vector(1,1,0)),Line(Point(3,3,3),Point(0.2,0.2,2)),None]
+        for a in bodies:
+            for b in bodies:
+                self.assertEqual(intersects(a,b),intersection(a,b) is not None)
+
+class SeparatingAxisTest(unittest.TestCase):
+    def test_separating_axis_faces(self):
+        cph0 = Parallelepiped(origin(),x_unit_vector(),y_unit_vector(),z_unit_vector())
+        cph1 = Parallelepiped(Point(2,0,0),x_unit_vector(),y_unit_vector(),z_unit_vector())
+        self.assertEqual(separating_axis(cph0,cph1),x_unit_vector())
+        self.assertEqual(separating_axis(cph1,cph0),-x_unit_vector())
+        self.assertIsNone(separating_axis(cph0,Parallelepiped(Point(1,1,1),x_unit_vector(),y_unit_vector(),z_unit_vector())))
+        cpg = Parallelogram(Point(0.2,0.2,1.5),x_unit_vector(),y_unit_vector())
+        self.assertEqual(separating_axis(cph0,cpg),z_unit_vector())
+        self.assertEqual(separating_axis(cph0,cpg,edges=False),z_unit_vector())
+
+    def test_separating_axis_edges(self):
+        # two cubes standing on an edge, only the cross product of the edges separates them
+        cph0 = Parallelepiped(Point(0,-1,-1),Vector(1,1,0),Vector(-1,1,0),Vector(0,0,2))
+        cph1 = Parallelepiped(Point(1.1,-1,0),Vector(1,0,1),Vector(1,0,-1),Vector(0,2,0))
+        axis = separating_axis(cph0,cph1)
+        self.assertEqual(axis,x_unit_vector())
+        self.assertIsNone(separating_axis(cph0,cph1,edges=False))
+        self.assertFalse(intersects(cph0,cph1))
+        self.assertIsNone(intersection(cph0,cph1))
+        self.assertTrue(max(axis * Vector(p) for p in cph0.point_set) < min(axis * Vector(p) for p in cph1.point_set))
+
+    def test_separating_axis_spheres(self):
+        s0 = Sphere(origin(),1,n1=12,n2=4)
+        self.assertIsNone(separating_axis(s0,Sphere(Point(1,0.5,0.2),1,n1=12,n2=4)))
+        self.assertIsNotNone(separating_axis(s0,Sphere(Point(1.5,1.2,0.9),1,n1=12,n2=4)))
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+import logging
+import unittest
+from Geometry3D import *
+
+
+class CountingPoint(Point):
+    repr_calls = 0
+
+    def __repr__(self):
+        CountingPoint.repr_calls += 1
+        return Point.__repr__(self)
+
+
+class LoggerTest(unittest.TestCase):
+    def tearDown(self):
+        set_log_level('WARNING')
+
+    def test_module_logger_follows_log_level(self):
+        logger = get_logger('Geometry3D.calc.intersection')
+        set_log_level('WARNING')
+        self.assertFalse(logger.isEnabledFor(logging.DEBUG))
+        set_log_level('DEBUG')
+        self.assertTrue(logger.isEnabledFor(logging.DEBUG))
+        self.assertFalse(logger.disabled)
+
+    def test_no_formatting_when_disabled(self):
+        set_log_level('WARNING')
+        CountingPoint.repr_calls = 0
+        p = CountingPoint(1, 2, 3)
+        intersection(p, p)
+        self.assertEqual(CountingPoint.repr_calls, 0)
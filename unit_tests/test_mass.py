@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+import unittest
+try:
+    import numpy as np
+except ImportError:
+    np = None
+from Geometry3D import *
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class MassPropertiesTest(unittest.TestCase):
+    def test_mass_properties_box(self):
+        cph = Parallelepiped(Point(1, 2, 3), Vector(1, 0, 0), Vector(0, 2, 0), Vector(0, 0, 3))
+        properties = mass_properties(cph, density=2.0)
+        self.assertAlmostEqual(properties.volume, 6)
+        self.assertAlmostEqual(properties.mass, 12)
+        self.assertEqual(properties.centroid, Point(1.5, 3, 4.5))
+        # the inertia of a box is m / 12 * (b^2 + c^2) about the first axis
+        expected = [[13, 0, 0], [0, 10, 0], [0, 0, 5]]
+        for i in range(3):
+            for j in range(3):
+                self.assertAlmostEqual(properties.inertia[i][j], expected[i][j])
+
+    def test_mass_properties_rotated(self):
+        cph = Parallelepiped(origin(), Vector(1, 1, 0), Vector(-1, 1, 0), Vector(0, 0, 1))
+        inertia = mass_properties(cph).inertia
+        self.assertAlmostEqual(inertia[0][0], 0.5)
+        self.assertAlmostEqual(inertia[0][1], 0)
+        self.assertAlmostEqual(inertia[2][2], 2 / 3)
+        # the tetrahedron with the corner at the origin has the products of inertia -m / 20
+        tetrahedron = ConvexPolyhedron.from_points([origin(), Point(1, 0, 0), Point(0, 1, 0), Point(0, 0, 1)])
+        properties = mass_properties(tetrahedron)
+        self.assertAlmostEqual(properties.volume, 1 / 6)
+        self.assertEqual(properties.centroid, Point(0.25, 0.25, 0.25))
+        self.assertAlmostEqual(properties.inertia[0][1], 1 / 6 / 80)
+        self.assertAlmostEqual(properties.inertia[0][0], 1 / 6 * 3 / 40)
+
+    def test_mass_properties_many(self):
+        bodies = [Parallelepiped(Point(i, 0, 0), x_unit_vector(), y_unit_vector(), z_unit_vector()) for i in range(5)]
+        bodies.append(Sphere(origin(), 1))
+        result = mass_properties_many(bodies, density=[1, 1, 1, 1, 1, 3])
+        self.assertEqual(len(result), 6)
+        for i in range(5):
+            self.assertEqual(result[i].centroid, Point(i + 0.5, 0.5, 0.5))
+            self.assertAlmostEqual(result[i].inertia[1][1], 1 / 6)
+        self.assertAlmostEqual(result[5].volume, bodies[5].volume())
+        self.assertAlmostEqual(result[5].mass, 3 * bodies[5].volume())
+        self.assertEqual(result[5].centroid, origin())
+        self.assertEqual(mass_properties_many([]), [])
+        self.assertRaises(TypeError, mass_properties_many, [origin()])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+import copy
+import pickle
+import unittest
+from Geometry3D import *
+
+
+class PointTest(unittest.TestCase):
+    def test_point_from_floats(self):
+        p = Point.from_floats(1.0, 2.0, 3.0)
+        self.assertEqual(p, Point(1, 2, 3))
+        self.assertEqual(hash(p), hash(Point(1, 2, 3)))
+        self.assertEqual(tuple(p), (1.0, 2.0, 3.0))
+
+    def test_point_slots(self):
+        p = Point(1, 2, 3)
+        self.assertFalse(hasattr(p, '__dict__'))
+        self.assertEqual(copy.deepcopy(p), p)
+
+    def test_point_immutable(self):
+        p = Point(1, 2, 3)
+        self.assertEqual(p.translated(Vector(1, 1, 1)), Point(2, 3, 4))
+        with self.assertWarns(DeprecationWarning):
+            self.assertEqual(p.move(Vector(1, 1, 1)), Point(2, 3, 4))
+        self.assertEqual(p, Point(1, 2, 3))
+        with self.assertRaises(TypeError):
+            p[0] = 0
+        with self.assertRaises(TypeError):
+            p.x = 9
+        self.assertEqual(p, Point(1, 2, 3))
+        self.assertIs(copy.deepcopy(p), p)
+        self.assertEqual(pickle.loads(pickle.dumps(p)), p)
+
+    def test_point_pv(self):
+        self.assertEqual(Point(1, 2, 3).pv(), Vector(1, 2, 3))
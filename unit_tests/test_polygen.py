@@ -19,6 +19,14 @@ class ConvexPolygonTest(unittest.TestCase):
             math.sqrt(3)
         )
 
+    def test_polygon_centroid(self):
+        self.assertEqual(ConvexPolygon((a,b,c,d)).centroid(),Point(0.5,0.5,1))
+        cpg = ConvexPolygon((origin(),Point(2,0,0),Point(0,2,0)))
+        self.assertEqual(cpg.centroid(),Point(2/3,2/3,0))
+        cpg.move(Vector(0,0,1))
+        self.assertEqual(cpg.centroid(),Point(2/3,2/3,1))
+        self.assertAlmostEqual(cpg.area(),2)
+
     def test_polygon_in_plane(self):
         self.assertTrue(
             ConvexPolygon((a,b,c,d)) in Plane(origin(),Vector(1,1,-1))
@@ -44,8 +52,8 @@ class ConvexPolygonTest(unittest.TestCase):
             Segment(origin(),Point(1,1,2)) in ConvexPolygon((a,b,c,d))
         )
         self.assertFalse(
-            Segment(origin().move(Vector(0,0,1)),
-            Point(1,1,2).move(Vector(0,0,1))
+            Segment(origin().translated(Vector(0,0,1)),
+            Point(1,1,2).translated(Vector(0,0,1))
             ) in ConvexPolygon((a,b,c,d))
         )
 
@@ -76,8 +84,28 @@ class ConvexPolygonTest(unittest.TestCase):
     def test_polygon_move(self):
         v = Vector(1,2,3)
         cpg0 = ConvexPolygon((a,b,d,c))
-        cpg1 = ConvexPolygon((a.move(v),b.move(v),c.move(v),d.move(v)))
-        self.assertEqual(cpg0.move(v),cpg1)
+        cpg1 = ConvexPolygon((a.translated(v),b.translated(v),c.translated(v),d.translated(v)))
+        moved = cpg0.move(v)
+        self.assertEqual(moved,cpg1)
+        self.assertIsNot(moved,cpg0)
+
+    def test_polygon_from_trusted(self):
+        points = (origin(),Point(1,0,0),Point(1,1,0),Point(0,1,0))
+        cpg = ConvexPolygon.from_trusted(points)
+        self.assertEqual(cpg,ConvexPolygon(points))
+        self.assertIs(cpg.points[0],points[0])
+        self.assertEqual(cpg.plane.n,z_unit_vector())
+        self.assertIs(cpg.validate(),cpg)
+        self.assertEqual(ConvexPolygon.from_trusted(points[::-1]).plane.n,-z_unit_vector())
+        self.assertAlmostEqual(cpg.area(),1)
+        # the points are not sorted
+        self.assertRaises(ValueError,ConvexPolygon.from_trusted((origin(),Point(1,1,0),Point(1,0,0),Point(0,1,0)),Plane(origin(),z_unit_vector())).validate)
+        # a point is off the plane
+        self.assertRaises(ValueError,ConvexPolygon.from_trusted((origin(),Point(1,0,0),Point(1,1,1),Point(0,1,0)),Plane(origin(),z_unit_vector())).validate)
+        # the points go around twice
+        star = [Point(math.cos(k * 4 * math.pi / 5),math.sin(k * 4 * math.pi / 5),0) for k in range(5)]
+        self.assertRaises(ValueError,ConvexPolygon.from_trusted(star).validate)
+        self.assertRaises(ValueError,ConvexPolygon.from_trusted,(origin(),Point(1,0,0)))
 
     def test_polygon_Parallelogram(self):
         self.assertTrue(Parallelogram(origin(),Vector(1,0,0),Vector(2,0,1)) == (ConvexPolygon((origin(),Point(3,0,1),Point(1,0,0),Point(2,0,1)))))
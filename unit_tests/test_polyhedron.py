@@ -1,6 +1,10 @@
 # -*- coding: utf-8 -*-
 import math
 import unittest
+try:
+    import numpy as np
+except ImportError:
+    np = None
 from Geometry3D import *
 import Geometry3D
 import copy
@@ -63,6 +67,22 @@ class ConvexPolyhedronTest(unittest.TestCase):
         self.assertAlmostEqual(cph1.volume(),8/3)
         self.assertAlmostEqual(volume(cph1),8/3)
 
+    def test_polyhedron_centroid(self):
+        self.assertEqual(cph0.centroid(),origin())
+        cone = Cone(origin(),1,Vector(0,0,2),n=32)
+        self.assertEqual(cone.centroid(),Point(0,0,0.5))
+        cph = Parallelepiped(Point(1,2,3),Vector(1,0,0),Vector(0,2,0),Vector(0,0,3))
+        self.assertEqual(cph.centroid(),Point(1.5,3,4.5))
+        cph.move(Vector(1,1,1))
+        self.assertEqual(cph.centroid(),Point(2.5,4,5.5))
+        self.assertAlmostEqual(cph.volume(),6)
+        self.assertAlmostEqual(cph.area(),22)
+
+    def test_polyhedron_pyramid_set(self):
+        sphere = Sphere(origin(),1)
+        self.assertEqual(len(sphere.pyramid_set),len(sphere.convex_polygons))
+        self.assertAlmostEqual(sum(pyramid.volume() for pyramid in sphere.pyramid_set),sphere.volume())
+
     def test_polyhedron_hash(self):
         self.assertEqual(hash(cph0),hash(cph00))
         self.assertNotEqual(hash(cph0),hash(cph1))
@@ -71,11 +91,165 @@ class ConvexPolyhedronTest(unittest.TestCase):
         self.assertEqual(copy.deepcopy(cph0).move(Vector(0.5,0.5,0.5)),cph2)
         self.assertNotEqual(copy.deepcopy(cph0).move(Vector(0.1,0.2,0)),cph00)
 
+    def test_polyhedron_translated(self):
+        cph = Parallelepiped(origin(),x_unit_vector(),y_unit_vector(),z_unit_vector())
+        moved = cph.translated(Vector(1,0,0))
+        self.assertEqual(moved,Parallelepiped(Point(1,0,0),x_unit_vector(),y_unit_vector(),z_unit_vector()))
+        self.assertEqual(cph.aabb(),AABB((0,0,0),(1,1,1)))
+        self.assertEqual(moved.aabb(),AABB((1,0,0),(2,1,1)))
+        # the polygons are shared by the caller and the polyhedron without copying the points
+        cpg = Parallelogram(origin(),x_unit_vector(),y_unit_vector())
+        cph = ConvexPolyhedron((cpg,) + tuple(cph.convex_polygons[1:]))
+        cph.move(Vector(0,0,1))
+        self.assertEqual(cpg,Parallelogram(origin(),x_unit_vector(),y_unit_vector()))
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_polyhedron_indexed(self):
+        vertices,faces = cph0.to_indexed()
+        self.assertEqual(vertices.shape,(8,3))
+        self.assertEqual(len(faces),6)
+        cph = ConvexPolyhedron.from_indexed(vertices,faces)
+        self.assertEqual(cph,cph0)
+        self.assertEqual(len(set(id(point) for cpg in cph.convex_polygons for point in cpg.points)),8)
+        # the faces are turned to the outside
+        cph = ConvexPolyhedron.from_indexed(vertices + 0.5,[face[::-1] for face in faces])
+        self.assertEqual(cph,cph2)
+        self.assertIs(cph.validate(),cph)
+
+    def test_polyhedron_from_indexed(self):
+        self.assertEqual(ConvexPolyhedron.from_indexed([a,b,c,d,e,f,g,h],[(0,1,2,3),(4,5,6,7),(0,3,7,4),(1,2,6,5),(0,1,5,4),(3,2,6,7)]),cph0)
+        # the faces are checked for planarity and convexity
+        vertices = [(0,0,0),(1,0,0),(1,1,0),(0,1,0),(0,0,1),(1,0,1),(1,1,1.5),(0,1,1)]
+        faces = [(0,3,2,1),(4,5,6,7),(0,1,5,4),(1,2,6,5),(2,3,7,6),(3,0,4,7)]
+        self.assertRaises(ValueError,ConvexPolyhedron.from_indexed,vertices,faces)
+        vertices[6] = (1,1,1)
+        self.assertAlmostEqual(ConvexPolyhedron.from_indexed(vertices,faces).volume(),1)
+        faces[0] = (0,2,3,1)
+        self.assertRaises(ValueError,ConvexPolyhedron.from_indexed,vertices,faces)
+
+    def test_polyhedron_support(self):
+        sphere = Sphere(origin(),1,n1=16,n2=5)
+        points = list(sphere.point_set)
+        for direction in (x_unit_vector(),Vector(1,2,3),Vector(-1,0.5,-2),-z_unit_vector(),Vector(0.3,-1,0)):
+            farthest = max(point.pv() * direction for point in points)
+            self.assertAlmostEqual(sphere.support(direction).pv() * direction,farthest)
+            self.assertAlmostEqual(sphere.support(direction,hint=0).pv() * direction,farthest)
+        self.assertEqual(cph0.support((1,1,1)),a)
+        self.assertEqual(cph0.support(Vector(-1,-1,-1)),g)
+        cph = copy.deepcopy(cph2)
+        self.assertEqual(cph.support(Vector(1,-1,1)),d1)
+        # the previous answer is kept when self is moved
+        cph.move(Vector(1,0,0))
+        self.assertEqual(cph.support(Vector(1,-1,1)),Point(2.5,-0.5,1.5))
+        self.assertRaises(ValueError,cph.support,Vector(1,0,0),8)
+        self.assertRaises(ValueError,cph.support,Vector(1,0,0),-1)
+        # the hint is kept per polyhedron
+        self.assertNotIn('_support_hint',ConvexPolyhedron.__dict__)
+        self.assertEqual(ConvexPolyhedron.from_trusted(cph.convex_polygons)._support_hint,0)
+
+    def test_polyhedron_cache(self):
+        cph = Parallelepiped(origin(),x_unit_vector(),y_unit_vector(),z_unit_vector())
+        halfspaces = cph.halfspaces()
+        self.assertEqual(cph.center_point,Point(0.5,0.5,0.5))
+        self.assertEqual(len(cph.point_set),8)
+        moved = cph.move(Vector(1,0,0))
+        self.assertIsNot(moved,cph)
+        self.assertEqual(moved,cph)
+        self.assertIsNot(cph.halfspaces(),halfspaces)
+        self.assertEqual(cph.center_point,Point(1.5,0.5,0.5))
+        self.assertIn(Point(2,1,1),cph.point_set)
+        self.assertEqual(cph.aabb(),AABB((1,0,0),(2,1,1)))
+        self.assertEqual(cph.centroid(),Point(1.5,0.5,0.5))
+        self.assertTrue(Point(1.9,0.5,0.5) in cph)
+        self.assertFalse(Point(0.5,0.5,0.5) in cph)
+        # the returned body is not an alias of self
+        moved.move(Vector(5,0,0))
+        self.assertEqual(cph.aabb(),AABB((1,0,0),(2,1,1)))
+
+    def test_polyhedron_copy_cache(self):
+        cph = Parallelepiped(origin(),x_unit_vector(),y_unit_vector(),z_unit_vector())
+        self.assertIn(Point(1,1,1),cph.point_set)
+        cph_copy = copy.copy(cph)
+        cph_copy.move(Vector(5,0,0))
+        self.assertIn(Point(6,1,1),cph_copy.point_set)
+        cph.move(Vector(0,0.5,0))
+        self.assertIn(Point(1,1.5,1),cph.point_set)
+        self.assertNotIn(Point(6,1,1),cph.point_set)
+        self.assertEqual(intersection(cph,Point(0.5,1.2,0.5)),Point(0.5,1.2,0.5))
+
     def test_polyhedron_contains(self):
         self.assertTrue(origin() in cph00)
         self.assertTrue(a in cph00)
         self.assertFalse(g in cph2)
     
+    def test_polyhedron_halfspaces(self):
+        halfspaces = cph0.halfspaces()
+        self.assertEqual(len(halfspaces),6)
+        self.assertIs(halfspaces,cph0.halfspaces())
+        for n,offset in halfspaces:
+            self.assertAlmostEqual(offset,1)
+            self.assertAlmostEqual(sum(x * x for x in n),1)
+        cph = copy.deepcopy(cph0)
+        cph.halfspaces()
+        cph.move(Vector(1,0,0))
+        self.assertIn(((1.0,0.0,0.0),2.0),cph.halfspaces())
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_polyhedron_contains_points(self):
+        points = [origin(),a,g,Point(1.5,0,0),Point(0,0,-1.1),Point(0.5,0.5,0.5)]
+        inside = cph2.contains_points(points)
+        self.assertEqual(inside.tolist(),[point in cph2 for point in points])
+        self.assertEqual(inside.tolist(),[True,True,False,True,False,True])
+        self.assertEqual(cph2.contains_points(PointArray.from_points(points)).tolist(),inside.tolist())
+        self.assertEqual(cph1.contains_points([[0,0,0],[1,1,1]],chunk_size=1).tolist(),[True,False])
+        self.assertEqual(cph0.plane_matrix().shape,(6,4))
+        self.assertEqual(len(cph0.contains_points([])),0)
+
+    def test_polyhedron_from_halfspaces(self):
+        planes = [
+            Plane(Point(1,0,0),x_unit_vector()),Plane(Point(-1,0,0),-x_unit_vector()),
+            Plane(Point(0,1,0),y_unit_vector()),Plane(Point(0,-1,0),-y_unit_vector()),
+            Plane(Point(0,0,1),z_unit_vector()),Plane(Point(0,0,-1),-z_unit_vector()),
+        ]
+        self.assertEqual(ConvexPolyhedron.from_halfspaces(planes),cph0)
+        # a redundant plane is dropped
+        self.assertEqual(ConvexPolyhedron.from_halfspaces(planes + [Plane(Point(2,2,2),Vector(1,1,1))]),cph0)
+        cut = ConvexPolyhedron.from_halfspaces(planes + [Plane(Point(1,1,0),Vector(1,1,1))])
+        self.assertEqual(len(cut.convex_polygons),7)
+        self.assertAlmostEqual(cut.volume(),8 - 1 / 6)
+        sphere = Sphere(Point(1,2,3),2)
+        self.assertEqual(ConvexPolyhedron.from_halfspaces([cpg.plane for cpg in sphere.convex_polygons]),sphere)
+        self.assertRaises(ValueError,ConvexPolyhedron.from_halfspaces,planes[:5])
+        self.assertRaises(ValueError,ConvexPolyhedron.from_halfspaces,planes[:5] + [Plane(Point(0,0,2),-z_unit_vector())])
+        self.assertRaises(ValueError,ConvexPolyhedron.from_halfspaces,planes[:5] + [Plane(Point(0,0,1),-z_unit_vector())])
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_polyhedron_from_points(self):
+        corners = [a,b,c,d,e,f,g,h]
+        inner = [origin(),Point(0.5,-0.2,0.1),Point(1,0,0),Point(1,1,0)]
+        self.assertEqual(ConvexPolyhedron.from_points(corners + inner),cph0)
+        self.assertEqual(len(ConvexPolyhedron.from_points(corners).convex_polygons),6)
+        grid = [[x,y,z] for x in range(4) for y in range(4) for z in range(4)]
+        self.assertEqual(ConvexPolyhedron.from_points(grid),Parallelepiped(origin(),3 * x_unit_vector(),3 * y_unit_vector(),3 * z_unit_vector()))
+        self.assertEqual(ConvexPolyhedron.from_points(PointArray(grid)),ConvexPolyhedron.from_points(grid))
+        tetrahedron = ConvexPolyhedron.from_points([origin(),Point(1,0,0),Point(0,1,0),Point(0,0,1),Point(0.1,0.1,0.1)])
+        self.assertAlmostEqual(tetrahedron.volume(),1 / 6)
+        self.assertRaises(ValueError,ConvexPolyhedron.from_points,[a,b,c])
+        self.assertRaises(ValueError,ConvexPolyhedron.from_points,[a,b,c,d])
+        self.assertRaises(ValueError,ConvexPolyhedron.from_points,[a,a,a,a])
+
+    def test_polyhedron_from_trusted(self):
+        cph = ConvexPolyhedron.from_trusted(cph0.convex_polygons)
+        self.assertEqual(cph,cph0)
+        self.assertIs(cph.convex_polygons[0],cph0.convex_polygons[0])
+        self.assertIs(cph.validate(),cph)
+        self.assertAlmostEqual(cph.volume(),8)
+        flipped = [-cph0.convex_polygons[0]] + list(cph0.convex_polygons[1:])
+        self.assertRaises(ValueError,ConvexPolyhedron.from_trusted(flipped).validate)
+        self.assertRaises(ValueError,ConvexPolyhedron.from_trusted(cph0.convex_polygons[1:]).validate)
+        self.assertIs(Parallelepiped(origin(),x_unit_vector(),y_unit_vector(),z_unit_vector()).validate().__class__,ConvexPolyhedron)
+        ConvexPolyhedron.from_halfspaces([cpg.plane for cpg in Sphere(origin(),1).convex_polygons]).validate()
+
     def test_polyhedron_parallelpiped(self):
         cph = Parallelepiped(Point(-1,-1,-1),Vector(2,0,0),Vector(0,2,0),Vector(0,0,2))
         self.assertAlmostEqual(cph.volume(),8)
@@ -46,3 +46,13 @@ class SegmentTest(unittest.TestCase):
             Segment(origin(),Point(2,3,1)).move(Vector(1,2,3)),
             Segment(Point(1,2,3),Vector(2,3,1))
         )
+
+    def test_segment_translated(self):
+        p = Point(2,3,1)
+        s = Segment(origin(),p)
+        self.assertIs(s.end_point,p)
+        self.assertEqual(s.translated(Vector(1,2,3)),Segment(Point(1,2,3),Point(3,5,4)))
+        self.assertEqual(s,Segment(origin(),p))
+        s.move(Vector(1,2,3))
+        self.assertEqual(p,Point(2,3,1))
+        self.assertTrue(Point(3,5,4) in s)
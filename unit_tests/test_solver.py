@@ -1,6 +1,11 @@
 # -*- coding: utf-8 -*-
 import unittest
-from Geometry3D import solve
+from Geometry3D import solve, solve_batch
+try:
+    import numpy as np
+except ImportError:
+    np = None
+from Geometry3D.utils.solver import line_line_parameters, solve_line_line, general_form_point, orthogonal_vectors
 
 
 class SolverTest(unittest.TestCase):
@@ -48,3 +53,66 @@ class SolverTest(unittest.TestCase):
         solution = solve(m)
         s = solution()
         self.assertEqual(s, (2, 2))
+
+    def test_line_line_parameters(self):
+        self.assertEqual(line_line_parameters((0, 0, 0), (1, 0, 0), (2, -1, 1), (0, 1, 0)), (2, 1))
+        self.assertIsNone(line_line_parameters((0, 0, 0), (1, 0, 0), (0, 1, 0), (2, 0, 0)))
+
+    def test_solve_line_line(self):
+        self.assertEqual(solve_line_line((0, 0, 0), (1, 0, 0), (2, -1, 0), (0, 1, 0)), 2)
+        self.assertIsNone(solve_line_line((0, 0, 0), (1, 0, 0), (2, -1, 1), (0, 1, 0)))
+        self.assertIsNone(solve_line_line((0, 0, 0), (1, 0, 0), (0, 1, 0), (1, 0, 0)))
+
+    def test_general_form_point(self):
+        x, y, z = general_form_point(1, 2, 3, 4)
+        self.assertAlmostEqual(x + 2 * y + 3 * z, 4)
+        self.assertRaises(ValueError, general_form_point, 0, 0, 0, 1)
+
+    def test_orthogonal_vectors(self):
+        n = (1, 2, 3)
+        v, w = orthogonal_vectors(n)
+        dot = lambda a, b: sum(x * y for x, y in zip(a, b))
+        self.assertAlmostEqual(dot(n, v), 0)
+        self.assertAlmostEqual(dot(n, w), 0)
+        self.assertAlmostEqual(dot(v, w), 0)
+        self.assertGreater(dot(v, v), 0)
+        self.assertGreater(dot(w, w), 0)
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class BatchSolverTest(unittest.TestCase):
+    def test_solve_batch_flags(self):
+        systems = [
+            [[2, 4, 6], [2, 4, 7]],
+            [[2, 2, 8], [2, -2, 0]],
+            [[2, 2, 8], [1, 1, 4]],
+        ]
+        batch = solve_batch(systems)
+        for i, m in enumerate(systems):
+            solution = solve([list(row) for row in m])
+            self.assertEqual(bool(batch.solvable[i]), bool(solution))
+            self.assertEqual(int(batch.varargs[i]), solution.varargs)
+            if solution:
+                self.assertEqual(bool(batch.exact[i]), solution.exact)
+
+    def test_solve_batch_values(self):
+        batch = solve_batch(np.array([
+            [[2, 2, 8], [2, -2, 0]],
+            [[0, 1, 3], [1, 0, -1]],
+            [[2, 2, 8], [1, 1, 4]],
+        ]))
+        self.assertEqual(batch[0], (2, 2))
+        self.assertEqual(batch[1], (-1, 3))
+        self.assertRaises(ValueError, batch.__getitem__, 2)
+        self.assertTrue(np.isnan(batch.values[2]).all())
+
+    def test_solve_batch_line_line(self):
+        # one line against many lines, the systems of inter_line_line
+        systems = [
+            [[1, -u[0], s[0]], [0, -u[1], s[1]], [0, -u[2], s[2]]]
+            for s, u in (((2, -1, 0), (0, 1, 0)), ((2, -1, 1), (0, 1, 0)), ((0, 1, 0), (1, 0, 0)))
+        ]
+        batch = solve_batch(systems)
+        self.assertEqual(batch.exact.tolist(), [True, False, False])
+        self.assertEqual(batch.solvable.tolist(), [True, False, False])
+        self.assertEqual(batch[0], (2, 1))
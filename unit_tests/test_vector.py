@@ -94,3 +94,9 @@ class VectorTest(unittest.TestCase):
 
     def test_vector_normalization(self):
         self.assertAlmostEqual(abs(Vector(1, 1, 1).normalized()), 1)
+
+    def test_vector_from_floats(self):
+        v = Vector.from_floats(1.0, 2.0, 3.0)
+        self.assertEqual(v, Vector(1, 2, 3))
+        self.assertEqual(list(v), [1.0, 2.0, 3.0])
+        self.assertFalse(hasattr(v, '__dict__'))